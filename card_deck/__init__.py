@@ -9,19 +9,92 @@ of cards, including ranks, suits, and card representations.
 
 Classes:
     Card: Represents a playing card with a specific rank and suit.
+    CardSet: An immutable set of cards backed by a 64-bit mask with constant-time set algebra.
+    Deck: An array-backed deck or multi-deck shoe with in-place shuffling and cursor-based draws.
+    InternedCard: A canonical, shared card; one instance exists per rank and suit.
     Rank: Enum class to define the ranks (Ace to King) of playing cards.
     Suit: Enum class to define the suits (Clubs, Diamonds, Hearts, Spades) of playing cards.
 
+Functions:
+    parse_many: Parse a whitespace- or comma-separated hand of card strings.
+    format_many: Format cards as a separated string.
+
 Usage:
     Import this module to use the card system for card manipulation and functionality.
+
+Lazy loading:
+    Importing the package loads no submodule. Each public name and submodule (``card_deck.eval``,
+    ``card_deck.batch``, ...) is imported on first access through the module `__getattr__`, so short-lived
+    processes only pay for what they use.
 """
 
-from .card import Card
-from .card import Rank
-from .card import Suite
+import importlib
+
+TYPE_CHECKING = False  # typing.TYPE_CHECKING without importing typing; type checkers treat it as True.
+if TYPE_CHECKING:
+    from .card import Card
+    from .card import InternedCard
+    from .card import Rank
+    from .card import Suite
+    from .card import format_many
+    from .card import parse_many
+    from .cardset import CardSet
+    from .deck import Deck
 
 __all__ = [
     "Card",
+    "CardSet",
+    "Deck",
+    "InternedCard",
     "Rank",
-    "Suite"
+    "Suite",
+    "format_many",
+    "parse_many",
 ]
+
+# The submodule defining each public name; a name is imported on first access.
+_EXPORTS = {
+    "Card": "card",
+    "CardSet": "cardset",
+    "Deck": "deck",
+    "InternedCard": "card",
+    "Rank": "card",
+    "Suite": "card",
+    "format_many": "card",
+    "parse_many": "card",
+}
+_SUBMODULES = frozenset({
+    "batch", "cache", "card", "cardset", "combinatorics", "dealer", "deck", "eval", "exceptions", "isomorphism",
+    "metrics", "ordering", "pool", "rng", "serialize", "shared", "shoe", "simulate", "store", "trace", "validate",
+})
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name or submodule of the package on first access.
+
+    Args:
+        name (str): The attribute name.
+
+    Returns:
+        object: The class, function or submodule.
+
+    Raises:
+        AttributeError: If the package has no such attribute.
+    """
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including those not imported yet.
+
+    Returns:
+        list[str]: The attribute names.
+    """
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -0,0 +1,191 @@
+"""See Description below.
+
+Module Name: batch.py
+
+Description:
+This module provides a NumPy-vectorized engine for working with many decks at once, as needed by
+Monte Carlo workloads. A batch of N decks is an ``(N, 52 * decks)`` ``uint8`` array of canonical card
+encodings (see `card_deck.card`), one deck or shoe per row. Batches are shuffled and dealt with whole-array
+operations, and rows are converted back to `InternedCard` objects only on demand.
+
+NumPy is an optional dependency; install it with the ``numpy`` extra (``pip install card_deck[numpy]``).
+
+Functions:
+    - new_decks: Create a batch of ordered decks.
+    - shuffle: Shuffle every deck of a batch in place, independently.
+    - shuffled_decks: Create a batch of independently shuffled decks.
+    - deal: Deal hands round-robin from every deck of a batch.
+    - to_cards: Convert encoded cards to `InternedCard` objects.
+    - from_cards: Convert cards to an encoded array.
+
+Usage:
+Create a batch with `shuffled_decks()`, `deal()` hands from it, and call `to_cards()` on the rows you
+need to inspect.
+"""
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from card_deck import metrics
+from card_deck.card import CARD_COUNT
+from card_deck.card import Card
+from card_deck.card import InternedCard
+from card_deck.exceptions import EmptyDeck
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidDeck
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as error:  # pragma: no cover - exercised only without NumPy
+    raise ImportError("card_deck.batch requires NumPy, install it with 'pip install card_deck[numpy]'") from error
+
+_CARD_TABLE = np.array([InternedCard.from_int(code) for code in range(CARD_COUNT)], dtype=object)
+
+SeedLike = int | np.random.Generator | None
+
+
+def _generator(rng: SeedLike) -> np.random.Generator:
+    """Return a NumPy random generator for a seed or an existing generator.
+
+    Args:
+        rng (SeedLike): A seed, a generator, or None for fresh OS entropy.
+
+    Returns:
+        np.random.Generator: The generator to draw from.
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+
+def _check_batch(batch: npt.NDArray[np.uint8]) -> None:
+    """Validate that an array is a batch of encoded decks.
+
+    Args:
+        batch (npt.NDArray[np.uint8]): The array to check.
+
+    Raises:
+        InvalidDeck: If the array is not a two-dimensional ``uint8`` array.
+    """
+    if not isinstance(batch, np.ndarray) or batch.dtype != np.uint8 or batch.ndim != 2:
+        raise InvalidDeck("A deck batch must be a two-dimensional uint8 array")
+
+
+def new_decks(count: int, decks: int = 1) -> npt.NDArray[np.uint8]:
+    """Create a batch of ordered decks or shoes.
+
+    Args:
+        count (int): The number of decks (rows) in the batch.
+        decks (int): The number of standard 52-card decks in each row.
+
+    Returns:
+        npt.NDArray[np.uint8]: An array of shape ``(count, 52 * decks)``.
+
+    Raises:
+        InvalidDeck: If `count` is negative or `decks` is not positive.
+    """
+    if count < 0 or decks < 1:
+        raise InvalidDeck(f"Invalid deck batch of {count} row(s) with {decks} deck(s)")
+    row = np.tile(np.arange(CARD_COUNT, dtype=np.uint8), decks)
+    return np.tile(row, (count, 1))
+
+
+def shuffle(batch: npt.NDArray[np.uint8], rng: SeedLike = None) -> None:
+    """Shuffle every row of a batch in place with an independent permutation.
+
+    Args:
+        batch (npt.NDArray[np.uint8]): The batch of decks to shuffle.
+        rng (SeedLike): A seed or generator; None draws fresh OS entropy.
+
+    Returns:
+        None
+
+    Raises:
+        InvalidDeck: If `batch` is not a batch of encoded decks.
+    """
+    _check_batch(batch)
+    start = time.perf_counter_ns() if metrics.ENABLED else 0
+    _generator(rng).permuted(batch, axis=1, out=batch)
+    if metrics.ENABLED:
+        metrics.SHUFFLES.inc(batch.shape[0])
+        metrics.SHUFFLE_SECONDS.record(time.perf_counter_ns() - start)
+
+
+def shuffled_decks(count: int, decks: int = 1, rng: SeedLike = None) -> npt.NDArray[np.uint8]:
+    """Create a batch of independently shuffled decks or shoes.
+
+    Args:
+        count (int): The number of decks (rows) in the batch.
+        decks (int): The number of standard 52-card decks in each row.
+        rng (SeedLike): A seed or generator; None draws fresh OS entropy.
+
+    Returns:
+        npt.NDArray[np.uint8]: A shuffled array of shape ``(count, 52 * decks)``.
+    """
+    batch = new_decks(count, decks)
+    shuffle(batch, rng)
+    return batch
+
+
+def deal(
+    batch: npt.NDArray[np.uint8], players: int, cards: int, start: int = 0
+) -> tuple[npt.NDArray[np.uint8], int]:
+    """Deal hands round-robin from the same position of every deck in a batch.
+
+    Card ``start + i`` of a row goes to player ``i % players``, as a dealer would deal at a table.
+
+    Args:
+        batch (npt.NDArray[np.uint8]): The batch of decks to deal from.
+        players (int): The number of hands to deal per deck.
+        cards (int): The number of cards in each hand.
+        start (int): The position of the first card to deal.
+
+    Returns:
+        tuple[npt.NDArray[np.uint8], int]: A view of shape ``(N, players, cards)`` holding the hands,
+            and the position of the next undealt card.
+
+    Raises:
+        InvalidDeck: If `batch` is not a batch of encoded decks.
+        EmptyDeck: If the decks hold fewer than ``players * cards`` cards after `start`.
+    """
+    _check_batch(batch)
+    stop = start + players * cards
+    if players < 0 or cards < 0 or start < 0 or stop > batch.shape[1]:
+        raise EmptyDeck(f"Cannot deal {players}x{cards} card(s) from position {start} of {batch.shape[1]}")
+    hands = batch[:, start:stop].reshape(batch.shape[0], cards, players).transpose(0, 2, 1)
+    if metrics.ENABLED:
+        metrics.DEALS.inc(batch.shape[0])
+        metrics.CARDS_DEALT.inc(batch.shape[0] * players * cards)
+    return hands, stop
+
+
+def to_cards(codes: npt.ArrayLike) -> Any:
+    """Convert encoded cards to `InternedCard` objects, keeping the array's nesting.
+
+    Args:
+        codes (npt.ArrayLike): Card encodings of any shape.
+
+    Returns:
+        Any: A card for a scalar, otherwise nested lists of cards with the same shape as `codes`.
+
+    Raises:
+        InvalidCard: If any encoding is outside the range 0..51.
+    """
+    indexes = np.asarray(codes, dtype=np.intp)
+    if indexes.size and (indexes.min() < 0 or indexes.max() >= CARD_COUNT):
+        raise InvalidCard("Card encodings must be in the range 0..51")
+    cards = _CARD_TABLE[indexes]
+    return cards.tolist() if isinstance(cards, np.ndarray) else cards
+
+
+def from_cards(cards: Iterable[Card]) -> npt.NDArray[np.uint8]:
+    """Convert cards to a one-dimensional array of encodings.
+
+    Args:
+        cards (Iterable[Card]): The cards to encode.
+
+    Returns:
+        npt.NDArray[np.uint8]: The card encodings.
+    """
+    return np.fromiter((card.to_int() for card in cards), dtype=np.uint8)
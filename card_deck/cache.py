@@ -0,0 +1,405 @@
+"""See Description below.
+
+Module Name: cache.py
+
+Description:
+This module memoizes equity and evaluation results. A `ResultCache` keeps recent results in an in-memory LRU
+bounded by a number of entries, with an optional time to live, and can write every result through to a sqlite
+database so results survive restarts. Memory misses fall back to the database and promote what they find.
+Hits, misses, LRU evictions, expirations and database hits are counted and exposed through `stats()`.
+
+Cache keys are bytes built from the compact card encodings of the inputs by `cards_key()`. Each card takes one
+byte and a `CardSet` takes its 8-byte mask, so a heads-up equity request on the flop keys on a few dozen bytes
+rather than a pickled list of `Card` objects. The `memoize` decorator prefixes the key with the function's
+qualified name, so one cache can serve several functions. A custom key function can be passed instead, e.g. to
+key on the suit-isomorphic form from `card_deck.isomorphism`.
+
+Values are stored in the database with `pickle`, so only open databases written by a trusted process.
+
+Classes:
+    - CacheStats: A snapshot of the cache counters.
+    - ResultCache: An LRU cache with TTL and an optional sqlite tier.
+
+Functions:
+    - cards_key: Encode call arguments holding cards as a compact cache key.
+    - memoize: Decorate a function to cache its results in a `ResultCache`.
+
+Usage:
+Cache equity results across requests and restarts::
+
+    cache = ResultCache(100_000, ttl=3600, path="equity.sqlite")
+    cached_equity = memoize(cache)(equity)
+    result = cached_equity([hero, villain], board=flop, trials=100_000, seed=7)
+"""
+import functools
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from os import PathLike
+from types import TracebackType
+from typing import Any
+from typing import NamedTuple
+from typing import ParamSpec
+from typing import Self
+from typing import TypeVar
+
+from card_deck import trace
+from card_deck.card import CARD_COUNT
+from card_deck.card import Card
+from card_deck.cardset import CardSet
+from card_deck.exceptions import CardDeckTypeError
+from card_deck.exceptions import CardDeckValueError
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+DEFAULT_MAXSIZE = 65_536
+MASK_BYTES = 8
+LENGTH_BYTES = 4
+
+_MISSING = object()
+_SCHEMA = "CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, value BLOB NOT NULL, expires REAL)"
+
+
+class CacheStats(NamedTuple):
+    """A snapshot of the counters of a `ResultCache`.
+
+    Attributes:
+        hits (int): The lookups answered from memory or disk.
+        misses (int): The lookups that found nothing.
+        hit_rate (float): The fraction of lookups that were hits; 0.0 before the first lookup.
+        disk_hits (int): The hits answered from the database after missing in memory.
+        evictions (int): The entries dropped from memory to stay within the size limit.
+        expirations (int): The entries dropped because their time to live had passed.
+        size (int): The number of entries in memory now.
+    """
+    hits: int
+    misses: int
+    hit_rate: float
+    disk_hits: int
+    evictions: int
+    expirations: int
+    size: int
+
+
+class ResultCache:  # pylint: disable=too-many-instance-attributes
+    """An in-memory LRU cache with an optional time to live and an optional sqlite tier.
+
+    A cache can be shared between threads; a lock guards the entries, the counters and the database connection.
+
+    Attributes:
+        _maxsize (int): The most entries kept in memory.
+        _ttl (float | None): The seconds an entry stays valid after it is stored, None for no limit.
+        _clock (Callable[[], float]): The wall clock giving the current time in seconds.
+        _entries (OrderedDict[bytes, tuple[Any, float | None]]): The value and expiry time of each key, least
+            recently used first.
+        _database (sqlite3.Connection | None): The connection to the disk tier.
+        _lock (threading.Lock): Guards the cache state.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        *,
+        ttl: float | None = None,
+        path: str | PathLike[str] | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize a ResultCache, opening or creating its database.
+
+        Args:
+            maxsize (int): The most entries kept in memory.
+            ttl (float | None): The seconds an entry stays valid after it is stored, None for no limit.
+            path (str | PathLike[str] | None): The sqlite database of the disk tier, None to keep results in memory
+                only.
+            clock (Callable[[], float]): The wall clock used for expiry; stored expiry times must survive restarts.
+
+        Raises:
+            CardDeckValueError: If `maxsize` or `ttl` is not positive.
+        """
+        if maxsize < 1:
+            raise CardDeckValueError(f"Invalid cache size: {maxsize}")
+        if ttl is not None and ttl <= 0:
+            raise CardDeckValueError(f"Invalid cache time to live: {ttl}")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._disk_hits = self._evictions = self._expirations = 0
+        self._database: sqlite3.Connection | None = None
+        if path is not None:
+            self._database = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            self._database.execute("PRAGMA journal_mode=WAL")
+            self._database.execute("PRAGMA synchronous=NORMAL")
+            self._database.execute(_SCHEMA)
+
+    def __len__(self) -> int:
+        """Return the number of entries in memory.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
+
+    @property
+    def maxsize(self) -> int:
+        """Get the most entries kept in memory.
+
+        Returns:
+            int: The size limit.
+        """
+        return self._maxsize
+
+    def _store(self, key: bytes, value: Any, expires: float | None) -> None:
+        """Put an entry in memory, evicting the least recently used entries; the lock must be held.
+
+        Args:
+            key (bytes): The cache key.
+            value (Any): The value.
+            expires (float | None): The expiry time, None for no limit.
+
+        Returns:
+            None
+        """
+        self._entries[key] = (value, expires)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def get(self, key: bytes, default: Any = None) -> Any:
+        """Look up a result, in memory first and then on disk.
+
+        Args:
+            key (bytes): The cache key.
+            default (Any): The value returned on a miss.
+
+        Returns:
+            Any: The cached value, or `default`.
+        """
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] is None or entry[1] > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[0]
+                del self._entries[key]
+            if self._database is not None:
+                row = self._database.execute("SELECT value, expires FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None and (row[1] is None or row[1] > now):
+                    value = pickle.loads(row[0])
+                    self._store(key, value, row[1])
+                    self._hits += 1
+                    self._disk_hits += 1
+                    return value
+                if row is not None:
+                    self._database.execute("DELETE FROM results WHERE key = ?", (key,))
+                    entry = row
+            if entry is not None:
+                self._expirations += 1
+            self._misses += 1
+            return default
+
+    def set(self, key: bytes, value: Any) -> None:
+        """Store a result in memory and, with a disk tier, in the database.
+
+        Args:
+            key (bytes): The cache key.
+            value (Any): The value; it must be picklable when the cache has a disk tier.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            expires = None if self._ttl is None else self._clock() + self._ttl
+            self._store(key, value, expires)
+            if self._database is not None:
+                self._database.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                    (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), expires),
+                )
+
+    def purge(self) -> int:
+        """Delete every expired entry from memory and disk.
+
+        Returns:
+            int: The number of entries deleted.
+        """
+        with self._lock:
+            now = self._clock()
+            expired = [key for key, (_, expires) in self._entries.items() if expires is not None and expires <= now]
+            for key in expired:
+                del self._entries[key]
+            purged = len(expired)
+            if self._database is not None:
+                purged += self._database.execute("DELETE FROM results WHERE expires <= ?", (now,)).rowcount
+            self._expirations += purged
+        if trace.ENABLED:
+            trace.emit(__name__, "cache.purge", purged=purged)
+        return purged
+
+    def clear(self) -> None:
+        """Delete every entry from memory and disk; the counters are kept.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.clear()
+            if self._database is not None:
+                self._database.execute("DELETE FROM results")
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters.
+
+        Returns:
+            CacheStats: The counters.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            hit_rate = self._hits / lookups if lookups else 0.0
+            return CacheStats(self._hits, self._misses, hit_rate, self._disk_hits, self._evictions, self._expirations,
+                              len(self._entries))
+
+    def close(self) -> None:
+        """Close the database; the in-memory entries stay usable.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._database is not None:
+                self._database.close()
+                self._database = None
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the cache on exit.
+
+        Returns:
+            Self: This cache.
+        """
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Close the cache.
+
+        Args:
+            exc_type (type[BaseException] | None): The exception type, if one was raised.
+            exc (BaseException | None): The exception, if one was raised.
+            traceback (TracebackType | None): The exception traceback, if one was raised.
+
+        Returns:
+            None
+        """
+        self.close()
+
+
+def _encode(value: object, key: bytearray) -> None:
+    """Append the tagged encoding of one argument to a key.
+
+    Args:
+        value (object): The argument.
+        key (bytearray): The key being built.
+
+    Raises:
+        CardDeckTypeError: If the argument cannot be encoded deterministically.
+    """
+    if isinstance(value, Card):
+        key += b"c"
+        key.append(value.to_int())
+    elif isinstance(value, CardSet):
+        key += b"s"
+        key += value.mask.to_bytes(MASK_BYTES, "little")
+    elif isinstance(value, (list, tuple)):
+        codes = [item.to_int() if isinstance(item, Card) else item for item in value]
+        if all(isinstance(code, int) and 0 <= code < CARD_COUNT for code in codes):
+            # A hand of cards or card encodings: its length and one byte per card.
+            key += b"h"
+            key += len(codes).to_bytes(LENGTH_BYTES, "little")
+            key += bytes(codes)
+        else:
+            key += b"("
+            for item in value:
+                _encode(item, key)
+            key += b")"
+    elif value is None or isinstance(value, (bool, int, float, str)):
+        text = repr(value).encode()
+        key += b"r"
+        key += len(text).to_bytes(LENGTH_BYTES, "little")
+        key += text
+    elif isinstance(value, bytes):
+        key += b"b"
+        key += len(value).to_bytes(LENGTH_BYTES, "little")
+        key += value
+    else:
+        raise CardDeckTypeError(f"Cannot build a cache key from {type(value).__name__} values")
+
+
+def cards_key(*args: object, **kwargs: object) -> bytes:
+    """Encode call arguments holding cards as a compact cache key.
+
+    Cards take one byte, lists and tuples of cards or card encodings take one byte per card plus a length, and
+    a `CardSet` takes its mask. Numbers, strings, bytes and None are encoded by value, and other lists and tuples
+    element by element. Keyword arguments are encoded in name order.
+
+    Args:
+        *args (object): The positional arguments.
+        **kwargs (object): The keyword arguments.
+
+    Returns:
+        bytes: The key.
+
+    Raises:
+        CardDeckTypeError: If an argument is of another type, such as a callable or a generator.
+    """
+    key = bytearray()
+    for value in args:
+        _encode(value, key)
+    for name in sorted(kwargs):
+        key += b"k"
+        key += name.encode()
+        key += b"="
+        _encode(kwargs[name], key)
+    return bytes(key)
+
+
+def memoize(
+    cache: ResultCache, *, key: Callable[..., bytes] | None = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function to cache its results in a `ResultCache`.
+
+    The key of a call is the function's qualified name followed by the key of its arguments. Calls with
+    arguments `cards_key` cannot encode raise `CardDeckTypeError` unless a key function is given.
+
+    Args:
+        cache (ResultCache): The cache to use.
+        key (Callable[..., bytes] | None): Builds the key of a call from its arguments; defaults to `cards_key`.
+
+    Returns:
+        Callable[[Callable[P, R]], Callable[P, R]]: The decorator.
+    """
+    build_key = key if key is not None else cards_key
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        prefix = f"{function.__module__}.{function.__qualname__}\x00".encode()
+
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            call_key = prefix + build_key(*args, **kwargs)
+            value = cache.get(call_key, _MISSING)
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                cache.set(call_key, value)
+            return value  # type: ignore[no-any-return]
+
+        return wrapper
+
+    return decorator
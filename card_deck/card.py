@@ -12,17 +12,49 @@ Classes:
     - Suite: Enum class for card suites (Clubs, Diamonds, Hearts, Spades).
     - Rank: Enum class for card ranks (Ace to King).
     - Card: Represents a playing card, pairing a rank and a suite.
+    - InternedCard: A canonical, shared (flyweight) card; one instance exists per suite and rank.
+
+Functions:
+    - encode: Encode a suite and rank as the canonical card integer.
+    - decode: Decode a canonical card integer into its suite and rank.
+    - parse_many: Parse a whitespace- or comma-separated hand of card strings.
+    - format_many: Format cards as a separated string.
+
+Encoding:
+Every card has a canonical small-int encoding in the range 0..51 derived from the enum values:
+``code = (rank.value - 1) << RANK_SHIFT | (suite.value - 1)``. The low two bits hold the suite and the
+remaining bits hold the rank, so ``code & SUITE_MASK`` and ``code >> RANK_SHIFT`` recover the suite and
+rank indexes, and sorting codes sorts cards by rank (ace-low) and then suite.
+
+Text:
+Cards parse from and format to a short notation (``"As"``, ``"Td"`` or ``"10d"``) and a long notation
+(``"ACE of SPADES"``, ``"10 of HEARTS"``), case-insensitively. Every accepted spelling is precomputed in one
+lookup table, and the formatted strings of each card are cached by encoding.
 
 Usage:
 Users can create and manipulate card objects using these classes for card-related operations.
 """
-import logging
+from collections.abc import Callable
+from collections.abc import Iterable
 from enum import Enum
 
+from card_deck import TYPE_CHECKING
+from card_deck import metrics
+from card_deck import trace
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidCardAttribute
 from card_deck.exceptions import InvalidCardRank
 from card_deck.exceptions import InvalidCardSuite
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from typing import Self
+
+SUITE_COUNT = 4
+RANK_COUNT = 13
+CARD_COUNT = SUITE_COUNT * RANK_COUNT
+RANK_SHIFT = 2
+SUITE_MASK = (1 << RANK_SHIFT) - 1
 
 
 class Suite(Enum):
@@ -39,13 +71,16 @@ class Suite(Enum):
     HEARTS = 3
     SPADES = 4
 
+    # Members are singletons compared by identity, so the C-level identity hash is equivalent to
+    # Enum's name-based hash and keeps dict lookups keyed by members off the Python call path.
+    __hash__ = object.__hash__
+
     def __str__(self) -> str:
         """Converts the Suite to its string representation.
 
         Returns:
             str: A string representing the name of the suite.
         """
-        logger.debug("name: %s", self.name)
         return self.name
 
 
@@ -73,24 +108,221 @@ class Rank(Enum):
     QUEEN = 12
     KING = 13
 
+    __hash__ = object.__hash__
+
     def __str__(self) -> str:
         """Convert the Rank to its string representation.
 
         Returns:
             str: The string representation of the rank's name.
         """
-        logger.debug("name: %s", self.name)
         return self.name
 
 
+_SUITE_BITS: dict[Suite, int] = {suite: suite.value - 1 for suite in Suite}
+_RANK_BITS: dict[Rank, int] = {rank: (rank.value - 1) << RANK_SHIFT for rank in Rank}
+_SUITE_BY_CODE: tuple[Suite, ...] = tuple(suite for rank in Rank for suite in Suite)
+_RANK_BY_CODE: tuple[Rank, ...] = tuple(rank for rank in Rank for suite in Suite)
+
+_RANK_SYMBOLS = "A23456789TJQK"
+_SUITE_SYMBOLS = "cdhs"
+_SHORT_NAMES: tuple[str, ...] = tuple(
+    _RANK_SYMBOLS[code >> RANK_SHIFT] + _SUITE_SYMBOLS[code & SUITE_MASK] for code in range(CARD_COUNT)
+)
+_LONG_NAMES: tuple[str, ...] = tuple(
+    f"{_RANK_BY_CODE[code]} of {_SUITE_BY_CODE[code]}" for code in range(CARD_COUNT)
+)
+_NAMES_BY_STYLE = {"short": _SHORT_NAMES, "long": _LONG_NAMES}
+
+
+def _build_parse_table() -> dict[str, int]:
+    """Build the table mapping every accepted lower-case card spelling to its encoding.
+
+    Returns:
+        dict[str, int]: The card encoding of each spelling.
+    """
+    table = {}
+    for rank in Rank:
+        long_ranks = {rank.name.lower()} | ({str(rank.value)} if 2 <= rank.value <= 10 else set())
+        short_ranks = {_RANK_SYMBOLS[rank.value - 1].lower()} | ({"10"} if rank.value == 10 else set())
+        for suite in Suite:
+            code = _RANK_BITS[rank] | _SUITE_BITS[suite]
+            for rank_name in long_ranks:
+                table[f"{rank_name} of {suite.name.lower()}"] = code
+            for rank_name in short_ranks:
+                table[f"{rank_name}{_SUITE_SYMBOLS[suite.value - 1]}"] = code
+    return table
+
+
+_PARSE_TABLE = _build_parse_table()
+
+
+def encode(suite: Suite, rank: Rank) -> int:
+    """Encode a suite and rank as the canonical card integer.
+
+    Args:
+        suite (Suite): An instance of the suite enum.
+        rank (Rank): An instance of the Rank enum.
+
+    Returns:
+        int: The card encoding in the range 0..51.
+
+    Raises:
+        InvalidCardSuite: If the provided suite is not a valid suite enum.
+        InvalidCardRank: If the provided rank is not a valid Rank enum.
+    """
+    try:
+        suite_bits = _SUITE_BITS[suite]
+    except (KeyError, TypeError):
+        if metrics.ENABLED:
+            metrics.INVALID_SUITES.inc()
+        if trace.ENABLED:
+            trace.emit(__name__, "card.invalid_suite", suite=suite, type=type(suite).__name__)
+        raise InvalidCardSuite("Invalid card_deck suite") from None
+    try:
+        return _RANK_BITS[rank] | suite_bits
+    except (KeyError, TypeError):
+        if metrics.ENABLED:
+            metrics.INVALID_RANKS.inc()
+        if trace.ENABLED:
+            trace.emit(__name__, "card.invalid_rank", rank=rank, type=type(rank).__name__)
+        raise InvalidCardRank("Invalid card_deck rank") from None
+
+
+def _parse_code(text: str) -> int:
+    """Parse one card string into its encoding.
+
+    Args:
+        text (str): A card in short or long notation.
+
+    Returns:
+        int: The card encoding.
+
+    Raises:
+        InvalidCard: If the text is not a card.
+    """
+    try:
+        return _PARSE_TABLE[text.lower()]
+    except KeyError:
+        pass
+    except AttributeError:
+        raise InvalidCard(f"Invalid card_deck text: {text!r}") from None
+    try:
+        return _PARSE_TABLE[" ".join(text.lower().split())]
+    except KeyError:
+        raise InvalidCard(f"Invalid card_deck text: {text!r}") from None
+
+
+def parse_many(text: str) -> list["InternedCard"]:
+    """Parse a hand of cards separated by whitespace and/or commas.
+
+    Long-notation cards must be separated by commas. Short-notation cards may also be written together,
+    as in ``"AsKd"``.
+
+    Args:
+        text (str): The hand, e.g. ``"As Kd, Qh"``, ``"AsKdQh"`` or ``"ACE of SPADES, 10 of HEARTS"``.
+
+    Returns:
+        list[InternedCard]: The canonical cards, in order.
+
+    Raises:
+        InvalidCard: If any part of the text is not a card.
+    """
+    cards = _INTERNED_CARDS
+    parse_table = _PARSE_TABLE
+    hand = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        code = parse_table.get(part.lower())
+        if code is not None:
+            hand.append(cards[code])
+            continue
+        for token in part.split():
+            codes = _split_short_cards(token.lower())
+            if codes is None:
+                hand.append(cards[_parse_code(part)])
+                break
+            hand.extend(cards[code] for code in codes)
+    return hand
+
+
+def _split_short_cards(token: str) -> list[int] | None:
+    """Parse one card or several concatenated short-notation cards, as in ``"askd10h"``.
+
+    Args:
+        token (str): The lower-case text, without whitespace.
+
+    Returns:
+        list[int] | None: The card encodings, or None if the text is not made of cards.
+    """
+    code = _PARSE_TABLE.get(token)
+    if code is not None:
+        return [code]
+    codes = []
+    start = 0
+    while start < len(token):
+        stop = start + (3 if token.startswith("10", start) else 2)
+        code = _PARSE_TABLE.get(token[start:stop])
+        if code is None:
+            return None
+        codes.append(code)
+        start = stop
+    return codes
+
+
+def format_many(cards: Iterable["Card"], style: str = "short", separator: str = " ") -> str:
+    """Format cards as one string.
+
+    Args:
+        cards (Iterable[Card]): The cards to format.
+        style (str): ``"short"`` (``"As"``) or ``"long"`` (``"ACE of SPADES"``).
+        separator (str): The text placed between cards.
+
+    Returns:
+        str: The formatted cards.
+
+    Raises:
+        CardDeckValueError: If the style is unknown.
+    """
+    try:
+        names = _NAMES_BY_STYLE[style]
+    except KeyError:
+        raise CardDeckValueError(f"Unknown card_deck format style: {style!r}") from None
+    return separator.join([names[card.to_int()] for card in cards])
+
+
+def decode(code: int) -> tuple[Suite, Rank]:
+    """Decode a canonical card integer into its suite and rank.
+
+    Args:
+        code (int): The card encoding in the range 0..51.
+
+    Returns:
+        tuple[Suite, Rank]: The suite and rank of the encoded card.
+
+    Raises:
+        InvalidCard: If the code is not a valid card encoding.
+    """
+    if not isinstance(code, int) or not 0 <= code < CARD_COUNT:
+        raise InvalidCard(f"Invalid card_deck encoding: {code!r}")
+    return _SUITE_BY_CODE[code], _RANK_BY_CODE[code]
+
+
 class Card:
     """A class to represent a playing card_deck, defined by its suite and rank.
 
+    The card is stored as its canonical integer encoding in a single slot; the suite and rank
+    properties are lookups into precomputed tables. Cards compare, order and hash by that encoding,
+    so ``sorted(cards)`` orders them by rank (ace low) and then suite without a key function.
+
     Attributes:
-        _suite (Suite): The suite of the card_deck (Clubs, Diamonds, Hearts, Spades).
-        _rank (Rank): The rank of the card_deck (Ace, 2-10, Jack, Queen, King).
+        _code (int): The canonical encoding of the card_deck in the range 0..51.
     """
 
+    __slots__ = ("_code",)
+
     def __init__(self, suite: Suite, rank: Rank):
         """Initialize a Card object with a specified suite and rank.
 
@@ -98,20 +330,11 @@ class Card:
             suite (Suite): An instance of the suite enum representing the card_deck's suite.
             rank (Rank): An instance of the Rank enum representing the card_deck's rank.
         """
-        logger.debug("suite: %s", suite)
-        logger.debug("rank: %s", rank)
-
-        if suite in Suite:
-            self._suite = suite
-            logger.debug("_suite: %s", self._suite)
-        else:
-            raise InvalidCardSuite("Invalid card_deck suite")
-
-        if rank in Rank:
-            self._rank = rank
-            logger.debug("_rank: %s", self._rank)
-        else:
-            raise InvalidCardRank("Invalid card_deck rank")
+        self._code = encode(suite, rank)
+        if metrics.ENABLED:
+            metrics.CARDS_CREATED.inc()
+        if trace.ENABLED:
+            trace.emit(__name__, "card.init", suite=suite, rank=rank, code=self._code)
 
     def __repr__(self) -> str:
         """Return a string representation of the card_deck.
@@ -119,8 +342,159 @@ class Card:
         Returns:
             str: A formatted string in the format '<Rank> of <suite>'.
         """
-        logger.debug("%s of %s", self._rank, self._suite)
-        return f"{self._rank} of {self._suite}"
+        return _LONG_NAMES[self._code]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two cards by their encoding.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: True if the other object is a card with the same suite and rank.
+        """
+        if isinstance(other, Card):
+            return self._code == other._code
+        return NotImplemented
+
+    def __reduce__(self) -> tuple[Callable[[int], "Card"], tuple[int]]:
+        """Pickle the card as its encoding, so it costs a small int instead of a class and slot state.
+
+        Returns:
+            tuple[Callable[[int], Card], tuple[int]]: The function rebuilding the card and its encoding.
+        """
+        return _card_from_code, (self._code,)
+
+    def __hash__(self) -> int:
+        """Hash the card by its encoding, consistently with `__eq__`.
+
+        A mutable card must not be modified while it is held in a set or used as a dict key.
+
+        Returns:
+            int: The card encoding.
+        """
+        return self._code
+
+    def __lt__(self, other: "Card") -> bool:
+        """Order two cards by their encoding: by rank, ace low, and then by suite.
+
+        Args:
+            other (Card): The card to compare with.
+
+        Returns:
+            bool: True if this card sorts before the other.
+        """
+        if isinstance(other, Card):
+            return self._code < other._code
+        return NotImplemented
+
+    def __le__(self, other: "Card") -> bool:
+        """Order two cards by their encoding: by rank, ace low, and then by suite.
+
+        Args:
+            other (Card): The card to compare with.
+
+        Returns:
+            bool: True if this card sorts before or equal to the other.
+        """
+        if isinstance(other, Card):
+            return self._code <= other._code
+        return NotImplemented
+
+    def __gt__(self, other: "Card") -> bool:
+        """Order two cards by their encoding: by rank, ace low, and then by suite.
+
+        Args:
+            other (Card): The card to compare with.
+
+        Returns:
+            bool: True if this card sorts after the other.
+        """
+        if isinstance(other, Card):
+            return self._code > other._code
+        return NotImplemented
+
+    def __ge__(self, other: "Card") -> bool:
+        """Order two cards by their encoding: by rank, ace low, and then by suite.
+
+        Args:
+            other (Card): The card to compare with.
+
+        Returns:
+            bool: True if this card sorts after or equal to the other.
+        """
+        if isinstance(other, Card):
+            return self._code >= other._code
+        return NotImplemented
+
+    @classmethod
+    def parse(cls, text: str) -> "Card":
+        """Create a card_deck from its short (``"As"``) or long (``"ACE of SPADES"``) notation.
+
+        Args:
+            text (str): The card text, in any letter case.
+
+        Returns:
+            Card: The card described by the text.
+
+        Raises:
+            InvalidCard: If the text is not a card.
+        """
+        return cls.from_int(_parse_code(text))
+
+    def format(self, style: str = "short") -> str:
+        """Format the card_deck as text.
+
+        Args:
+            style (str): ``"short"`` (``"As"``) or ``"long"`` (``"ACE of SPADES"``).
+
+        Returns:
+            str: The cached text of the card_deck.
+
+        Raises:
+            CardDeckValueError: If the style is unknown.
+        """
+        try:
+            return _NAMES_BY_STYLE[style][self._code]
+        except KeyError:
+            raise CardDeckValueError(f"Unknown card_deck format style: {style!r}") from None
+
+    @classmethod
+    def from_int(cls, code: int) -> "Card":
+        """Create a card_deck from its canonical integer encoding.
+
+        Args:
+            code (int): The card encoding in the range 0..51.
+
+        Returns:
+            Card: The card represented by the encoding.
+
+        Raises:
+            InvalidCard: If the code is not a valid card encoding.
+        """
+        if not isinstance(code, int) or not 0 <= code < CARD_COUNT:
+            raise InvalidCard(f"Invalid card_deck encoding: {code!r}")
+        card = object.__new__(cls)
+        card._code = code
+        if metrics.ENABLED:
+            metrics.CARDS_CREATED.inc()
+        return card
+
+    def to_int(self) -> int:
+        """Return the canonical integer encoding of the card_deck.
+
+        Returns:
+            int: The card encoding in the range 0..51.
+        """
+        return self._code
+
+    def intern(self) -> "InternedCard":
+        """Return the canonical, shared card with the same suite and rank.
+
+        Returns:
+            InternedCard: The flyweight instance equivalent to this card_deck.
+        """
+        return _INTERNED_CARDS[self._code]
 
     @property
     def suite(self) -> Suite:
@@ -129,9 +503,7 @@ class Card:
         Returns:
             Suite: The suite of the card_deck.
         """
-        logger.debug("suite: %s", self._suite)
-        logger.debug("type(suite): %s", type(self._suite))
-        return self._suite
+        return _SUITE_BY_CODE[self._code]
 
     @suite.setter
     def suite(self, suite: Suite) -> None:
@@ -146,30 +518,20 @@ class Card:
         Raises:
             InvalidCardSuite: If the provided suite is not a valid suite enum.
         """
-        logger.debug("suite: %s", suite)
-        logger.debug("type(suite): %s", type(suite))
-        logger.debug("Suite attrs: %s", vars(Suite))
-
-        if suite in Suite:
-            self._suite = suite
-            logger.debug("_suite: %s", self._suite)
-        else:
-            raise InvalidCardSuite("Invalid card_deck suite")
+        self._code = encode(suite, _RANK_BY_CODE[self._code])
+        if trace.ENABLED:
+            trace.emit(__name__, "card.set_suite", suite=suite, code=self._code)
 
     @suite.deleter
     def suite(self) -> None:
-        """Delete the suite of the card_deck.
+        """Reject deletion of the suite of the card_deck.
 
-        Deletes the `_suite` attribute of the card, effectively removing its suite
-        and logs the deletion process.
+        A card always has a suite, so deleting it is not supported.
 
-        Returns:
-            None
+        Raises:
+            InvalidCardAttribute: Always.
         """
-        logger.warning("We out here deleting suites now???")
-        logger.debug("_suite: %s", self._suite)
-        del self._suite
-        logger.debug("deleted _suite: %s", self._suite)
+        raise InvalidCardAttribute("The card_deck suite cannot be deleted")
 
     @property
     def rank(self) -> Rank:
@@ -178,8 +540,7 @@ class Card:
         Returns:
             Rank: The rank of the card_deck.
         """
-        logger.debug("_rank: %s", self._rank)
-        return self._rank
+        return _RANK_BY_CODE[self._code]
 
     @rank.setter
     def rank(self, rank: Rank) -> None:
@@ -194,27 +555,225 @@ class Card:
         Raises:
             InvalidCardRank: If the provided rank is not a valid Rank enum.
         """
-        logger.debug("rank: %s", rank)
-        logger.debug("type(rank): %s", type(rank))
-        logger.debug("Rank attrs: %s", vars(Rank))
-
-        if rank in Rank:
-            self._rank = rank
-            logger.debug("_rank: %s", self._rank)
-        else:
-            raise InvalidCardRank("Invalid card_deck rank")
+        self._code = encode(_SUITE_BY_CODE[self._code], rank)
+        if trace.ENABLED:
+            trace.emit(__name__, "card.set_rank", rank=rank, code=self._code)
 
     @rank.deleter
     def rank(self) -> None:
-        """Delete the suite of the card_deck.
+        """Reject deletion of the rank of the card_deck.
 
-        Deletes the `_suite` attribute of the card, effectively removing its suite
-        and logs the deletion process.
+        A card always has a rank, so deleting it is not supported.
+
+        Raises:
+            InvalidCardAttribute: Always.
+        """
+        raise InvalidCardAttribute("The card_deck rank cannot be deleted")
+
+
+class InternedCard(Card):
+    """A canonical playing card shared by every caller (flyweight).
+
+    Only 52 distinct cards exist, so every `InternedCard` is precomputed once at import and
+    `InternedCard(suite, rank)` returns the canonical instance instead of allocating a new object.
+    Interned cards are the immutable card variant: mutating one would change it for every holder, so
+    every attribute assignment or deletion raises `InvalidCardAttribute`. Like any card they compare
+    and hash by encoding, so an interned card equals the plain cards it interns, and they can be
+    shared freely between threads and used as dict keys. They pickle as their encoding and unpickle
+    to the canonical instance, also in another process.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, suite: Suite, rank: Rank) -> "Self":
+        """Return the canonical card for the specified suite and rank.
+
+        Args:
+            suite (Suite): An instance of the suite enum representing the card_deck's suite.
+            rank (Rank): An instance of the Rank enum representing the card_deck's rank.
 
         Returns:
-            None
+            Self: The shared instance for the suite and rank.
+
+        Raises:
+            InvalidCardSuite: If the provided suite is not a valid suite enum.
+            InvalidCardRank: If the provided rank is not a valid Rank enum.
+        """
+        # The canonical cards are InternedCard instances; no subclass defines its own.
+        return _INTERNED_CARDS[encode(suite, rank)]  # type: ignore[return-value]
+
+    def __init__(self, suite: Suite, rank: Rank):  # pylint: disable=super-init-not-called
+        """Leave the canonical card untouched; it was initialized when the table was built.
+
+        Args:
+            suite (Suite): Ignored, already applied by `__new__`.
+            rank (Rank): Ignored, already applied by `__new__`.
+        """
+
+    @classmethod
+    def from_int(cls, code: int) -> "InternedCard":
+        """Return the canonical card for an integer encoding.
+
+        Args:
+            code (int): The card encoding in the range 0..51.
+
+        Returns:
+            InternedCard: The shared instance for the encoding.
+
+        Raises:
+            InvalidCard: If the code is not a valid card encoding.
+        """
+        if not isinstance(code, int) or not 0 <= code < CARD_COUNT:
+            raise InvalidCard(f"Invalid card_deck encoding: {code!r}")
+        return _INTERNED_CARDS[code]
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject changes to a shared card.
+
+        Args:
+            name (str): The attribute name (unused).
+            value (object): The requested value (unused).
+
+        Raises:
+            InvalidCardAttribute: Always, interned cards are immutable.
+        """
+        raise InvalidCardAttribute("Interned card_deck cards are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject deletions from a shared card.
+
+        Args:
+            name (str): The attribute name (unused).
+
+        Raises:
+            InvalidCardAttribute: Always, interned cards are immutable.
+        """
+        raise InvalidCardAttribute("Interned card_deck cards are immutable")
+
+    def __reduce__(self) -> tuple[Callable[[int], "InternedCard"], tuple[int]]:
+        """Pickle the card as its encoding; unpickling returns the canonical instance.
+
+        Returns:
+            tuple[Callable[[int], InternedCard], tuple[int]]: The function returning the card and its encoding.
+        """
+        return _interned_card, (self._code,)
+
+    def __copy__(self) -> "InternedCard":
+        """Return the card itself, since interned cards are shared.
+
+        Returns:
+            InternedCard: This card.
+        """
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> "InternedCard":
+        """Return the card itself, since interned cards are shared.
+
+        Args:
+            memo (dict[int, object]): The deepcopy memo dictionary (unused).
+
+        Returns:
+            InternedCard: This card.
+        """
+        return self
+
+    @property
+    def suite(self) -> Suite:
+        """Get the suite of the card_deck.
+
+        Returns:
+            Suite: The suite of the card_deck.
+        """
+        return _SUITE_BY_CODE[self._code]
+
+    @suite.setter
+    def suite(self, suite: Suite) -> None:
+        """Reject changes to the suite of a shared card.
+
+        Args:
+            suite (Suite): The requested suite (unused).
+
+        Raises:
+            InvalidCardAttribute: Always, interned cards are immutable.
+        """
+        raise InvalidCardAttribute("Interned card_deck cards are immutable")
+
+    @suite.deleter
+    def suite(self) -> None:
+        """Reject deletion of the suite of a shared card.
+
+        Raises:
+            InvalidCardAttribute: Always, interned cards are immutable.
+        """
+        raise InvalidCardAttribute("Interned card_deck cards are immutable")
+
+    @property
+    def rank(self) -> Rank:
+        """Get the rank of the card_deck.
+
+        Returns:
+            Rank: The rank of the card_deck.
+        """
+        return _RANK_BY_CODE[self._code]
+
+    @rank.setter
+    def rank(self, rank: Rank) -> None:
+        """Reject changes to the rank of a shared card.
+
+        Args:
+            rank (Rank): The requested rank (unused).
+
+        Raises:
+            InvalidCardAttribute: Always, interned cards are immutable.
         """
-        logger.warning("We out here deleting ranks now???")
-        logger.debug("_rank: %s", self._rank)
-        del self._rank
-        logger.debug("deleted _rank: %s", self._rank)
+        raise InvalidCardAttribute("Interned card_deck cards are immutable")
+
+    @rank.deleter
+    def rank(self) -> None:
+        """Reject deletion of the rank of a shared card.
+
+        Raises:
+            InvalidCardAttribute: Always, interned cards are immutable.
+        """
+        raise InvalidCardAttribute("Interned card_deck cards are immutable")
+
+
+def _build_interned_cards() -> tuple[InternedCard, ...]:
+    """Build the canonical table holding one `InternedCard` per card encoding.
+
+    Returns:
+        tuple[InternedCard, ...]: The 52 canonical cards indexed by their encoding.
+    """
+    table = []
+    for code in range(CARD_COUNT):
+        card = object.__new__(InternedCard)
+        object.__setattr__(card, "_code", code)
+        table.append(card)
+    return tuple(table)
+
+
+_INTERNED_CARDS = _build_interned_cards()
+
+
+def _card_from_code(code: int) -> Card:
+    """Rebuild a pickled `Card` from its encoding.
+
+    Args:
+        code (int): The card encoding.
+
+    Returns:
+        Card: A new card.
+    """
+    return Card.from_int(code)
+
+
+def _interned_card(code: int) -> InternedCard:
+    """Get the canonical card of a pickled `InternedCard`.
+
+    Args:
+        code (int): The card encoding.
+
+    Returns:
+        InternedCard: The shared instance.
+    """
+    return _INTERNED_CARDS[code]
@@ -0,0 +1,358 @@
+"""See Description below.
+
+Module Name: cardset.py
+
+Description:
+This module provides `CardSet`, an immutable set of distinct playing cards stored as a single 64-bit integer
+mask with one bit per card. The mask is split into four 16-bit suit lanes ordered like the `Suite` enum; within
+a lane, bit ``rank.value - 1`` is set when the card of that rank is present. Union, intersection, difference,
+membership and length are therefore single integer operations, and a suit's 13-bit rank mask is a shift.
+
+Classes:
+    - CardSet: An immutable, hashable set of cards backed by a bitmask.
+
+Usage:
+Build a set from cards or encodings and combine sets with ``|``, ``&``, ``-`` and ``^``::
+
+    board = CardSet.from_codes(deck.draw(5))
+    live = CardSet.full() - board - hole_cards
+"""
+from collections.abc import Iterable
+from collections.abc import Iterator
+
+from card_deck.card import CARD_COUNT
+from card_deck.card import RANK_COUNT
+from card_deck.card import RANK_SHIFT
+from card_deck.card import SUITE_MASK
+from card_deck.card import Card
+from card_deck.card import InternedCard
+from card_deck.card import Suite
+from card_deck.exceptions import CardDeckTypeError
+from card_deck.exceptions import InvalidCard
+
+LANE_WIDTH = 16
+RANK_MASK: int = (1 << RANK_COUNT) - 1
+
+# The bit of every card encoding, indexed by the encoding.
+CARD_BITS: tuple[int, ...] = tuple(
+    1 << ((code & SUITE_MASK) * LANE_WIDTH + (code >> RANK_SHIFT)) for code in range(CARD_COUNT)
+)
+# The rank-0 bit of every suit lane.
+_LANE_BITS = sum(1 << (suite * LANE_WIDTH) for suite in range(len(Suite)))
+_FULL_MASK = sum(CARD_BITS)
+_CARDS: tuple[InternedCard, ...] = tuple(InternedCard.from_int(code) for code in range(CARD_COUNT))
+
+
+class CardSet:
+    """An immutable set of distinct playing cards backed by a 64-bit mask.
+
+    Attributes:
+        _mask (int): One bit per card, in four 16-bit suit lanes.
+    """
+
+    __slots__ = ("_mask",)
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        """Initialize a CardSet holding the given cards.
+
+        Args:
+            cards (Iterable[Card]): The cards in the set; duplicates are ignored.
+        """
+        mask = 0
+        for card in cards:
+            mask |= CARD_BITS[card.to_int()]
+        self._mask = mask
+
+    @classmethod
+    def from_codes(cls, codes: Iterable[int]) -> "CardSet":
+        """Create a CardSet from canonical card encodings.
+
+        Args:
+            codes (Iterable[int]): The card encodings, each in the range 0..51.
+
+        Returns:
+            CardSet: The set of the encoded cards.
+
+        Raises:
+            InvalidCard: If a code is not a valid card encoding.
+        """
+        mask = 0
+        try:
+            for code in codes:
+                if code < 0:
+                    raise IndexError(code)
+                mask |= CARD_BITS[code]
+        except (IndexError, TypeError):
+            raise InvalidCard("Card encodings must be integers in the range 0..51") from None
+        return cls.from_mask(mask)
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "CardSet":
+        """Create a CardSet from its bitmask.
+
+        Args:
+            mask (int): The bitmask, as returned by `CardSet.mask`.
+
+        Returns:
+            CardSet: The set described by the mask.
+
+        Raises:
+            InvalidCard: If the mask sets bits that do not belong to a card.
+        """
+        if mask & ~_FULL_MASK:
+            raise InvalidCard(f"Invalid card set mask: {mask:#x}")
+        card_set = object.__new__(cls)
+        card_set._mask = mask
+        return card_set
+
+    @classmethod
+    def full(cls) -> "CardSet":
+        """Create a CardSet holding every card of a standard deck.
+
+        Returns:
+            CardSet: The 52-card set.
+        """
+        return cls.from_mask(_FULL_MASK)
+
+    @property
+    def mask(self) -> int:
+        """Get the bitmask of the set.
+
+        Returns:
+            int: One bit per card, in four 16-bit suit lanes.
+        """
+        return self._mask
+
+    def __len__(self) -> int:
+        """Return the number of cards in the set.
+
+        Returns:
+            int: The population count of the mask.
+        """
+        return self._mask.bit_count()
+
+    def __bool__(self) -> bool:
+        """Return whether the set holds any card.
+
+        Returns:
+            bool: False for the empty set.
+        """
+        return self._mask != 0
+
+    def __contains__(self, card: object) -> bool:
+        """Return whether a card, or card encoding, is in the set.
+
+        Args:
+            card (object): A `Card` or a card encoding.
+
+        Returns:
+            bool: True if the card is in the set.
+        """
+        if isinstance(card, Card):
+            return bool(self._mask & CARD_BITS[card.to_int()])
+        if isinstance(card, int) and 0 <= card < CARD_COUNT:
+            return bool(self._mask & CARD_BITS[card])
+        return False
+
+    def __iter__(self) -> Iterator[InternedCard]:
+        """Iterate over the cards in rank order (ace low), then suite order.
+
+        Returns:
+            Iterator[InternedCard]: The cards in the set.
+        """
+        return map(_CARDS.__getitem__, self.codes())
+
+    def codes(self) -> Iterator[int]:
+        """Iterate over the card encodings in rank order (ace low), then suite order.
+
+        Yields:
+            int: The encoding of each card in the set.
+        """
+        mask = self._mask
+        for rank in range(RANK_COUNT):
+            lanes = (mask >> rank) & _LANE_BITS
+            if not lanes:
+                continue
+            base = rank << RANK_SHIFT
+            for suite in range(len(Suite)):
+                if lanes >> (suite * LANE_WIDTH) & 1:
+                    yield base | suite
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two card sets.
+
+        Args:
+            other (object): The object to compare against.
+
+        Returns:
+            bool: True if both sets hold the same cards.
+        """
+        if isinstance(other, CardSet):
+            return self._mask == other._mask
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Return the hash of the set.
+
+        Returns:
+            int: The hash of the mask.
+        """
+        return hash(self._mask)
+
+    def __le__(self, other: "CardSet") -> bool:
+        """Return whether every card of this set is in the other set.
+
+        Args:
+            other (CardSet): The candidate superset.
+
+        Returns:
+            bool: True if this set is a subset of `other`.
+        """
+        if not isinstance(other, CardSet):
+            return NotImplemented
+        return self._mask & ~other._mask == 0
+
+    def __ge__(self, other: "CardSet") -> bool:
+        """Return whether every card of the other set is in this set.
+
+        Args:
+            other (CardSet): The candidate subset.
+
+        Returns:
+            bool: True if this set is a superset of `other`.
+        """
+        if not isinstance(other, CardSet):
+            return NotImplemented
+        return other._mask & ~self._mask == 0
+
+    def __or__(self, other: "CardSet") -> "CardSet":
+        """Return the union of two sets.
+
+        Args:
+            other (CardSet): The other set.
+
+        Returns:
+            CardSet: The cards in either set.
+        """
+        if not isinstance(other, CardSet):
+            return NotImplemented
+        return _from_valid_mask(self._mask | other._mask)
+
+    def __and__(self, other: "CardSet") -> "CardSet":
+        """Return the intersection of two sets.
+
+        Args:
+            other (CardSet): The other set.
+
+        Returns:
+            CardSet: The cards in both sets.
+        """
+        if not isinstance(other, CardSet):
+            return NotImplemented
+        return _from_valid_mask(self._mask & other._mask)
+
+    def __sub__(self, other: "CardSet") -> "CardSet":
+        """Return the difference of two sets.
+
+        Args:
+            other (CardSet): The cards to remove.
+
+        Returns:
+            CardSet: The cards of this set that are not in `other`.
+        """
+        if not isinstance(other, CardSet):
+            return NotImplemented
+        return _from_valid_mask(self._mask & ~other._mask)
+
+    def __xor__(self, other: "CardSet") -> "CardSet":
+        """Return the symmetric difference of two sets.
+
+        Args:
+            other (CardSet): The other set.
+
+        Returns:
+            CardSet: The cards in exactly one of the sets.
+        """
+        if not isinstance(other, CardSet):
+            return NotImplemented
+        return _from_valid_mask(self._mask ^ other._mask)
+
+    def __invert__(self) -> "CardSet":
+        """Return the complement of the set within a standard deck.
+
+        Returns:
+            CardSet: The cards of the deck that are not in this set.
+        """
+        return _from_valid_mask(_FULL_MASK & ~self._mask)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the set.
+
+        Returns:
+            str: The cards of the set in rank order.
+        """
+        return f"CardSet({list(self)!r})"
+
+    def isdisjoint(self, other: "CardSet") -> bool:
+        """Return whether the two sets share no card.
+
+        Args:
+            other (CardSet): The other set.
+
+        Returns:
+            bool: True if the intersection is empty.
+
+        Raises:
+            CardDeckTypeError: If `other` is not a CardSet.
+        """
+        if not isinstance(other, CardSet):
+            raise CardDeckTypeError(f"Expected a CardSet, got {type(other).__name__}")
+        return not self._mask & other.mask
+
+    def suit_mask(self, suite: Suite) -> int:
+        """Get the 13-bit rank mask of one suit.
+
+        Args:
+            suite (Suite): The suite to extract.
+
+        Returns:
+            int: Bit ``rank.value - 1`` is set for every rank of `suite` in the set.
+        """
+        lane: int = suite.value - 1
+        return (self._mask >> (lane * LANE_WIDTH)) & RANK_MASK
+
+    def rank_mask(self) -> int:
+        """Get the 13-bit mask of the ranks present in any suit.
+
+        Returns:
+            int: Bit ``rank.value - 1`` is set for every rank in the set.
+        """
+        mask = self._mask
+        return (mask | mask >> LANE_WIDTH | mask >> 2 * LANE_WIDTH | mask >> 3 * LANE_WIDTH) & RANK_MASK
+
+    def count(self, suite: Suite) -> int:
+        """Count the cards of one suit.
+
+        Args:
+            suite (Suite): The suite to count.
+
+        Returns:
+            int: The number of cards of `suite` in the set.
+        """
+        return self.suit_mask(suite).bit_count()
+
+
+def _from_valid_mask(mask: int) -> CardSet:
+    """Create a CardSet from a mask already known to hold only card bits.
+
+    Set algebra on valid sets always yields a valid mask, so the check in `CardSet.from_mask` is skipped.
+
+    Args:
+        mask (int): The bitmask.
+
+    Returns:
+        CardSet: The set described by the mask.
+    """
+    card_set = object.__new__(CardSet)
+    card_set._mask = mask  # pylint: disable=protected-access
+    return card_set
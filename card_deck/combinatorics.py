@@ -0,0 +1,245 @@
+"""See Description below.
+
+Module Name: combinatorics.py
+
+Description:
+This module enumerates k-card combinations without building tuples of `Card` objects. Combinations of n items
+are represented as n-bit index masks and stepped with Gosper's hack, which visits them in colexicographic order.
+`rank_combination` and `unrank_combination` convert between a combination and its position in that order using
+the combinatorial number system (combinadic), so enumeration can start at any index. Splitting the index range
+into contiguous pieces with `split_range` lets several processes enumerate disjoint parts of the same space.
+
+Index masks are mapped onto cards through byte-wide lookup tables, yielding `CardSet` masks or tuples of card
+encodings.
+
+Functions:
+    - combination_count: Count the k-combinations of n items.
+    - rank_combination: Get the colex position of a combination.
+    - unrank_combination: Get the combination at a colex position.
+    - iter_index_masks: Iterate over n-bit masks with k bits set (Gosper's hack).
+    - iter_card_masks: Iterate over the `CardSet` masks of k-card combinations.
+    - iter_card_codes: Iterate over k-card combinations as tuples of encodings.
+    - split_range: Split a range of combination indexes into contiguous parts.
+
+Usage:
+Enumerate every river for a flop, one part per worker::
+
+    live = CardSet.full() - dead
+    parts = split_range(combination_count(len(live), 2), workers)
+    masks = iter_card_masks(live, 2, parts[worker].start, parts[worker].stop)
+"""
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from math import comb
+
+from card_deck.card import CARD_COUNT
+from card_deck.cardset import CARD_BITS
+from card_deck.cardset import CardSet
+from card_deck.exceptions import CardDeckValueError
+
+
+def combination_count(n: int, k: int) -> int:
+    """Count the k-combinations of n items.
+
+    Args:
+        n (int): The number of items.
+        k (int): The number of items per combination.
+
+    Returns:
+        int: The binomial coefficient C(n, k).
+    """
+    return comb(n, k)
+
+
+def rank_combination(indexes: Iterable[int]) -> int:
+    """Get the colexicographic position of a combination.
+
+    Args:
+        indexes (Iterable[int]): The distinct item indexes of the combination, in any order.
+
+    Returns:
+        int: The position of the combination among all combinations of the same size.
+
+    Raises:
+        CardDeckValueError: If the indexes are negative or repeated.
+    """
+    ordered = sorted(indexes)
+    if len(set(ordered)) != len(ordered) or (ordered and ordered[0] < 0):
+        raise CardDeckValueError(f"A combination needs distinct, non-negative indexes: {ordered}")
+    return sum(comb(index, position + 1) for position, index in enumerate(ordered))
+
+
+def unrank_combination(rank: int, k: int) -> tuple[int, ...]:
+    """Get the combination at a colexicographic position.
+
+    Args:
+        rank (int): The position of the combination, starting at 0.
+        k (int): The number of items per combination.
+
+    Returns:
+        tuple[int, ...]: The item indexes of the combination, in increasing order.
+
+    Raises:
+        CardDeckValueError: If the rank or size is negative.
+    """
+    if rank < 0 or k < 0:
+        raise CardDeckValueError(f"Invalid combination rank {rank} of size {k}")
+    indexes = []
+    for size in range(k, 0, -1):
+        # The largest index whose binomial coefficient still fits in the remaining rank.
+        index = size - 1
+        while comb(index + 1, size) <= rank:
+            index += 1
+        rank -= comb(index, size)
+        indexes.append(index)
+    return tuple(reversed(indexes))
+
+
+def _check(n: int, k: int, start: int, stop: int | None) -> int:
+    """Validate an enumeration request and resolve its stop index.
+
+    Args:
+        n (int): The number of items.
+        k (int): The number of items per combination.
+        start (int): The index of the first combination.
+        stop (int | None): The index after the last combination, None for all of them.
+
+    Returns:
+        int: The resolved stop index.
+
+    Raises:
+        CardDeckValueError: If the sizes or range are invalid.
+    """
+    total = comb(n, k) if 0 <= k <= n else 0
+    stop = total if stop is None else stop
+    if n < 0 or k < 0 or not 0 <= start <= stop <= total:
+        raise CardDeckValueError(f"Invalid enumeration of C({n}, {k}) from {start} to {stop}")
+    return stop
+
+
+def iter_index_masks(n: int, k: int, start: int = 0, stop: int | None = None) -> Iterator[int]:
+    """Iterate over the n-bit masks with k bits set, in colexicographic order, using Gosper's hack.
+
+    Args:
+        n (int): The number of items.
+        k (int): The number of items per combination.
+        start (int): The index of the first combination.
+        stop (int | None): The index after the last combination, None for all of them.
+
+    Yields:
+        int: A mask with bit ``i`` set for each item index ``i`` of the combination.
+
+    Raises:
+        CardDeckValueError: If the sizes or range are invalid.
+    """
+    stop = _check(n, k, start, stop)
+    if start == stop:
+        return
+    mask = sum(1 << index for index in unrank_combination(start, k))
+    for _ in range(stop - start - 1):
+        yield mask
+        lowest = mask & -mask
+        ripple = mask + lowest
+        mask = (((ripple ^ mask) >> 2) // lowest) | ripple
+    yield mask
+
+
+def _card_list(cards: CardSet | Sequence[int]) -> list[int]:
+    """Get the encodings of the cards to combine, in item index order.
+
+    Args:
+        cards (CardSet | Sequence[int]): A card set, or card encodings in the order to index them.
+
+    Returns:
+        list[int]: The card encodings.
+
+    Raises:
+        CardDeckValueError: If the encodings are invalid or repeated.
+    """
+    codes = list(cards.codes()) if isinstance(cards, CardSet) else list(cards)
+    if len(set(codes)) != len(codes) or any(not 0 <= code < CARD_COUNT for code in codes):
+        raise CardDeckValueError("The cards to combine must be distinct encodings in the range 0..51")
+    return codes
+
+
+def iter_card_masks(
+    cards: CardSet | Sequence[int], k: int, start: int = 0, stop: int | None = None
+) -> Iterator[int]:
+    """Iterate over the `CardSet` masks of the k-card combinations of some cards.
+
+    Args:
+        cards (CardSet | Sequence[int]): The cards to combine; a sequence fixes the item index of each card.
+        k (int): The number of cards per combination.
+        start (int): The index of the first combination.
+        stop (int | None): The index after the last combination, None for all of them.
+
+    Yields:
+        int: The `CardSet` mask of each combination, in colexicographic order.
+
+    Raises:
+        CardDeckValueError: If the cards, size or range are invalid.
+    """
+    codes = _card_list(cards)
+    # One 256-entry table per byte of the index mask, mapping the byte to the bits of its cards.
+    tables = []
+    for offset in range(0, len(codes), 8):
+        bits = [CARD_BITS[code] for code in codes[offset:offset + 8]]
+        table = [0] * 256
+        for byte in range(1, 1 << len(bits)):
+            lowest = byte & -byte
+            table[byte] = table[byte ^ lowest] | bits[lowest.bit_length() - 1]
+        tables.append(table)
+    for index_mask in iter_index_masks(len(codes), k, start, stop):
+        card_mask = 0
+        for table in tables:
+            card_mask |= table[index_mask & 0xFF]
+            index_mask >>= 8
+        yield card_mask
+
+
+def iter_card_codes(
+    cards: CardSet | Sequence[int], k: int, start: int = 0, stop: int | None = None
+) -> Iterator[tuple[int, ...]]:
+    """Iterate over the k-card combinations of some cards as tuples of encodings.
+
+    Args:
+        cards (CardSet | Sequence[int]): The cards to combine; a sequence fixes the item index of each card.
+        k (int): The number of cards per combination.
+        start (int): The index of the first combination.
+        stop (int | None): The index after the last combination, None for all of them.
+
+    Yields:
+        tuple[int, ...]: The card encodings of each combination, in colexicographic order.
+
+    Raises:
+        CardDeckValueError: If the cards, size or range are invalid.
+    """
+    codes = _card_list(cards)
+    for index_mask in iter_index_masks(len(codes), k, start, stop):
+        combination = []
+        while index_mask:
+            lowest = index_mask & -index_mask
+            combination.append(codes[lowest.bit_length() - 1])
+            index_mask ^= lowest
+        yield tuple(combination)
+
+
+def split_range(total: int, parts: int) -> list[range]:
+    """Split the combination indexes ``0..total-1`` into contiguous, nearly equal parts.
+
+    Args:
+        total (int): The number of combinations.
+        parts (int): The number of parts.
+
+    Returns:
+        list[range]: The parts, in order; the first ``total % parts`` parts hold one extra index.
+
+    Raises:
+        CardDeckValueError: If `total` is negative or `parts` is not positive.
+    """
+    if total < 0 or parts < 1:
+        raise CardDeckValueError(f"Cannot split {total} combination(s) into {parts} part(s)")
+    size, extra = divmod(total, parts)
+    bounds = [part * size + min(part, extra) for part in range(parts + 1)]
+    return [range(bounds[part], bounds[part + 1]) for part in range(parts)]
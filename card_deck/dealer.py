@@ -0,0 +1,357 @@
+"""See Description below.
+
+Module Name: dealer.py
+
+Description:
+This module provides `Dealer`, an asyncio service that deals cards to many concurrent tables from one event
+loop. Every table plays from its own shoe (a `Deck` of one or more decks). The next shoes of each table are
+shuffled ahead of time on a thread pool, so a deal only draws from a ready shoe and never shuffles on the event
+loop.
+
+Shuffle requests from all tables are collected and submitted to the executor in batches, so the cost of a
+thread hand-off is shared by many shoes. At most `max_batches` batches run at once: when shuffling falls
+behind, `deal()` waits for the table's next shoe instead of queueing unbounded work, which is the dealer's
+backpressure.
+
+With a seed, shoe ``k`` of a table is shuffled by an RNG seeded from the seed, the table id and ``k``, so every
+table's deal sequence is reproducible whatever the scheduling order.
+
+Classes:
+    - Dealer: Deal cards to concurrent tables from background-shuffled shoes.
+
+Usage:
+Deal hole cards on many tables concurrently::
+
+    async with Dealer(decks=1, prefetch=2) as dealer:
+        hands = await asyncio.gather(*(dealer.deal(table, 2) for table in tables))
+"""
+import asyncio
+import functools
+import random
+from collections import deque
+from collections.abc import Hashable
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Self
+
+from card_deck import trace
+from card_deck.card import CARD_COUNT
+from card_deck.card import InternedCard
+from card_deck.deck import Deck
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import EmptyDeck
+
+DEFAULT_PREFETCH = 2
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_SIZE = 64
+
+# A shuffle request: the seed of the shoe and the future receiving it.
+_Request = tuple[str | None, "asyncio.Future[Deck]"]
+
+
+def _shuffled_shoes(decks: int, seeds: list[str | None]) -> list[Deck]:
+    """Build and shuffle a batch of shoes; runs on the dealer's executor.
+
+    Args:
+        decks (int): The number of standard decks per shoe.
+        seeds (list[str | None]): The seed of each shoe's shuffle RNG, None for an unpredictable one.
+
+    Returns:
+        list[Deck]: The shuffled shoes, in seed order.
+    """
+    shoes = []
+    for seed in seeds:
+        shoe = Deck(decks, rng=random.Random(seed))
+        shoe.shuffle()
+        shoes.append(shoe)
+    return shoes
+
+
+class _Table:  # pylint: disable=too-few-public-methods
+    """The dealing state of one table.
+
+    Attributes:
+        shoe (Deck | None): The shoe being dealt from.
+        ready (deque[asyncio.Future[Deck]]): The next shoes, shuffled or being shuffled, in order.
+        shoes (int): The number of shoes scheduled for the table so far.
+        lock (asyncio.Lock): Serializes the table's deals.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a table with no shoe."""
+        self.shoe: Deck | None = None
+        self.ready: deque[asyncio.Future[Deck]] = deque()
+        self.shoes = 0
+        self.lock = asyncio.Lock()
+
+
+class Dealer:  # pylint: disable=too-many-instance-attributes
+    """Deal cards to concurrent asyncio tables from shoes shuffled in the background.
+
+    Attributes:
+        _decks (int): The number of standard decks per shoe.
+        _seed (int | None): The base seed of every shoe, None for unpredictable shuffles.
+        _prefetch (int): The number of next shoes kept ready per table.
+        _batch_size (int): The most shoes shuffled by one executor job.
+        _executor (Executor): The executor running the shuffles.
+        _owns_executor (bool): Whether the dealer created the executor and must shut it down.
+        _slots (asyncio.Semaphore): Bounds the number of batches submitted at once.
+        _requests (list[_Request]): The shuffle requests not yet submitted.
+        _shoes (set[asyncio.Future[Deck]]): Every shoe future not resolved yet, including those a deal awaits.
+        _pump (asyncio.Task[None] | None): The task submitting batches of requests.
+        _tables (dict[Hashable, _Table]): The state of each open table.
+        _closed (bool): Whether the dealer has been closed.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        decks: int = 1,
+        *,
+        seed: int | None = None,
+        prefetch: int = DEFAULT_PREFETCH,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batches: int = DEFAULT_WORKERS,
+        executor: Executor | None = None,
+    ):
+        """Initialize a Dealer.
+
+        Args:
+            decks (int): The number of standard decks per shoe.
+            seed (int | None): A base seed that makes every table's shoes reproducible.
+            prefetch (int): The number of next shoes to keep shuffled ahead for each table.
+            batch_size (int): The most shoes shuffled by one executor job.
+            max_batches (int): The most batches submitted to the executor at once.
+            executor (Executor | None): The executor for shuffles; by default a private thread pool.
+
+        Raises:
+            CardDeckValueError: If a count or size is not positive.
+        """
+        if min(decks, prefetch, batch_size, max_batches) < 1:
+            raise CardDeckValueError(f"Invalid dealer settings: {decks=}, {prefetch=}, {batch_size=}, {max_batches=}")
+        self._decks = decks
+        self._seed = seed
+        self._prefetch = prefetch
+        self._batch_size = batch_size
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(DEFAULT_WORKERS, thread_name_prefix="card_deck-dealer")
+        self._slots = asyncio.Semaphore(max_batches)
+        self._requests: list[_Request] = []
+        self._shoes: set[asyncio.Future[Deck]] = set()
+        self._pump: asyncio.Task[None] | None = None
+        self._tables: dict[Hashable, _Table] = {}
+        self._closed = False
+
+    @property
+    def tables(self) -> list[Hashable]:
+        """Get the ids of the open tables.
+
+        Returns:
+            list[Hashable]: The table ids, in opening order.
+        """
+        return list(self._tables)
+
+    def open_table(self, table_id: Hashable) -> None:
+        """Open a table and start shuffling its shoes, so its first deal does not wait.
+
+        Must be called from a running event loop. Opening an open table does nothing.
+
+        Args:
+            table_id (Hashable): The table id.
+
+        Returns:
+            None
+        """
+        self._table(table_id)
+
+    def close_table(self, table_id: Hashable) -> None:
+        """Close a table, discarding its shoes and cancelling their shuffles.
+
+        Args:
+            table_id (Hashable): The table id.
+
+        Returns:
+            None
+        """
+        table = self._tables.pop(table_id, None)
+        if table is not None:
+            for shoe in table.ready:
+                shoe.cancel()
+
+    def _table(self, table_id: Hashable) -> _Table:
+        """Get a table's state, opening the table if needed.
+
+        Args:
+            table_id (Hashable): The table id.
+
+        Returns:
+            _Table: The table state.
+
+        Raises:
+            EmptyDeck: If the dealer is closed.
+        """
+        if self._closed:
+            raise EmptyDeck("The dealer is closed")
+        table = self._tables.get(table_id)
+        if table is None:
+            table = self._tables[table_id] = _Table()
+            self._refill(table_id, table)
+        return table
+
+    def _refill(self, table_id: Hashable, table: _Table) -> None:
+        """Schedule shuffles until the table has `prefetch` next shoes.
+
+        Args:
+            table_id (Hashable): The table id.
+            table (_Table): The table state.
+
+        Returns:
+            None
+        """
+        loop = asyncio.get_running_loop()
+        while len(table.ready) < self._prefetch:
+            seed = None if self._seed is None else f"{self._seed}/{table_id}/{table.shoes}"
+            shoe: asyncio.Future[Deck] = loop.create_future()
+            self._shoes.add(shoe)
+            shoe.add_done_callback(self._shoes.discard)
+            self._requests.append((seed, shoe))
+            table.ready.append(shoe)
+            table.shoes += 1
+        if self._pump is None or self._pump.done():
+            self._pump = loop.create_task(self._submit_batches())
+
+    async def _submit_batches(self) -> None:
+        """Submit the pending shuffle requests to the executor in batches, waiting for free batch slots.
+
+        Returns:
+            None
+        """
+        loop = asyncio.get_running_loop()
+        # Let the other tables of this loop iteration add their requests to the first batch.
+        await asyncio.sleep(0)
+        while self._requests:
+            await self._slots.acquire()
+            # Requests of tables closed in the meantime are dropped.
+            batch = [request for request in self._requests[:self._batch_size] if not request[1].done()]
+            del self._requests[:self._batch_size]
+            if not batch:
+                self._slots.release()
+                continue
+            job = loop.run_in_executor(self._executor, _shuffled_shoes, self._decks, [seed for seed, _ in batch])
+            job.add_done_callback(functools.partial(self._deliver, batch))
+
+    def _deliver(self, batch: list[_Request], job: "asyncio.Future[list[Deck]]") -> None:
+        """Hand the shoes of a finished batch to the tables waiting for them.
+
+        Args:
+            batch (list[_Request]): The requests of the batch.
+            job (asyncio.Future[list[Deck]]): The finished executor job.
+
+        Returns:
+            None
+        """
+        self._slots.release()
+        error = None if job.cancelled() else job.exception()
+        for index, (_, shoe) in enumerate(batch):
+            if shoe.done():
+                continue
+            if job.cancelled():
+                shoe.cancel()
+            elif error is not None:
+                shoe.set_exception(error)
+            else:
+                shoe.set_result(job.result()[index])
+
+    async def deal(self, table_id: Hashable, count: int = 1) -> bytes:
+        """Deal encoded cards to a table.
+
+        Deals to one table happen in call order; deals to different tables run concurrently. If the table's shoe
+        holds fewer than `count` cards, the rest of it is discarded and dealing continues from the next shoe,
+        waiting for its shuffle if it is not ready yet.
+
+        Args:
+            table_id (Hashable): The table id; unknown tables are opened.
+            count (int): The number of cards to deal.
+
+        Returns:
+            bytes: The dealt card encodings, in dealing order.
+
+        Raises:
+            EmptyDeck: If `count` is negative or larger than a shoe, or the dealer is closed.
+        """
+        if not 0 <= count <= self._decks * CARD_COUNT:
+            raise EmptyDeck(f"Cannot deal {count} card(s) from a shoe of {self._decks} deck(s)")
+        table = self._table(table_id)
+        async with table.lock:
+            if self._closed:
+                raise EmptyDeck("The dealer is closed")
+            if table.shoe is None or len(table.shoe) < count:
+                waiting = not table.ready[0].done()
+                next_shoe = table.ready.popleft()
+                self._refill(table_id, table)
+                table.shoe = await next_shoe
+                if trace.ENABLED:
+                    trace.emit(__name__, "dealer.new_shoe", table=table_id, waited=waiting)
+            cards: bytes = table.shoe.draw(count)
+            return cards
+
+    async def deal_cards(self, table_id: Hashable, count: int = 1) -> list[InternedCard]:
+        """Deal cards to a table as canonical card objects.
+
+        Args:
+            table_id (Hashable): The table id; unknown tables are opened.
+            count (int): The number of cards to deal.
+
+        Returns:
+            list[InternedCard]: The dealt cards, in dealing order.
+
+        Raises:
+            EmptyDeck: If `count` is negative or larger than a shoe, or the dealer is closed.
+        """
+        return list(map(InternedCard.from_int, await self.deal(table_id, count)))
+
+    async def aclose(self) -> None:
+        """Close every table and shut down the private executor.
+
+        Deals waiting for a shoe raise `EmptyDeck`.
+
+        Returns:
+            None
+        """
+        self._closed = True
+        for table_id in list(self._tables):
+            self.close_table(table_id)
+        # The shoes left are awaited by deals. Failing them rather than cancelling them keeps a closed dealer from
+        # looking like a cancellation of the caller's task.
+        for shoe in list(self._shoes):
+            if not shoe.done():
+                shoe.set_exception(EmptyDeck("The dealer is closed"))
+        self._requests.clear()
+        if self._pump is not None:
+            self._pump.cancel()
+            await asyncio.gather(self._pump, return_exceptions=True)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> Self:
+        """Enter a context that closes the dealer on exit.
+
+        Returns:
+            Self: This dealer.
+        """
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Close the dealer.
+
+        Args:
+            exc_type (type[BaseException] | None): The exception type, if one was raised.
+            exc (BaseException | None): The exception, if one was raised.
+            traceback (TracebackType | None): The exception traceback, if one was raised.
+
+        Returns:
+            None
+        """
+        await self.aclose()
@@ -0,0 +1,227 @@
+"""See Description below.
+
+Module Name: deck.py
+
+Description:
+This module provides the `Deck` class, an array-backed deck or multi-deck shoe of playing cards.
+Cards are stored as their canonical integer encoding (see `card_deck.card`) in a single `bytearray`,
+so shuffling swaps bytes in place and drawing advances a cursor instead of copying or popping lists
+of `Card` objects. Cards are only materialized as `InternedCard` instances when asked for.
+
+Classes:
+    - Deck: A shuffleable deck or shoe of one or more standard 52-card decks.
+
+Usage:
+Create a `Deck` (optionally with several decks and a seeded RNG or a `card_deck.rng` source), shuffle it,
+then draw encoded cards with `draw()` or canonical card objects with `draw_cards()`.
+"""
+import random
+import time
+from collections.abc import Iterable
+from collections.abc import Iterator
+
+from card_deck import TYPE_CHECKING
+from card_deck import metrics
+from card_deck import trace
+from card_deck.card import CARD_COUNT
+from card_deck.card import InternedCard
+from card_deck.exceptions import CardDeckTypeError
+from card_deck.exceptions import EmptyDeck
+from card_deck.exceptions import InvalidDeck
+
+if TYPE_CHECKING:
+    from card_deck.rng import ShuffleSource
+
+_STANDARD_DECK = bytes(range(CARD_COUNT))
+
+
+class Deck:
+    """A deck, or shoe of several decks, of playing cards stored as encoded bytes.
+
+    Attributes:
+        _cards (bytearray): The encoded cards, in dealing order.
+        _cursor (int): The index of the next card to draw.
+        _decks (int): The number of standard decks in the shoe.
+        _rng (ShuffleSource): The random source used for shuffling.
+    """
+
+    def __init__(self, decks: int = 1, *, seed: int | None = None, rng: "ShuffleSource | None" = None):
+        """Initialize an unshuffled Deck of one or more standard decks.
+
+        Args:
+            decks (int): The number of standard 52-card decks in the shoe.
+            seed (int | None): A seed for a new private RNG; ignored when `rng` is given.
+            rng (ShuffleSource | None): The random source used for shuffling, e.g. a `SecureSource` for
+                real-money games; by default a `random.Random`.
+
+        Raises:
+            InvalidDeck: If the number of decks is not a positive integer.
+        """
+        if not isinstance(decks, int) or isinstance(decks, bool) or decks < 1:
+            raise InvalidDeck(f"Invalid number of decks: {decks!r}")
+        self._decks = decks
+        self._cards = bytearray(_STANDARD_DECK * decks)
+        self._cursor = 0
+        self._rng = rng if rng is not None else random.Random(seed)
+
+    @classmethod
+    def from_codes(cls, codes: Iterable[int], decks: int = 1, *, rng: "ShuffleSource | None" = None) -> "Deck":
+        """Create a Deck holding the given encoded cards, in dealing order.
+
+        Args:
+            codes (Iterable[int]): The encoded cards, each in the range 0..51.
+            decks (int): The number of standard decks the cards are drawn from; each card may
+                appear at most this many times.
+            rng (ShuffleSource | None): The random source used for shuffling.
+
+        Returns:
+            Deck: A deck holding the cards.
+
+        Raises:
+            CardDeckTypeError: If `codes` is an integer or a string rather than a collection of codes.
+            InvalidDeck: If a code is not a valid card or appears more than `decks` times.
+        """
+        # bytearray(3) would be three zero bytes, i.e. three copies of card 0.
+        if isinstance(codes, (int, str)):
+            raise CardDeckTypeError(f"Deck cards must be an iterable of card encodings, got {type(codes).__name__}")
+        deck = cls(decks, rng=rng)
+        try:
+            cards = bytearray(codes)
+        except (TypeError, ValueError):
+            raise InvalidDeck("Deck cards must be card encodings in the range 0..51") from None
+        counts = [0] * CARD_COUNT
+        for code in cards:
+            if code >= CARD_COUNT:
+                raise InvalidDeck(f"Invalid card encoding in deck: {code}")
+            counts[code] += 1
+            if counts[code] > decks:
+                raise InvalidDeck(f"Card encoding {code} appears more than {decks} time(s)")
+        deck._cards = cards
+        return deck
+
+    def __len__(self) -> int:
+        """Return the number of cards remaining to be drawn.
+
+        Returns:
+            int: The number of undealt cards.
+        """
+        return len(self._cards) - self._cursor
+
+    def __iter__(self) -> Iterator[InternedCard]:
+        """Iterate over the remaining cards without drawing them.
+
+        Returns:
+            Iterator[InternedCard]: The undealt cards in dealing order.
+        """
+        return map(InternedCard.from_int, self._cards[self._cursor:])
+
+    def __repr__(self) -> str:
+        """Return a string representation of the deck.
+
+        Returns:
+            str: A summary of the deck size and remaining cards.
+        """
+        return f"Deck(decks={self._decks}, remaining={len(self)}/{len(self._cards)})"
+
+    @property
+    def decks(self) -> int:
+        """Get the number of standard decks in the shoe.
+
+        Returns:
+            int: The number of decks.
+        """
+        return self._decks
+
+    @property
+    def size(self) -> int:
+        """Get the total number of cards in the shoe.
+
+        Returns:
+            int: The number of cards, dealt or not.
+        """
+        return len(self._cards)
+
+    @property
+    def dealt(self) -> bytes:
+        """Get the encoded cards drawn since the last shuffle.
+
+        Returns:
+            bytes: The dealt cards in dealing order.
+        """
+        return bytes(self._cards[:self._cursor])
+
+    @property
+    def remaining(self) -> bytes:
+        """Get the encoded cards still to be drawn.
+
+        Returns:
+            bytes: The undealt cards in dealing order.
+        """
+        return bytes(self._cards[self._cursor:])
+
+    def reset(self) -> None:
+        """Return every card to the shoe in factory order, reusing the card storage.
+
+        A deck built with `from_codes()` is refilled to the full `decks` standard decks.
+
+        Returns:
+            None
+        """
+        self._cards[:] = _STANDARD_DECK * self._decks
+        self._cursor = 0
+
+    def shuffle(self, rng: "ShuffleSource | None" = None) -> None:
+        """Collect every card and shuffle the shoe in place (Fisher-Yates).
+
+        Args:
+            rng (ShuffleSource | None): The random source to use instead of the deck's own.
+
+        Returns:
+            None
+        """
+        self._cursor = 0
+        start = time.perf_counter_ns() if metrics.ENABLED else 0
+        (rng if rng is not None else self._rng).shuffle(self._cards)
+        if metrics.ENABLED:
+            metrics.SHUFFLES.inc()
+            metrics.SHUFFLE_SECONDS.record(time.perf_counter_ns() - start)
+        if trace.ENABLED:
+            trace.emit(__name__, "deck.shuffle", size=len(self._cards))
+
+    def draw(self, count: int = 1) -> bytes:
+        """Draw encoded cards from the top of the deck.
+
+        Args:
+            count (int): The number of cards to draw.
+
+        Returns:
+            bytes: The drawn card encodings in dealing order.
+
+        Raises:
+            EmptyDeck: If fewer than `count` cards remain.
+        """
+        start = self._cursor
+        stop = start + count
+        if count < 0 or stop > len(self._cards):
+            raise EmptyDeck(f"Cannot draw {count} card(s), {len(self)} remaining")
+        self._cursor = stop
+        if metrics.ENABLED:
+            metrics.DEALS.inc()
+            metrics.CARDS_DEALT.inc(count)
+        if trace.ENABLED:
+            trace.emit(__name__, "deck.draw", count=count, remaining=len(self._cards) - stop)
+        return bytes(self._cards[start:stop])
+
+    def draw_cards(self, count: int = 1) -> list[InternedCard]:
+        """Draw cards from the top of the deck as canonical card objects.
+
+        Args:
+            count (int): The number of cards to draw.
+
+        Returns:
+            list[InternedCard]: The drawn cards in dealing order.
+
+        Raises:
+            EmptyDeck: If fewer than `count` cards remain.
+        """
+        return list(map(InternedCard.from_int, self.draw(count)))
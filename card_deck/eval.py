@@ -0,0 +1,565 @@
+"""See Description below.
+
+Module Name: eval.py
+
+Description:
+This module ranks 5-, 6- and 7-card poker hands with precomputed lookup tables. A hand's value is an integer
+where a higher value is a stronger hand: the `HandCategory` sits in the top bits and the ranks that break ties
+(ace high) follow in 4-bit fields, so hands compare with ordinary integer comparison.
+
+Evaluation works on the `CardSet` bitmask of a hand:
+    - Flushes: a table indexed by a suit lane's 13-bit rank mask gives the best flush or straight flush of
+      that suit (0 when the lane holds fewer than five cards). With at most seven cards, a flush always beats
+      anything else the hand can make.
+    - Everything else depends only on the rank multiset. The four suit lanes are folded with bit operations
+      into "rank held at least once/twice/three/four times" masks, which together form a collision-free
+      (perfect) key into a table of every 5- to 7-card rank multiset.
+
+The tables are built once on first use. The multiset table (about 74,000 entries) is cached on disk, in the
+directory named by ``CARD_DECK_CACHE_DIR`` or ``~/.cache/card_deck``, so later processes load it instead of
+rebuilding it. When NumPy is installed, `evaluate_batch()` evaluates whole arrays of encoded hands at once.
+
+Classes:
+    - HandCategory: Enum class for the poker hand categories (High Card to Straight Flush).
+
+Functions:
+    - evaluate: Evaluate a hand of encoded cards.
+    - evaluate_cards: Evaluate a hand of `Card` objects.
+    - evaluate_mask: Evaluate a `CardSet` mask.
+    - evaluate_masks: Evaluate many `CardSet` masks.
+    - evaluate_many: Evaluate many hands of encoded cards.
+    - evaluate_batch: Evaluate a NumPy array of encoded hands.
+    - hand_category: Get the category of a hand value.
+
+Usage:
+Compare the values of two hands to find the winner::
+
+    if evaluate(hero + board) > evaluate(villain + board):
+        ...
+"""
+# Annotations are not evaluated, so typing, pathlib and NumPy are only imported by type checkers.
+from __future__ import annotations
+
+import os
+import time
+from array import array
+from collections.abc import Iterable
+from collections.abc import Sequence
+from enum import Enum
+
+from card_deck import TYPE_CHECKING
+from card_deck import metrics
+from card_deck import trace
+from card_deck.card import CARD_COUNT
+from card_deck.card import RANK_COUNT
+from card_deck.card import Card
+from card_deck.cardset import CARD_BITS
+from card_deck.cardset import LANE_WIDTH
+from card_deck.cardset import RANK_MASK
+from card_deck.exceptions import InvalidHand
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+    import numpy.typing as npt
+
+CATEGORY_SHIFT = 20
+CACHE_VERSION = 1
+MIN_HAND_SIZE = 5
+MAX_HAND_SIZE = 7
+
+_CACHE_MAGIC = b"CDEV"
+
+
+class HandCategory(Enum):
+    """Enumeration of poker hand categories, weakest to strongest.
+
+    Attributes:
+        HIGH_CARD: No pair, straight or flush.
+        PAIR: Two cards of one rank.
+        TWO_PAIR: Two cards of one rank and two of another.
+        THREE_OF_A_KIND: Three cards of one rank.
+        STRAIGHT: Five cards of consecutive ranks.
+        FLUSH: Five cards of one suite.
+        FULL_HOUSE: Three cards of one rank and two of another.
+        FOUR_OF_A_KIND: Four cards of one rank.
+        STRAIGHT_FLUSH: Five cards of consecutive ranks in one suite.
+    """
+    HIGH_CARD = 0
+    PAIR = 1
+    TWO_PAIR = 2
+    THREE_OF_A_KIND = 3
+    STRAIGHT = 4
+    FLUSH = 5
+    FULL_HOUSE = 6
+    FOUR_OF_A_KIND = 7
+    STRAIGHT_FLUSH = 8
+
+    def __str__(self) -> str:
+        """Convert the HandCategory to its string representation.
+
+        Returns:
+            str: The string representation of the category's name.
+        """
+        return self.name
+
+
+def _high(rank_index: int) -> int:
+    """Convert an ace-low rank index (ACE=0 .. KING=12) to an ace-high one (TWO=0 .. ACE=12).
+
+    Args:
+        rank_index (int): The ace-low rank index.
+
+    Returns:
+        int: The ace-high rank index.
+    """
+    high: int = (rank_index - 1) % RANK_COUNT
+    return high
+
+
+def _value(category: HandCategory, ranks: Sequence[int]) -> int:
+    """Pack a hand category and its tie-breaking ace-high ranks into a hand value.
+
+    Args:
+        category (HandCategory): The hand category.
+        ranks (Sequence[int]): Up to five ace-high rank indexes, most significant first.
+
+    Returns:
+        int: The hand value.
+    """
+    value = category.value
+    for position in range(5):
+        value = value << 4 | (ranks[position] if position < len(ranks) else 0)
+    return value
+
+
+def _straight_top(high_mask: int) -> int:
+    """Find the top card of the best straight in an ace-high rank mask.
+
+    Args:
+        high_mask (int): A 13-bit mask with bit ``i`` set for every ace-high rank index ``i`` present.
+
+    Returns:
+        int: The ace-high index of the straight's top card, or -1 if there is no straight.
+    """
+    for top in range(RANK_COUNT - 1, 3, -1):
+        run = 0b11111 << (top - 4)
+        if high_mask & run == run:
+            return top
+    wheel = 1 << 12 | 0b1111
+    return 3 if high_mask & wheel == wheel else -1
+
+
+def _build_flush_table() -> list[int]:
+    """Build the flush table indexed by a suit lane's ace-low 13-bit rank mask.
+
+    Returns:
+        list[int]: The best straight flush or flush value per mask, 0 for masks of fewer than five ranks.
+    """
+    table = [0] * (RANK_MASK + 1)
+    for mask in range(RANK_MASK + 1):
+        if mask.bit_count() < MIN_HAND_SIZE:
+            continue
+        high = [_high(rank) for rank in range(RANK_COUNT) if mask >> rank & 1]
+        high.sort(reverse=True)
+        top = _straight_top(sum(1 << rank for rank in high))
+        if top >= 0:
+            table[mask] = _value(HandCategory.STRAIGHT_FLUSH, [top])
+        else:
+            table[mask] = _value(HandCategory.FLUSH, high[:5])
+    return table
+
+
+def _multiset_value(counts: Sequence[int]) -> int:  # pylint: disable=too-many-return-statements
+    """Compute the best non-flush hand value of a rank multiset.
+
+    Args:
+        counts (Sequence[int]): The number of cards held per ace-high rank index.
+
+    Returns:
+        int: The hand value.
+    """
+    by_count: list[list[int]] = [[], [], [], [], []]
+    for rank in range(RANK_COUNT - 1, -1, -1):
+        by_count[counts[rank]].append(rank)
+    present = [rank for rank in range(RANK_COUNT - 1, -1, -1) if counts[rank]]
+    quads, trips, pairs = by_count[4], by_count[3], by_count[2]
+
+    if quads:
+        return _value(HandCategory.FOUR_OF_A_KIND, [quads[0]] + [r for r in present if r != quads[0]][:1])
+    if trips and (len(trips) > 1 or pairs):
+        pair = max(trips[1:] + pairs)
+        return _value(HandCategory.FULL_HOUSE, [trips[0], pair])
+    top = _straight_top(sum(1 << rank for rank in present))
+    if top >= 0:
+        return _value(HandCategory.STRAIGHT, [top])
+    if trips:
+        return _value(HandCategory.THREE_OF_A_KIND, [trips[0]] + [r for r in present if r != trips[0]][:2])
+    if len(pairs) > 1:
+        kicker = [r for r in present if r not in pairs[:2]][:1]
+        return _value(HandCategory.TWO_PAIR, pairs[:2] + kicker)
+    if pairs:
+        return _value(HandCategory.PAIR, [pairs[0]] + [r for r in present if r != pairs[0]][:3])
+    return _value(HandCategory.HIGH_CARD, present[:5])
+
+
+def _multiset_key(counts: Sequence[int]) -> int:
+    """Compute the table key of a rank multiset, as `evaluate_mask` derives it from the suit lanes.
+
+    Args:
+        counts (Sequence[int]): The number of cards held per ace-high rank index.
+
+    Returns:
+        int: The four "held at least n times" ace-low rank masks packed 13 bits apart.
+    """
+    key = 0
+    for rank, count in enumerate(counts):
+        low_bit = 1 << ((rank + 1) % RANK_COUNT)
+        for layer in range(count):
+            key |= low_bit << (RANK_COUNT * layer)
+    return key
+
+
+def _build_multiset_table() -> tuple[array[int], array[int]]:
+    """Build the table of every 5- to 7-card rank multiset.
+
+    Returns:
+        tuple[array[int], array[int]]: The keys, sorted, and the hand value of each key.
+    """
+    entries: list[tuple[int, int]] = []
+    counts = [0] * RANK_COUNT
+
+    def fill(rank: int, left: int) -> None:
+        """Enumerate the counts of the ranks from `rank` up, with at most `left` more cards."""
+        if rank == RANK_COUNT:
+            if MAX_HAND_SIZE - left >= MIN_HAND_SIZE:
+                entries.append((_multiset_key(counts), _multiset_value(counts)))
+            return
+        for count in range(min(4, left) + 1):
+            counts[rank] = count
+            fill(rank + 1, left - count)
+        counts[rank] = 0
+
+    fill(0, MAX_HAND_SIZE)
+    entries.sort()
+    return array("Q", (key for key, _ in entries)), array("I", (value for _, value in entries))
+
+
+def _cache_path() -> Path:
+    """Get the path of the on-disk multiset table cache.
+
+    Returns:
+        Path: The cache file path.
+    """
+    from pathlib import Path  # pylint: disable=import-outside-toplevel
+
+    directory = os.environ.get("CARD_DECK_CACHE_DIR") or Path.home() / ".cache" / "card_deck"
+    return Path(directory) / f"eval_multiset_v{CACHE_VERSION}.bin"
+
+
+def _read_cache(path: Path) -> tuple[array[int], array[int]] | None:
+    """Read the multiset table from the disk cache.
+
+    Args:
+        path (Path): The cache file path.
+
+    Returns:
+        tuple[array[int], array[int]] | None: The keys and values, or None if the cache is missing or invalid.
+    """
+    keys, values = array("Q"), array("I")
+    try:
+        with path.open("rb") as cache:
+            header = cache.read(8)
+            if header[:4] != _CACHE_MAGIC:
+                return None
+            size = int.from_bytes(header[4:], "little")
+            keys.fromfile(cache, size)
+            values.fromfile(cache, size)
+    except (OSError, EOFError):
+        return None
+    return keys, values
+
+
+def _write_cache(path: Path, keys: array[int], values: array[int]) -> None:
+    """Write the multiset table to the disk cache atomically, ignoring unwritable locations.
+
+    Args:
+        path (Path): The cache file path.
+        keys (array[int]): The sorted table keys.
+        values (array[int]): The hand value of each key.
+
+    Returns:
+        None
+    """
+    import tempfile  # pylint: disable=import-outside-toplevel
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=path.parent, delete=False) as cache:
+            cache.write(_CACHE_MAGIC + len(keys).to_bytes(4, "little"))
+            keys.tofile(cache)
+            values.tofile(cache)
+        os.replace(cache.name, path)
+    except OSError as error:
+        import logging  # pylint: disable=import-outside-toplevel
+
+        logging.getLogger(__name__).warning("Unable to cache the hand evaluation tables at %s: %s", path, error)
+
+
+def _multiset_arrays() -> tuple[array[int], array[int]]:
+    """Load the multiset table from the disk cache, building and caching it if needed.
+
+    Returns:
+        tuple[array[int], array[int]]: The sorted keys and the hand value of each key.
+    """
+    path = _cache_path()
+    cached = _read_cache(path)
+    if cached is not None:
+        return cached
+    keys, values = _build_multiset_table()
+    _write_cache(path, keys, values)
+    return keys, values
+
+
+_FLUSH: list[int] = []
+_MULTISET: dict[int, int] = {}
+
+
+def _load_tables() -> None:
+    """Populate the module lookup tables on first use.
+
+    Returns:
+        None
+    """
+    if not _FLUSH:
+        keys, values = _multiset_arrays()
+        _MULTISET.update(zip(keys, values))
+        _FLUSH.extend(_build_flush_table())
+        if trace.ENABLED:
+            trace.emit(__name__, "eval.tables_loaded", entries=len(_MULTISET))
+
+
+def evaluate_mask(mask: int) -> int:
+    """Evaluate the hand held in a `CardSet` mask.
+
+    Args:
+        mask (int): A `CardSet.mask` of 5 to 7 cards.
+
+    Returns:
+        int: The hand value; higher values are stronger hands.
+
+    Raises:
+        InvalidHand: If the mask does not hold 5 to 7 cards.
+    """
+    return evaluate_masks((mask,))[0]
+
+
+def evaluate_masks(masks: Iterable[int]) -> list[int]:  # pylint: disable=too-many-locals
+    """Evaluate many hands held in `CardSet` masks.
+
+    This is the evaluation kernel; the loop body is written out in full so no function call is made per hand.
+
+    Args:
+        masks (Iterable[int]): `CardSet.mask` values of 5 to 7 cards each.
+
+    Returns:
+        list[int]: The value of each hand, in order; higher values are stronger hands.
+
+    Raises:
+        InvalidHand: If a mask does not hold 5 to 7 cards.
+    """
+    if not _FLUSH:
+        _load_tables()
+    start = time.perf_counter_ns() if metrics.ENABLED else 0
+    flush = _FLUSH
+    multiset = _MULTISET
+    values: list[int] = []
+    append = values.append
+    try:
+        for mask in masks:
+            clubs = mask & RANK_MASK
+            diamonds = mask >> LANE_WIDTH & RANK_MASK
+            hearts = mask >> 2 * LANE_WIDTH & RANK_MASK
+            spades = mask >> 3 * LANE_WIDTH & RANK_MASK
+            value = flush[clubs] or flush[diamonds] or flush[hearts] or flush[spades]
+            if value:
+                if not MIN_HAND_SIZE <= mask.bit_count() <= MAX_HAND_SIZE:
+                    raise KeyError(mask)
+                append(value)
+                continue
+            # Fold the lanes into the ranks held at least once, twice, three and four times.
+            low_pair = clubs & diamonds
+            high_pair = hearts & spades
+            low_any = clubs | diamonds
+            high_any = hearts | spades
+            append(multiset[
+                low_any | high_any
+                | (low_pair | high_pair | low_any & high_any) << 13
+                | (low_pair & high_any | low_any & high_pair) << 26
+                | (low_pair & high_pair) << 39
+            ])
+    except KeyError:
+        raise InvalidHand(f"A hand must hold {MIN_HAND_SIZE} to {MAX_HAND_SIZE} cards") from None
+    if metrics.ENABLED:
+        metrics.EVALUATIONS.inc(len(values))
+        metrics.EVALUATION_SECONDS.record(time.perf_counter_ns() - start)
+    return values
+
+
+def evaluate(codes: Iterable[int]) -> int:
+    """Evaluate a hand of 5 to 7 distinct encoded cards.
+
+    Args:
+        codes (Iterable[int]): The card encodings, each in the range 0..51.
+
+    Returns:
+        int: The hand value; higher values are stronger hands.
+
+    Raises:
+        InvalidHand: If the hand does not hold 5 to 7 distinct valid cards.
+    """
+    return evaluate_masks((_hand_mask(codes),))[0]
+
+
+def evaluate_cards(cards: Iterable[Card]) -> int:
+    """Evaluate a hand of 5 to 7 distinct cards.
+
+    Args:
+        cards (Iterable[Card]): The cards of the hand.
+
+    Returns:
+        int: The hand value; higher values are stronger hands.
+
+    Raises:
+        InvalidHand: If the hand does not hold 5 to 7 distinct cards.
+    """
+    return evaluate_masks((_hand_mask(card.to_int() for card in cards),))[0]
+
+
+def evaluate_many(hands: Iterable[Iterable[int]]) -> list[int]:
+    """Evaluate many hands of 5 to 7 distinct encoded cards.
+
+    Args:
+        hands (Iterable[Iterable[int]]): The hands, each a sequence of card encodings.
+
+    Returns:
+        list[int]: The value of each hand, in order.
+
+    Raises:
+        InvalidHand: If a hand does not hold 5 to 7 distinct valid cards.
+    """
+    return evaluate_masks(map(_hand_mask, hands))
+
+
+def _hand_mask(codes: Iterable[int]) -> int:
+    """Build the `CardSet` mask of a hand of encoded cards.
+
+    Args:
+        codes (Iterable[int]): The card encodings.
+
+    Returns:
+        int: The mask of the hand.
+
+    Raises:
+        InvalidHand: If a code is outside 0..51 or a card is repeated.
+    """
+    card_bits = CARD_BITS
+    mask = 0
+    count = 0
+    for code in codes:
+        if not 0 <= code < CARD_COUNT:
+            raise InvalidHand(f"Card encodings must be integers in the range 0..51, got {code!r}")
+        mask |= card_bits[code]
+        count += 1
+    if mask.bit_count() != count:
+        raise InvalidHand("A hand must not repeat a card")
+    return mask
+
+
+def evaluate_batch(hands: npt.ArrayLike) -> Any:  # pylint: disable=too-many-locals
+    """Evaluate an array of encoded hands with NumPy.
+
+    Requires the optional NumPy dependency.
+
+    Args:
+        hands (npt.ArrayLike): An ``(N, k)`` array of card encodings, 5 <= k <= 7, with distinct cards per row.
+
+    Returns:
+        Any: A ``uint32`` NumPy array with the value of each hand.
+
+    Raises:
+        InvalidHand: If the hands do not hold 5 to 7 distinct valid cards each, naming the offending rows.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if not _FLUSH:
+        _load_tables()
+    tables = _numpy_tables(np)
+    start = time.perf_counter_ns() if metrics.ENABLED else 0
+    codes = np.asarray(hands, dtype=np.intp)
+    if codes.ndim != 2 or not MIN_HAND_SIZE <= codes.shape[1] <= MAX_HAND_SIZE:
+        raise InvalidHand(f"Hands must be an (N, k) array with {MIN_HAND_SIZE} <= k <= {MAX_HAND_SIZE}")
+    if codes.size and (codes.min() < 0 or codes.max() >= CARD_COUNT):
+        rows = np.flatnonzero(((codes < 0) | (codes >= CARD_COUNT)).any(axis=1))
+        raise InvalidHand(f"Card encodings must be integers in the range 0..51; invalid rows: {rows.tolist()[:10]}")
+    mask = np.bitwise_or.reduce(tables["bits"][codes], axis=1)
+    counts = np.bitwise_count(mask)
+    if (counts != codes.shape[1]).any():
+        rows = np.flatnonzero(counts != codes.shape[1])
+        raise InvalidHand(f"A hand must not repeat a card; invalid rows: {rows.tolist()[:10]}")
+    rank_mask = np.uint64(RANK_MASK)
+    lanes = [(mask >> np.uint64(suite * LANE_WIDTH)) & rank_mask for suite in range(4)]
+    flush = np.maximum.reduce([tables["flush"][lane.astype(np.intp)] for lane in lanes])
+    clubs, diamonds, hearts, spades = lanes
+    low_pair, high_pair = clubs & diamonds, hearts & spades
+    low_any, high_any = clubs | diamonds, hearts | spades
+    keys = (
+        low_any | high_any
+        | (low_pair | high_pair | low_any & high_any) << np.uint64(13)
+        | (low_pair & high_any | low_any & high_pair) << np.uint64(26)
+        | (low_pair & high_pair) << np.uint64(39)
+    )
+    index = np.minimum(np.searchsorted(tables["keys"], keys), len(tables["keys"]) - 1)
+    if not (tables["keys"][index] == keys).all():
+        raise InvalidHand(f"Every hand must hold {MIN_HAND_SIZE} to {MAX_HAND_SIZE} distinct cards")
+    values = np.where(flush > 0, flush, tables["values"][index]).astype(np.uint32)
+    if metrics.ENABLED:
+        metrics.EVALUATIONS.inc(len(values))
+        metrics.EVALUATION_SECONDS.record(time.perf_counter_ns() - start)
+    return values
+
+
+_NUMPY_TABLES: dict[str, Any] = {}
+
+
+def _numpy_tables(np: Any) -> dict[str, Any]:
+    """Build the NumPy copies of the lookup tables on first use.
+
+    Args:
+        np (Any): The NumPy module.
+
+    Returns:
+        dict[str, Any]: The card bit, flush, key and value arrays.
+    """
+    if not _NUMPY_TABLES:
+        keys = sorted(_MULTISET)
+        _NUMPY_TABLES.update(
+            bits=np.array(CARD_BITS, dtype=np.uint64),
+            flush=np.array(_FLUSH, dtype=np.uint32),
+            keys=np.array(keys, dtype=np.uint64),
+            values=np.array([_MULTISET[key] for key in keys], dtype=np.uint32),
+        )
+    return _NUMPY_TABLES
+
+
+def hand_category(value: int) -> HandCategory:
+    """Get the category of a hand value.
+
+    Args:
+        value (int): A hand value returned by the evaluation functions.
+
+    Returns:
+        HandCategory: The category of the hand.
+    """
+    return HandCategory(value >> CATEGORY_SHIFT)
@@ -15,7 +15,10 @@ Classes:
     - InvalidCard: Exception for invalid card definitions.
     - InvalidCardRank: Exception for invalid ranks of cards.
     - InvalidCardSuite: Exception for invalid suites of cards.
+    - InvalidHand: Exception for invalid hand definitions.
     - InvalidDeck: Exception for invalid deck definitions.
+    - EmptyDeck: Exception for drawing more cards than a deck holds.
+    - InvalidFormat: Exception for malformed serialized card data.
 """
 
 
@@ -53,6 +56,20 @@ class InvalidCardAttribute(CardDeckAttributeError):
     """Exception raised for invalid card_deck attributes."""
 
 
+# Hand card_deck_exceptions
+class InvalidHand(CardDeckValueError):
+    """Exception raised for invalid hand definitions."""
+
+
 # Deck card_deck_exceptions
 class InvalidDeck(CardDeckException):
     """Exception raised for invalid deck definitions."""
+
+
+class EmptyDeck(InvalidDeck):
+    """Exception raised for drawing more cards than remain in a deck."""
+
+
+# Serialization card_deck_exceptions
+class InvalidFormat(CardDeckValueError):
+    """Exception raised for malformed serialized card_deck data."""
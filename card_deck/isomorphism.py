@@ -0,0 +1,296 @@
+"""See Description below.
+
+Module Name: isomorphism.py
+
+Description:
+This module maps hands to suit-isomorphic representatives. The four suits are interchangeable in hold'em, so
+two situations that differ only by renaming suits, such as Ace-King of HEARTS and Ace-King of SPADES, have the
+same equity and hand values. Canonicalizing both to one representative lets result caches reuse work across up
+to 24 suit permutations.
+
+A `CardSet` mask holds one 16-bit lane per suit, so renaming suits moves whole lanes. Each suit is described by
+the ranks it holds in the hand and on the board; the suits are sorted by that description, largest first, and
+renamed clubs, diamonds, hearts and spades in that order. Suits with equal descriptions are interchangeable, so
+the representative does not depend on how ties are broken. The `Isomorph` keeps the permutation used, to map
+canonical cards (e.g. the suit of a flush draw) back to the original suits.
+
+The hole cards and the board are described separately, so a card moving from the hand to the board gives a
+different situation. The board is treated as a set, which fits flop, turn and river boards alike. The 1,326
+preflop hands (169 classes) and 22,100 flops (1,755 classes) are precomputed on first use, and each class has a
+dense index for array-backed caches.
+
+Classes:
+    - Isomorph: A canonical hand and board with the suit permutation that produced them.
+
+Functions:
+    - canonicalize: Map a hand and optional board to its suit-isomorphic representative.
+    - preflop_class: Get the dense index of a two-card hand's class.
+    - flop_class: Get the dense index of a flop's class.
+
+Usage:
+Key an equity cache on the canonical form::
+
+    isomorph = canonicalize(hero, board)
+    result = cache.get(isomorph.key)
+    if result is None:
+        result = cache[isomorph.key] = equity([isomorph.hand.codes()], board=isomorph.board.codes())
+"""
+from collections import Counter
+from collections.abc import Iterable
+from itertools import permutations
+from math import factorial
+from math import prod
+from typing import NamedTuple
+
+from card_deck import trace
+from card_deck.card import CARD_COUNT
+from card_deck.card import SUITE_COUNT
+from card_deck.card import Card
+from card_deck.cardset import LANE_WIDTH
+from card_deck.cardset import RANK_MASK
+from card_deck.cardset import CardSet
+from card_deck.combinatorics import iter_card_masks
+from card_deck.exceptions import InvalidHand
+
+PREFLOP_CLASS_COUNT = 169
+FLOP_CLASS_COUNT = 1_755
+# Every renaming of the four suits; entry s of a permutation is the new index of suit index s.
+SUITE_PERMUTATIONS: tuple[tuple[int, ...], ...] = tuple(permutations(range(SUITE_COUNT)))
+
+_SHIFTS = tuple(suite * LANE_WIDTH for suite in range(SUITE_COUNT))
+_PERMUTATION_INDEX = {permutation: index for index, permutation in enumerate(SUITE_PERMUTATIONS)}
+_EMPTY = CardSet()
+
+
+class Isomorph(NamedTuple):
+    """A canonical hand and board with the suit permutation that produced them.
+
+    Attributes:
+        hand (CardSet): The canonical hole cards.
+        board (CardSet): The canonical board.
+        permutation (tuple[int, ...]): The canonical suit index of each original suit index (``suite.value - 1``).
+    """
+    hand: CardSet
+    board: CardSet
+    permutation: tuple[int, ...]
+
+    @property
+    def key(self) -> int:
+        """Get a compact key of the canonical hand and board, equal for every isomorphic situation.
+
+        Returns:
+            int: The hand mask in the low 64 bits and the board mask above them.
+        """
+        key: int = self.hand.mask | self.board.mask << (LANE_WIDTH * SUITE_COUNT)
+        return key
+
+    @property
+    def variants(self) -> int:
+        """Count the situations isomorphic to this one, including itself.
+
+        Returns:
+            int: 24 divided by the number of suit permutations that leave the situation unchanged.
+        """
+        hand, board = self.hand.mask, self.board.mask
+        signatures = Counter((hand >> shift & RANK_MASK, board >> shift & RANK_MASK) for shift in _SHIFTS)
+        return len(SUITE_PERMUTATIONS) // prod(map(factorial, signatures.values()))
+
+    def to_canonical(self, cards: CardSet) -> CardSet:
+        """Rename the suits of original cards as in the canonical form.
+
+        Args:
+            cards (CardSet): Cards in the original suits.
+
+        Returns:
+            CardSet: The cards in the canonical suits.
+        """
+        return CardSet.from_mask(_permute(cards.mask, self.permutation))
+
+    def to_original(self, cards: CardSet) -> CardSet:
+        """Rename the suits of canonical cards back to the original suits.
+
+        Args:
+            cards (CardSet): Cards in the canonical suits.
+
+        Returns:
+            CardSet: The cards in the original suits.
+        """
+        inverse = tuple(self.permutation.index(suite) for suite in range(SUITE_COUNT))
+        return CardSet.from_mask(_permute(cards.mask, inverse))
+
+
+def _permute(mask: int, permutation: tuple[int, ...]) -> int:
+    """Move the suit lanes of a mask.
+
+    Args:
+        mask (int): A `CardSet` mask.
+        permutation (tuple[int, ...]): The new index of each suit index.
+
+    Returns:
+        int: The mask with lane s moved to lane ``permutation[s]``.
+    """
+    result = 0
+    for shift, suite in zip(_SHIFTS, permutation):
+        result |= (mask >> shift & RANK_MASK) << _SHIFTS[suite]
+    return result
+
+
+def _canonical_masks(hand: int, board: int) -> tuple[int, int, tuple[int, ...]]:
+    """Canonicalize a hand and board by sorting the suits by the ranks they hold.
+
+    Args:
+        hand (int): The `CardSet` mask of the hole cards.
+        board (int): The `CardSet` mask of the board.
+
+    Returns:
+        tuple[int, int, tuple[int, ...]]: The canonical hand and board masks and the canonical suit index of each
+            original suit index.
+    """
+    lanes = [(hand >> shift & RANK_MASK, board >> shift & RANK_MASK) for shift in _SHIFTS]
+    # A reversed sort is stable, so suits with equal lanes keep their order and the permutation is deterministic.
+    order = sorted(range(SUITE_COUNT), key=lanes.__getitem__, reverse=True)
+    permutation = [0] * SUITE_COUNT
+    canonical_hand = canonical_board = 0
+    for suite, original in enumerate(order):
+        permutation[original] = suite
+        hand_lane, board_lane = lanes[original]
+        canonical_hand |= hand_lane << _SHIFTS[suite]
+        canonical_board |= board_lane << _SHIFTS[suite]
+    return canonical_hand, canonical_board, tuple(permutation)
+
+
+def _build_table(size: int, board: bool) -> tuple[dict[int, tuple[int, int]], list[int]]:
+    """Canonicalize every combination of a number of cards.
+
+    Args:
+        size (int): The number of cards per combination.
+        board (bool): Canonicalize the combinations as boards instead of hands.
+
+    Returns:
+        tuple[dict[int, tuple[int, int]], list[int]]: The class index and permutation index of every mask, and
+            the canonical mask of every class in ascending order.
+    """
+    canonical = {}
+    for mask in iter_card_masks(range(CARD_COUNT), size):
+        hand, board_mask, permutation = _canonical_masks(0, mask) if board else _canonical_masks(mask, 0)
+        canonical[mask] = (board_mask if board else hand, _PERMUTATION_INDEX[permutation])
+    classes = sorted({mask for mask, _ in canonical.values()})
+    index = {mask: position for position, mask in enumerate(classes)}
+    return {mask: (index[rep], permutation) for mask, (rep, permutation) in canonical.items()}, classes
+
+
+_PREFLOP: dict[int, tuple[int, int]] = {}
+_PREFLOP_CLASSES: list[int] = []
+_FLOP: dict[int, tuple[int, int]] = {}
+_FLOP_CLASSES: list[int] = []
+
+
+def _load_tables() -> None:
+    """Populate the preflop and flop tables on first use.
+
+    Returns:
+        None
+    """
+    if not _PREFLOP:
+        table, classes = _build_table(2, board=False)
+        _PREFLOP_CLASSES.extend(classes)
+        _PREFLOP.update(table)
+        table, classes = _build_table(3, board=True)
+        _FLOP_CLASSES.extend(classes)
+        _FLOP.update(table)
+        if trace.ENABLED:
+            trace.emit(__name__, "isomorphism.tables_loaded", preflop=len(_PREFLOP_CLASSES), flop=len(_FLOP_CLASSES))
+
+
+def _card_mask(cards: CardSet | Iterable[Card | int]) -> int:
+    """Get the `CardSet` mask of distinct cards.
+
+    Args:
+        cards (CardSet | Iterable[Card | int]): A card set, or cards or card encodings.
+
+    Returns:
+        int: The mask.
+
+    Raises:
+        InvalidCard: If an item is neither a card nor a valid encoding.
+        InvalidHand: If a card is repeated.
+    """
+    mask: int
+    if isinstance(cards, CardSet):
+        mask = cards.mask
+        return mask
+    codes = [card.to_int() if isinstance(card, Card) else card for card in cards]
+    mask = CardSet.from_codes(codes).mask
+    if mask.bit_count() != len(codes):
+        raise InvalidHand("A card is repeated")
+    return mask
+
+
+def canonicalize(hand: CardSet | Iterable[Card | int], board: CardSet | Iterable[Card | int] = ()) -> Isomorph:
+    """Map hole cards and an optional board to their suit-isomorphic representative.
+
+    Two-card hands without a board and flops without hole cards are looked up in the precomputed tables.
+
+    Args:
+        hand (CardSet | Iterable[Card | int]): The hole cards, as a card set, cards or card encodings.
+        board (CardSet | Iterable[Card | int]): The board cards.
+
+    Returns:
+        Isomorph: The canonical hand and board and the suit permutation that produced them.
+
+    Raises:
+        InvalidCard: If an item is neither a card nor a valid encoding.
+        InvalidHand: If a card is repeated or held in both the hand and the board.
+    """
+    hand_mask, board_mask = _card_mask(hand), _card_mask(board)
+    if hand_mask & board_mask:
+        raise InvalidHand("A card is held in both the hand and the board")
+    _load_tables()
+    if not board_mask and hand_mask in _PREFLOP:
+        index, permutation = _PREFLOP[hand_mask]
+        return Isomorph(CardSet.from_mask(_PREFLOP_CLASSES[index]), _EMPTY, SUITE_PERMUTATIONS[permutation])
+    if not hand_mask and board_mask in _FLOP:
+        index, permutation = _FLOP[board_mask]
+        return Isomorph(_EMPTY, CardSet.from_mask(_FLOP_CLASSES[index]), SUITE_PERMUTATIONS[permutation])
+    canonical_hand, canonical_board, suits = _canonical_masks(hand_mask, board_mask)
+    return Isomorph(CardSet.from_mask(canonical_hand), CardSet.from_mask(canonical_board), suits)
+
+
+def preflop_class(hand: CardSet | Iterable[Card | int]) -> int:
+    """Get the dense index of a two-card hand's isomorphism class.
+
+    Args:
+        hand (CardSet | Iterable[Card | int]): The two hole cards.
+
+    Returns:
+        int: The class index in the range 0..168, in ascending order of the canonical mask.
+
+    Raises:
+        InvalidCard: If an item is neither a card nor a valid encoding.
+        InvalidHand: If the hand is not two distinct cards.
+    """
+    _load_tables()
+    entry = _PREFLOP.get(_card_mask(hand))
+    if entry is None:
+        raise InvalidHand("A preflop hand must be two distinct cards")
+    return entry[0]
+
+
+def flop_class(board: CardSet | Iterable[Card | int]) -> int:
+    """Get the dense index of a flop's isomorphism class.
+
+    Args:
+        board (CardSet | Iterable[Card | int]): The three flop cards.
+
+    Returns:
+        int: The class index in the range 0..1754, in ascending order of the canonical mask.
+
+    Raises:
+        InvalidCard: If an item is neither a card nor a valid encoding.
+        InvalidHand: If the flop is not three distinct cards.
+    """
+    _load_tables()
+    entry = _FLOP.get(_card_mask(board))
+    if entry is None:
+        raise InvalidHand("A flop must be three distinct cards")
+    return entry[0]
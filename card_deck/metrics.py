@@ -0,0 +1,395 @@
+"""See Description below.
+
+Module Name: metrics.py
+
+Description:
+This module provides the opt-in metrics of the card_deck library: counters and latency histograms that show
+where card operations spend time in production without attaching a profiler. Like trace mode (see
+`card_deck.trace`), every instrumentation point checks the module-level `ENABLED` switch first, so with metrics
+off the cost is a single attribute check and no clock is read.
+
+Metrics are off by default. They are switched on once at import when the ``CARD_DECK_METRICS`` environment
+variable is set to ``1``, ``true``, ``yes`` or ``on``, or at runtime with `enable_metrics()`.
+
+The library records:
+    - card_deck_cards_created_total: `Card` objects created (interned cards are shared, not created).
+    - card_deck_shuffles_total and card_deck_shuffle_seconds: shuffles of decks and batch rows, and their time.
+    - card_deck_deals_total and card_deck_cards_dealt_total: draws from decks and batch rows, and their cards.
+    - card_deck_evaluations_total and card_deck_evaluation_seconds: hands evaluated, and the time of each
+      evaluation call.
+    - card_deck_validation_failures_total: invalid suites and ranks, labelled by the exception raised.
+
+Histograms are HDR-style: values are recorded in integer nanoseconds into log-linear buckets, 16 per power of
+two, so every recorded value is kept within 6.25% at a fixed memory cost whatever the range of latencies.
+
+Classes:
+    - Counter: A monotonically increasing count.
+    - Histogram: A log-linear (HDR-style) latency histogram.
+
+Functions:
+    - enable_metrics: Turn metrics on.
+    - disable_metrics: Turn metrics off.
+    - is_metrics_enabled: Report whether metrics are on.
+    - reset_metrics: Zero every metric.
+    - as_dict: Export every metric as a dictionary.
+    - to_prometheus: Export every metric in the Prometheus text exposition format.
+
+Usage:
+Guard every instrumentation point with the switch, reading the clock only when metrics are on::
+
+    start = time.perf_counter_ns() if metrics.ENABLED else 0
+    ...
+    if metrics.ENABLED:
+        metrics.SHUFFLES.inc()
+        metrics.SHUFFLE_SECONDS.record(time.perf_counter_ns() - start)
+"""
+# The on/off switch deliberately mirrors card_deck.trace.
+# pylint: disable=duplicate-code
+import os
+
+# The low-level lock of the threading module, which is not worth importing on the card hot path.
+from _thread import allocate_lock
+
+ENABLED = os.environ.get("CARD_DECK_METRICS", "").strip().lower() in {"1", "true", "yes", "on"}
+
+SUB_BUCKET_BITS = 4
+NANOSECONDS = 1_000_000_000
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+
+def _bucket_index(value: int) -> int:
+    """Get the histogram bucket of a value.
+
+    Values below ``2 * 16`` get a bucket each; above that, each power of two is split into 16 buckets.
+
+    Args:
+        value (int): A non-negative integer.
+
+    Returns:
+        int: The bucket index.
+    """
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    if shift <= 0:
+        return value
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """Get the range of values counted in a histogram bucket.
+
+    Args:
+        index (int): The bucket index.
+
+    Returns:
+        tuple[int, int]: The lowest value of the bucket and the lowest value above it.
+    """
+    if index < 2 * _SUB_BUCKETS:
+        return index, index + 1
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    mantissa = index - (shift << SUB_BUCKET_BITS)
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+_BUCKET_COUNT = _bucket_index((1 << 64) - 1) + 1
+_LABEL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+
+def _series(name: str, labels: dict[str, str]) -> str:
+    """Format the Prometheus series name of a metric.
+
+    Args:
+        name (str): The metric name.
+        labels (dict[str, str]): The metric labels.
+
+    Returns:
+        str: The name followed by the escaped labels in braces, if any.
+    """
+    if not labels:
+        return name
+    escaped = ",".join(f'{key}="{value.translate(_LABEL_ESCAPES)}"' for key, value in labels.items())
+    return f"{name}{{{escaped}}}"
+
+
+class Counter:
+    """A monotonically increasing count, safe to increment from several threads.
+
+    Attributes:
+        name (str): The Prometheus metric name.
+        help (str): The metric description.
+        labels (dict[str, str]): The labels distinguishing this series from others of the same name.
+        _value (int): The count.
+        _lock (_thread.LockType): Guards the count.
+    """
+
+    def __init__(self, name: str, help_text: str, **labels: str):
+        """Initialize a Counter at zero.
+
+        Args:
+            name (str): The Prometheus metric name, ending in ``_total`` by convention.
+            help_text (str): The metric description.
+            **labels (str): The labels of this series.
+        """
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._value = 0
+        self._lock = allocate_lock()
+
+    @property
+    def value(self) -> int:
+        """Get the count.
+
+        Returns:
+            int: The count.
+        """
+        return self._value
+
+    def inc(self, amount: int = 1) -> None:
+        """Increase the count.
+
+        Args:
+            amount (int): The non-negative increment.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._value += amount
+
+    def reset(self) -> None:
+        """Zero the count.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._value = 0
+
+
+class Histogram:  # pylint: disable=too-many-instance-attributes
+    """A log-linear (HDR-style) histogram of latencies recorded in nanoseconds and exported in seconds.
+
+    Attributes:
+        name (str): The Prometheus metric name.
+        help (str): The metric description.
+        labels (dict[str, str]): The labels distinguishing this series from others of the same name.
+        _counts (list[int]): The count of each bucket.
+        _count (int): The number of recorded values.
+        _sum (int): The sum of the recorded values.
+        _min (int): The smallest recorded value.
+        _max (int): The largest recorded value.
+        _lock (_thread.LockType): Guards the buckets and totals.
+    """
+
+    def __init__(self, name: str, help_text: str, **labels: str):
+        """Initialize an empty Histogram.
+
+        Args:
+            name (str): The Prometheus metric name, ending in ``_seconds`` by convention.
+            help_text (str): The metric description.
+            **labels (str): The labels of this series.
+        """
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._counts = [0] * _BUCKET_COUNT
+        self._count = self._sum = self._min = self._max = 0
+        self._lock = allocate_lock()
+
+    @property
+    def count(self) -> int:
+        """Get the number of recorded values.
+
+        Returns:
+            int: The number of recorded values.
+        """
+        return self._count
+
+    def record(self, nanoseconds: int) -> None:
+        """Record a latency.
+
+        Args:
+            nanoseconds (int): The latency in nanoseconds, e.g. a difference of ``time.perf_counter_ns()`` values.
+
+        Returns:
+            None
+        """
+        value = max(nanoseconds, 0)
+        index = _bucket_index(value)
+        with self._lock:
+            self._counts[index] += 1
+            if not self._count or value < self._min:
+                self._min = value
+            self._max = max(self._max, value)
+            self._count += 1
+            self._sum += value
+
+    def percentile(self, percent: float) -> float:
+        """Get a percentile of the recorded latencies.
+
+        The result is the top of the bucket holding the percentile, capped at the largest recorded value, so it
+        is within the bucket precision of the exact percentile.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+
+        Returns:
+            float: The latency in seconds, 0.0 if nothing was recorded.
+        """
+        with self._lock:
+            if not self._count:
+                return 0.0
+            rank = max(1, -(-self._count * percent // 100))
+            seen = 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if seen >= rank:
+                    return min(_bucket_bounds(index)[1] - 1, self._max) / NANOSECONDS
+            return self._max / NANOSECONDS
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """Get the cumulative counts of the non-empty buckets.
+
+        Returns:
+            list[tuple[float, int]]: The upper bound in seconds of each non-empty bucket, and the number of
+                recorded values below it, in increasing order.
+        """
+        with self._lock:
+            result = []
+            seen = 0
+            for index, count in enumerate(self._counts):
+                if count:
+                    seen += count
+                    result.append((_bucket_bounds(index)[1] / NANOSECONDS, seen))
+            return result
+
+    def summary(self) -> dict[str, float]:
+        """Summarize the recorded latencies.
+
+        Returns:
+            dict[str, float]: The count, and the sum, min, max, mean and `PERCENTILES` in seconds.
+        """
+        with self._lock:
+            count, total, low, high = self._count, self._sum, self._min, self._max
+        result = {
+            "count": count,
+            "sum": total / NANOSECONDS,
+            "min": low / NANOSECONDS,
+            "max": high / NANOSECONDS,
+            "mean": total / count / NANOSECONDS if count else 0.0,
+        }
+        for percent in PERCENTILES:
+            result[f"p{percent:g}"] = self.percentile(percent)
+        return result
+
+    def reset(self) -> None:
+        """Forget every recorded value.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._counts = [0] * _BUCKET_COUNT
+            self._count = self._sum = self._min = self._max = 0
+
+
+CARDS_CREATED = Counter("card_deck_cards_created_total", "Card objects created.")
+SHUFFLES = Counter("card_deck_shuffles_total", "Decks and batch rows shuffled.")
+SHUFFLE_SECONDS = Histogram("card_deck_shuffle_seconds", "Time spent in each shuffle call.")
+DEALS = Counter("card_deck_deals_total", "Draws from decks and batch rows.")
+CARDS_DEALT = Counter("card_deck_cards_dealt_total", "Cards drawn from decks and batch rows.")
+EVALUATIONS = Counter("card_deck_evaluations_total", "Poker hands evaluated.")
+EVALUATION_SECONDS = Histogram("card_deck_evaluation_seconds", "Time spent in each evaluation call.")
+INVALID_SUITES = Counter(
+    "card_deck_validation_failures_total", "Invalid card suites and ranks rejected.", error="InvalidCardSuite"
+)
+INVALID_RANKS = Counter(
+    "card_deck_validation_failures_total", "Invalid card suites and ranks rejected.", error="InvalidCardRank"
+)
+
+# The library's metrics, in export order; series of the same name are adjacent.
+_REGISTRY: tuple[Counter | Histogram, ...] = (
+    CARDS_CREATED, SHUFFLES, SHUFFLE_SECONDS, DEALS, CARDS_DEALT, EVALUATIONS, EVALUATION_SECONDS, INVALID_SUITES,
+    INVALID_RANKS,
+)
+
+
+def enable_metrics() -> None:
+    """Turn metrics on for the whole card_deck library.
+
+    Returns:
+        None
+    """
+    global ENABLED  # pylint: disable=global-statement
+    ENABLED = True
+
+
+def disable_metrics() -> None:
+    """Turn metrics off for the whole card_deck library; recorded values are kept.
+
+    Returns:
+        None
+    """
+    global ENABLED  # pylint: disable=global-statement
+    ENABLED = False
+
+
+def is_metrics_enabled() -> bool:
+    """Report whether metrics are on.
+
+    Returns:
+        bool: True if metrics are recorded.
+    """
+    return ENABLED
+
+
+def reset_metrics() -> None:
+    """Zero every counter and histogram.
+
+    Returns:
+        None
+    """
+    for metric in _REGISTRY:
+        metric.reset()
+
+
+def as_dict() -> dict[str, int | dict[str, float]]:
+    """Export every metric as a dictionary.
+
+    Returns:
+        dict[str, int | dict[str, float]]: The value of each counter and the `Histogram.summary()` of each
+            histogram, keyed by Prometheus series name (the metric name followed by its labels, if any).
+    """
+    return {
+        _series(metric.name, metric.labels): metric.value if isinstance(metric, Counter) else metric.summary()
+        for metric in _REGISTRY
+    }
+
+
+def to_prometheus() -> str:
+    """Export every metric in the Prometheus text exposition format.
+
+    Histograms are exported with one cumulative ``le`` bucket per non-empty HDR bucket.
+
+    Returns:
+        str: The exposition text, ending with a newline.
+    """
+    lines = []
+    described = set()
+    for metric in _REGISTRY:
+        if metric.name not in described:
+            described.add(metric.name)
+            kind = "counter" if isinstance(metric, Counter) else "histogram"
+            lines += [f"# HELP {metric.name} {metric.help}", f"# TYPE {metric.name} {kind}"]
+        if isinstance(metric, Counter):
+            lines.append(f"{_series(metric.name, metric.labels)} {metric.value}")
+            continue
+        summary = metric.summary()
+        for bound, count in metric.buckets():
+            lines.append(f"{_series(metric.name + '_bucket', {**metric.labels, 'le': repr(bound)})} {count}")
+        lines.append(f"{_series(metric.name + '_bucket', {**metric.labels, 'le': '+Inf'})} {summary['count']}")
+        lines.append(f"{_series(metric.name + '_sum', metric.labels)} {summary['sum']!r}")
+        lines.append(f"{_series(metric.name + '_count', metric.labels)} {summary['count']}")
+    return "\n".join(lines) + "\n"
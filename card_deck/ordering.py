@@ -0,0 +1,186 @@
+"""See Description below.
+
+Module Name: ordering.py
+
+Description:
+This module sorts and groups hands of cards without per-card key tuples. Every common ordering of cards is a
+permutation of the 52 card encodings, so each one is precomputed as a table mapping an encoding to its sort key in
+the range 0..51. A key lookup is one index into a tuple of small ints, and with only 52 distinct keys a hand is
+sorted by counting sort in O(n) instead of comparing ``(rank, suite)`` tuples built for every card.
+
+The orderings are rank-major (by rank, then suite) and suite-major (by suite, then rank), each with the ace low
+(below the two, as in the card encoding) or high (above the king). Plain ``sorted(cards)`` uses the rank-major,
+ace-low order of the encoding itself.
+
+Classes:
+    - SortOrder: Enum of the precomputed card orderings.
+
+Functions:
+    - sort_key: Get the key function of an ordering, for ``sorted`` or ``min``/``max``.
+    - sort_hand: Sort cards by counting sort.
+    - group_by_suite: Group cards by suite.
+    - group_by_rank: Group cards by rank.
+
+Usage:
+Sort a hand high card first and find its flush draws::
+
+    hand = sort_hand(cards, SortOrder.RANK_ACE_HIGH, reverse=True)
+    draws = [suited for suited in group_by_suite(hand).values() if len(suited) >= 4]
+"""
+from collections.abc import Callable
+from collections.abc import Iterable
+from enum import Enum
+
+from card_deck.card import CARD_COUNT
+from card_deck.card import RANK_COUNT
+from card_deck.card import RANK_SHIFT
+from card_deck.card import SUITE_MASK
+from card_deck.card import Card
+from card_deck.card import Rank
+from card_deck.card import Suite
+
+
+class SortOrder(Enum):
+    """Enumeration of the precomputed card orderings.
+
+    Attributes:
+        RANK_ACE_LOW: By rank with the ace lowest, then by suite; the order of the card encoding.
+        RANK_ACE_HIGH: By rank with the ace highest, then by suite.
+        SUITE_ACE_LOW: By suite, then by rank with the ace lowest.
+        SUITE_ACE_HIGH: By suite, then by rank with the ace highest.
+    """
+    RANK_ACE_LOW = 1
+    RANK_ACE_HIGH = 2
+    SUITE_ACE_LOW = 3
+    SUITE_ACE_HIGH = 4
+
+
+def _build_keys(suite_major: bool, ace_high: bool) -> tuple[int, ...]:
+    """Build the table of the sort key of every card encoding for an ordering.
+
+    Args:
+        suite_major (bool): Order by suite first instead of rank first.
+        ace_high (bool): Order the ace above the king instead of below the two.
+
+    Returns:
+        tuple[int, ...]: The sort keys in the range 0..51, indexed by card encoding.
+    """
+    keys = []
+    for code in range(CARD_COUNT):
+        suite, rank = code & SUITE_MASK, code >> RANK_SHIFT
+        if ace_high:
+            rank = (rank - 1) % RANK_COUNT
+        keys.append(suite * RANK_COUNT + rank if suite_major else rank << RANK_SHIFT | suite)
+    return tuple(keys)
+
+
+SORT_KEYS: dict[SortOrder, tuple[int, ...]] = {
+    SortOrder.RANK_ACE_LOW: _build_keys(suite_major=False, ace_high=False),
+    SortOrder.RANK_ACE_HIGH: _build_keys(suite_major=False, ace_high=True),
+    SortOrder.SUITE_ACE_LOW: _build_keys(suite_major=True, ace_high=False),
+    SortOrder.SUITE_ACE_HIGH: _build_keys(suite_major=True, ace_high=True),
+}
+
+# The ranks in ace-low and ace-high order, indexed by the rank index of the card encoding.
+_RANKS = tuple(Rank)
+_RANKS_ACE_HIGH = _RANKS[1:] + _RANKS[:1]
+
+
+def _make_key(keys: tuple[int, ...]) -> Callable[[Card], int]:
+    """Build the key function of an ordering table.
+
+    Args:
+        keys (tuple[int, ...]): The sort keys indexed by card encoding.
+
+    Returns:
+        Callable[[Card], int]: A function mapping a card to its sort key.
+    """
+    def key(card: Card) -> int:
+        code: int = card.to_int()
+        return keys[code]
+
+    return key
+
+
+_KEY_FUNCTIONS = {order: _make_key(keys) for order, keys in SORT_KEYS.items()}
+# Each ordering's keys reversed, so descending sorts stay stable.
+_REVERSED_KEYS = {order: tuple(CARD_COUNT - 1 - key for key in keys) for order, keys in SORT_KEYS.items()}
+
+
+def sort_key(order: SortOrder = SortOrder.RANK_ACE_LOW) -> Callable[[Card], int]:
+    """Get the precomputed key function of an ordering.
+
+    Args:
+        order (SortOrder): The ordering.
+
+    Returns:
+        Callable[[Card], int]: A function mapping a card to its sort key in the range 0..51.
+    """
+    return _KEY_FUNCTIONS[order]
+
+
+def sort_hand[CardT: Card](
+    cards: Iterable[CardT], order: SortOrder = SortOrder.RANK_ACE_LOW, *, reverse: bool = False
+) -> list[CardT]:
+    """Sort cards by counting sort over the 52 keys of an ordering.
+
+    The sort is stable, so equal cards of a multi-deck shoe keep their relative order, as with ``sorted``. Its
+    cost is linear in the number of cards plus a fixed pass over the 52 keys, so for a few cards
+    ``sorted(cards, key=sort_key(order))`` is as fast.
+
+    Args:
+        cards (Iterable[CardT]): The cards to sort.
+        order (SortOrder): The ordering.
+        reverse (bool): Sort in descending order.
+
+    Returns:
+        list[CardT]: A new list of the cards in order.
+    """
+    keys = (_REVERSED_KEYS if reverse else SORT_KEYS)[order]
+    hand = cards if isinstance(cards, list) else list(cards)
+    # Count the cards of each key, then turn the counts into the first output position of each key.
+    starts = [0] * (CARD_COUNT + 1)
+    for card in hand:
+        starts[keys[card.to_int()] + 1] += 1
+    for index in range(1, CARD_COUNT):
+        starts[index] += starts[index - 1]
+    result = hand.copy()
+    for card in hand:
+        key = keys[card.to_int()]
+        result[starts[key]] = card
+        starts[key] += 1
+    return result
+
+
+def group_by_suite[CardT: Card](cards: Iterable[CardT]) -> dict[Suite, list[CardT]]:
+    """Group cards by suite in one pass.
+
+    Args:
+        cards (Iterable[CardT]): The cards to group.
+
+    Returns:
+        dict[Suite, list[CardT]]: The cards of each suite present, in input order, keyed in `Suite` order.
+    """
+    groups: list[list[CardT]] = [[] for _ in Suite]
+    for card in cards:
+        groups[card.to_int() & SUITE_MASK].append(card)
+    return {suite: group for suite, group in zip(Suite, groups) if group}
+
+
+def group_by_rank[CardT: Card](cards: Iterable[CardT], *, ace_high: bool = False) -> dict[Rank, list[CardT]]:
+    """Group cards by rank in one pass.
+
+    Args:
+        cards (Iterable[CardT]): The cards to group.
+        ace_high (bool): Key the groups with the ace after the king instead of before the two.
+
+    Returns:
+        dict[Rank, list[CardT]]: The cards of each rank present, in input order, keyed in rank order.
+    """
+    groups: list[list[CardT]] = [[] for _ in Rank]
+    for card in cards:
+        groups[card.to_int() >> RANK_SHIFT].append(card)
+    if ace_high:
+        groups.append(groups.pop(0))
+        return {rank: group for rank, group in zip(_RANKS_ACE_HIGH, groups) if group}
+    return {rank: group for rank, group in zip(_RANKS, groups) if group}
@@ -0,0 +1,295 @@
+"""See Description below.
+
+Module Name: pool.py
+
+Description:
+This module provides `DeckPool`, a pool of ready-shuffled decks for loops that need a fresh deck between every
+hand. Shuffled decks wait in a fixed-capacity ring buffer. `acquire()` takes the oldest one, and `release()`
+hands a played deck back to be reset (`Deck.reset()`), reshuffled in place and put back in the ring, so the pool
+keeps reusing the same `Deck` objects and their card storage instead of allocating new ones.
+
+By default a background thread keeps the ring full. Without it, call `refill()` at a convenient moment, e.g.
+while players act. When the ring is empty, `acquire()` shuffles a deck on the caller's thread and counts a miss.
+Counters for hits, misses, allocations and refill lag (the time a released deck waits before it is ready again)
+are exposed through `stats()` for monitoring.
+
+Classes:
+    - PoolStats: A snapshot of the pool counters.
+    - DeckPool: A ring buffer of ready-shuffled decks refilled in the background.
+
+Usage:
+Take a shuffled deck for each hand and give it back afterwards::
+
+    with DeckPool(capacity=8, seed=7) as pool:
+        deck = pool.acquire()
+        hole_cards = deck.draw(2)
+        ...
+        pool.release(deck)
+"""
+import random
+import threading
+import time
+from collections import deque
+from types import TracebackType
+from typing import NamedTuple
+from typing import Self
+from typing import cast
+
+from card_deck import trace
+from card_deck.deck import Deck
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import InvalidDeck
+
+DEFAULT_CAPACITY = 8
+
+
+class PoolStats(NamedTuple):
+    """A snapshot of the counters of a `DeckPool`.
+
+    Attributes:
+        acquires (int): The number of decks handed out.
+        hits (int): The acquires served from the ring.
+        misses (int): The acquires that shuffled on the caller's thread.
+        hit_rate (float): The fraction of acquires that were hits; 1.0 before the first acquire.
+        allocations (int): The number of `Deck` objects the pool created.
+        refills (int): The number of released decks reshuffled into the ring.
+        ready (int): The number of decks in the ring now.
+        mean_refill_lag (float): The mean seconds between a deck's release and its return to the ring.
+        max_refill_lag (float): The longest such time, in seconds.
+    """
+    acquires: int
+    hits: int
+    misses: int
+    hit_rate: float
+    allocations: int
+    refills: int
+    ready: int
+    mean_refill_lag: float
+    max_refill_lag: float
+
+
+class DeckPool:  # pylint: disable=too-many-instance-attributes
+    """A fixed-capacity ring buffer of ready-shuffled decks, refilled from released decks.
+
+    Attributes:
+        _decks (int): The number of standard decks per shoe.
+        _seed (int | None): The base seed of the decks' RNGs, None for unpredictable shuffles.
+        _ring (list[Deck | None]): The ring buffer of shuffled decks.
+        _head (int): The ring index of the oldest ready deck.
+        _ready (int): The number of decks in the ring.
+        _filling (int): The number of ring slots reserved by decks being shuffled.
+        _released (deque[tuple[Deck, float]]): Released decks waiting to be reshuffled, with their release time.
+        _checked_out (dict[int, Deck]): The decks handed out and not yet released, by `id()`.
+        _condition (threading.Condition): Guards the pool state and wakes the refill thread.
+        _worker (threading.Thread | None): The background refill thread.
+        _closed (bool): Whether the pool has been closed.
+    """
+
+    def __init__(
+        self, capacity: int = DEFAULT_CAPACITY, decks: int = 1, *, seed: int | None = None, background: bool = True
+    ):
+        """Initialize a DeckPool and allocate its decks.
+
+        Args:
+            capacity (int): The number of ready decks the ring holds.
+            decks (int): The number of standard decks per shoe.
+            seed (int | None): A base seed; deck ``i`` of the pool shuffles with an RNG seeded from it and ``i``.
+            background (bool): Refill the ring on a background thread; otherwise call `refill()`.
+
+        Raises:
+            CardDeckValueError: If `capacity` is not positive.
+            InvalidDeck: If `decks` is not a positive integer.
+        """
+        if capacity < 1:
+            raise CardDeckValueError(f"Invalid pool capacity: {capacity}")
+        self._decks = decks
+        self._seed = seed
+        self._ring: list[Deck | None] = [None] * capacity
+        self._head = 0
+        self._ready = 0
+        self._filling = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._acquires = self._hits = self._allocations = self._refills = 0
+        self._lag_total = self._lag_max = 0.0
+        now = time.perf_counter()
+        self._released: deque[tuple[Deck, float]] = deque((self._allocate(), now) for _ in range(capacity))
+        self._checked_out: dict[int, Deck] = {}
+        self._worker: threading.Thread | None = None
+        if background:
+            self._worker = threading.Thread(target=self._run, name="card_deck-pool", daemon=True)
+            self._worker.start()
+
+    @property
+    def capacity(self) -> int:
+        """Get the number of ready decks the ring holds.
+
+        Returns:
+            int: The ring capacity.
+        """
+        return len(self._ring)
+
+    def _allocate(self) -> Deck:
+        """Create a new deck with its own RNG.
+
+        Returns:
+            Deck: The unshuffled deck.
+
+        Raises:
+            InvalidDeck: If the pool's deck count is invalid.
+        """
+        seed = None if self._seed is None else f"{self._seed}/{self._allocations}"
+        self._allocations += 1
+        return Deck(self._decks, rng=random.Random(seed))
+
+    def acquire(self) -> Deck:
+        """Take a shuffled deck, from the ring if one is ready.
+
+        Returns:
+            Deck: A freshly shuffled deck; hand it back with `release()` when done.
+
+        Raises:
+            InvalidDeck: If the pool is closed.
+        """
+        with self._condition:
+            if self._closed:
+                raise InvalidDeck("The deck pool is closed")
+            self._acquires += 1
+            if self._ready:
+                deck = cast(Deck, self._ring[self._head])
+                self._ring[self._head] = None
+                self._head = (self._head + 1) % len(self._ring)
+                self._ready -= 1
+                self._hits += 1
+                self._checked_out[id(deck)] = deck
+                self._condition.notify()
+                return deck
+            deck = self._released.pop()[0] if self._released else self._allocate()
+            self._checked_out[id(deck)] = deck
+        # A miss: shuffle on the caller's thread, outside the lock.
+        if trace.ENABLED:
+            trace.emit(__name__, "pool.miss", acquires=self._acquires)
+        deck.reset()
+        deck.shuffle()
+        return deck
+
+    def release(self, deck: Deck) -> None:
+        """Hand a deck back to be reshuffled into the ring.
+
+        Args:
+            deck (Deck): A deck taken from this pool with `acquire()`.
+
+        Returns:
+            None
+
+        Raises:
+            InvalidDeck: If the deck does not have the pool's number of decks.
+            CardDeckValueError: If the deck is not checked out of this pool, e.g. it was already released.
+        """
+        if deck.decks != self._decks:
+            raise InvalidDeck(f"Cannot pool a shoe of {deck.decks} deck(s) with shoes of {self._decks}")
+        with self._condition:
+            # A deck released twice would sit in the ring twice and be handed to two callers at once.
+            if self._checked_out.pop(id(deck), None) is not deck:
+                raise CardDeckValueError("The deck was not acquired from this pool or was already released")
+            self._released.append((deck, time.perf_counter()))
+            self._condition.notify()
+
+    def _refill_one(self) -> bool:
+        """Reshuffle one released deck into the ring if there is room.
+
+        Returns:
+            bool: True if a deck was added to the ring.
+        """
+        with self._condition:
+            if self._closed or not self._released or self._ready + self._filling == len(self._ring):
+                return False
+            # Reserve the ring slot while the deck is shuffled outside the lock.
+            self._filling += 1
+            deck, released_at = self._released.popleft()
+        deck.reset()
+        deck.shuffle()
+        with self._condition:
+            self._filling -= 1
+            if self._closed:
+                return False
+            self._ring[(self._head + self._ready) % len(self._ring)] = deck
+            self._ready += 1
+            self._refills += 1
+            lag = time.perf_counter() - released_at
+            self._lag_total += lag
+            self._lag_max = max(self._lag_max, lag)
+        return True
+
+    def refill(self) -> int:
+        """Reshuffle released decks into the ring until it is full or no released deck is left.
+
+        Returns:
+            int: The number of decks added to the ring.
+        """
+        added = 0
+        while self._refill_one():
+            added += 1
+        return added
+
+    def _run(self) -> None:
+        """Refill the ring whenever a slot and a released deck are available; runs on the refill thread.
+
+        Returns:
+            None
+        """
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or (bool(self._released) and self._ready + self._filling < len(self._ring))
+                )
+                if self._closed:
+                    return
+            self.refill()
+
+    def stats(self) -> PoolStats:
+        """Get a snapshot of the pool counters.
+
+        Returns:
+            PoolStats: The counters.
+        """
+        with self._condition:
+            hit_rate = self._hits / self._acquires if self._acquires else 1.0
+            mean_lag = self._lag_total / self._refills if self._refills else 0.0
+            return PoolStats(self._acquires, self._hits, self._acquires - self._hits, hit_rate, self._allocations,
+                             self._refills, self._ready, mean_lag, self._lag_max)
+
+    def close(self) -> None:
+        """Stop the refill thread; later acquires raise `InvalidDeck`.
+
+        Returns:
+            None
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the pool on exit.
+
+        Returns:
+            Self: This pool.
+        """
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Close the pool.
+
+        Args:
+            exc_type (type[BaseException] | None): The exception type, if one was raised.
+            exc (BaseException | None): The exception, if one was raised.
+            traceback (TracebackType | None): The exception traceback, if one was raised.
+
+        Returns:
+            None
+        """
+        self.close()
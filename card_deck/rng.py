@@ -0,0 +1,207 @@
+"""See Description below.
+
+Module Name: rng.py
+
+Description:
+This module defines the random sources used to shuffle decks. Anything with a ``shuffle(cards)`` method that
+permutes a mutable sequence in place can shuffle a `Deck`; `random.Random` already qualifies. The
+`RandomSource` protocol adds ``randbelow(n)`` for sources that also hand out uniform integers.
+
+Two backends are provided:
+    - SecureSource: a CSPRNG for regulated games. Entropy is read from ``os.urandom`` in large blocks and
+      consumed from a buffer, so a shuffle costs a fraction of a system call instead of one per swap. Each swap
+      draws the fewest whole bytes covering its range, masks them to the bit length of the range and rejects
+      values out of range, so every position is exactly equally likely.
+    - SeededSource: a fast, reproducible Mersenne Twister source for simulations; never use it for real games.
+
+Both shuffle with the Fisher-Yates algorithm: `SecureSource` runs its own loop that reads each swap straight from
+the entropy buffer, and `SeededSource` inherits ``random.Random.shuffle``.
+
+Classes:
+    - ShuffleSource: Protocol for objects that shuffle a mutable sequence in place.
+    - RandomSource: Protocol for shuffle sources that also draw uniform integers.
+    - SecureSource: A buffered ``os.urandom`` CSPRNG with unbiased rejection sampling.
+    - SeededSource: A seeded PRNG for reproducible simulations.
+
+Usage:
+Shuffle a shoe with the CSPRNG::
+
+    deck = Deck(6, rng=SecureSource())
+    deck.shuffle()
+"""
+import os
+import random
+import threading
+from collections.abc import MutableSequence
+from typing import Any
+from typing import Protocol
+from typing import runtime_checkable
+
+from card_deck.exceptions import CardDeckValueError
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+# The mask of the bit length of every byte-sized range 1..256, indexed by the range.
+_BYTE_MASKS = tuple((1 << (n - 1).bit_length()) - 1 for n in range(257))
+
+
+@runtime_checkable
+class ShuffleSource(Protocol):  # pylint: disable=too-few-public-methods
+    """Protocol for objects that shuffle a mutable sequence in place, such as `random.Random`."""
+
+    def shuffle(self, x: MutableSequence[Any]) -> None:
+        """Shuffle a mutable sequence in place."""
+
+
+@runtime_checkable
+class RandomSource(ShuffleSource, Protocol):
+    """Protocol for shuffle sources that also draw uniform integers."""
+
+    def randbelow(self, n: int) -> int:
+        """Return a uniformly random integer in the range 0..n-1."""
+
+
+def _check_range(n: int) -> None:
+    """Validate the range of a uniform draw.
+
+    Args:
+        n (int): The size of the range.
+
+    Raises:
+        CardDeckValueError: If the range is empty.
+    """
+    if n < 1:
+        raise CardDeckValueError(f"Cannot draw from an empty range: {n}")
+
+
+class SecureSource:
+    """A CSPRNG reading ``os.urandom`` in large blocks and drawing from the buffered bytes.
+
+    A source can be shared between threads; a lock ensures no buffered byte is used twice.
+
+    Attributes:
+        _block_size (int): The number of bytes read from ``os.urandom`` at a time.
+        _buffer (bytes): The current block of entropy.
+        _position (int): The index of the next unused byte of the buffer.
+        _lock (threading.Lock): Guards the buffer.
+    """
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        """Initialize a SecureSource with an empty buffer.
+
+        Args:
+            block_size (int): The number of bytes read from ``os.urandom`` at a time.
+
+        Raises:
+            CardDeckValueError: If the block size is not positive.
+        """
+        if block_size < 1:
+            raise CardDeckValueError(f"Invalid entropy block size: {block_size}")
+        self._block_size = block_size
+        self._buffer = b""
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def _draw(self, n: int) -> int:
+        """Draw a uniform integer below `n` from the buffer; the lock must be held.
+
+        Args:
+            n (int): The size of the range.
+
+        Returns:
+            int: An integer in the range 0..n-1.
+        """
+        bits = (n - 1).bit_length()
+        size, mask = (bits + 7) // 8, (1 << bits) - 1
+        while True:
+            if self._position + size > len(self._buffer):
+                self._buffer = self._buffer[self._position:] + os.urandom(max(self._block_size, size))
+                self._position = 0
+            value = int.from_bytes(self._buffer[self._position:self._position + size], "little") & mask
+            self._position += size
+            if value < n:
+                return value
+
+    def randbelow(self, n: int) -> int:
+        """Return a uniformly random integer in the range 0..n-1.
+
+        Args:
+            n (int): The size of the range.
+
+        Returns:
+            int: The random integer.
+
+        Raises:
+            CardDeckValueError: If `n` is not positive.
+        """
+        _check_range(n)
+        with self._lock:
+            return self._draw(n)
+
+    def shuffle(self, x: MutableSequence[Any]) -> None:
+        """Shuffle a sequence in place with Fisher-Yates, drawing swaps from the entropy buffer.
+
+        Ranges of up to 65,536 items, i.e. every swap of any practical shoe, take one or two buffered bytes per
+        draw, read inline; larger ranges go through the generic draw.
+
+        Args:
+            x (MutableSequence[Any]): The sequence to shuffle.
+
+        Returns:
+            None
+        """
+        masks = _BYTE_MASKS
+        with self._lock:
+            buffer, position = self._buffer, self._position
+            for i in range(len(x) - 1, 0, -1):
+                n = i + 1
+                if n <= 256:
+                    mask = masks[n]
+                    while True:
+                        if position == len(buffer):
+                            buffer, position = os.urandom(self._block_size), 0
+                        j = buffer[position] & mask
+                        position += 1
+                        if j < n:
+                            break
+                elif n <= 65536:
+                    mask = (1 << (n - 1).bit_length()) - 1
+                    while True:
+                        if position + 2 > len(buffer):
+                            buffer, position = buffer[position:] + os.urandom(self._block_size), 0
+                        j = (buffer[position] | buffer[position + 1] << 8) & mask
+                        position += 2
+                        if j < n:
+                            break
+                else:
+                    self._buffer, self._position = buffer, position
+                    j = self._draw(n)
+                    buffer, position = self._buffer, self._position
+                x[i], x[j] = x[j], x[i]
+            self._buffer, self._position = buffer, position
+
+
+class SeededSource(random.Random):
+    """A seeded Mersenne Twister source for reproducible simulations; not suitable for real-money games.
+
+    It is a `random.Random`, so its shuffles match those of ``random.Random(seed)``.
+    """
+
+    def randbelow(self, n: int) -> int:
+        """Return a uniformly random integer in the range 0..n-1.
+
+        Args:
+            n (int): The size of the range.
+
+        Returns:
+            int: The random integer.
+
+        Raises:
+            CardDeckValueError: If `n` is not positive.
+        """
+        _check_range(n)
+        bits = n.bit_length()
+        value = self.getrandbits(bits)
+        while value >= n:
+            value = self.getrandbits(bits)
+        return value
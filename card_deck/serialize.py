@@ -0,0 +1,600 @@
+"""See Description below.
+
+Module Name: serialize.py
+
+Description:
+This module defines a compact, versioned binary format for dealt cards: deck orders, shoes and hand histories.
+A file is a fixed 24-byte header followed by fixed-size records, one per deck or hand. Each record holds the
+canonical encodings (see `card_deck.card`) of the same number of cards, either one byte per card or packed to
+six bits per card (four cards in three bytes), padded to a whole byte.
+
+Header layout (little-endian)::
+
+    offset  size  field
+    0       4     magic, b"CDHH"
+    4       1     format version (FORMAT_VERSION)
+    5       1     packing: 0 = one byte per card, 1 = six bits per card
+    6       1     flags: bit 0 set when a seed is stored
+    7       1     reserved, 0
+    8       4     number of standard decks the cards came from
+    12      4     cards per record
+    16      8     seed of the shuffle RNG, unsigned
+
+Because records have a fixed size, record ``i`` starts at ``HEADER_SIZE + i * record_bytes``. `HandReader` works
+directly on any buffer (``bytes``, ``memoryview`` or an ``mmap`` of a multi-gigabyte file), returning zero-copy
+`memoryview` slices of the stored records; nothing is turned into `Card` objects unless asked for.
+
+Classes:
+    - HandWriter: Stream fixed-size card records to a binary file.
+    - HandReader: Read card records from a buffer or memory-mapped file.
+
+Functions:
+    - dump_deck: Serialize the undealt cards of a `Deck`.
+    - load_deck: Rebuild a `Deck` from its serialized form.
+
+Usage:
+Write hands as they are dealt, then scan the file later through a memory map::
+
+    with HandWriter.open("hands.cdh", record_size=23, seed=seed, packed=True) as writer:
+        writer.write(deck.draw(23))
+
+    with HandReader.open("hands.cdh") as reader:
+        for hand in reader:
+            ...
+
+Use `HandWriter.append_to()` to add records to an existing file.
+"""
+import io
+import mmap
+import random
+import struct
+from collections.abc import Iterable
+from collections.abc import Iterator
+from os import PathLike
+from types import TracebackType
+from typing import TYPE_CHECKING
+from typing import BinaryIO
+from typing import Self
+
+from card_deck.card import CARD_COUNT
+from card_deck.deck import Deck
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidFormat
+from card_deck.exceptions import InvalidHand
+
+if TYPE_CHECKING:
+    from card_deck.rng import ShuffleSource
+
+FORMAT_VERSION = 1
+MAGIC = b"CDHH"
+HEADER = struct.Struct("<4sBBBxIIQ")
+HEADER_SIZE = HEADER.size
+CODE_BITS = 6
+
+_BYTES = 0
+_PACKED = 1
+_HAS_SEED = 1
+_MAX_SEED = (1 << 64) - 1
+_VALID_CODES = bytes(range(CARD_COUNT))
+
+
+def _record_bytes(record_size: int, packed: bool) -> int:
+    """Get the stored size of a record.
+
+    Args:
+        record_size (int): The number of cards per record.
+        packed (bool): Whether cards are packed to six bits.
+
+    Returns:
+        int: The number of bytes per record.
+    """
+    return (record_size * CODE_BITS + 7) // 8 if packed else record_size
+
+
+def _pack(codes: bytes, size: int) -> bytes:
+    """Pack card encodings to six bits each, first card in the lowest bits.
+
+    Args:
+        codes (bytes): The card encodings.
+        size (int): The number of bytes of the packed record.
+
+    Returns:
+        bytes: The packed record.
+    """
+    value = 0
+    for code in reversed(codes):
+        value = value << CODE_BITS | code
+    return value.to_bytes(size, "little")
+
+
+# The two six-bit encodings held in every 12-bit value, first card in the lowest bits.
+_PAIRS = tuple(bytes((pair & 0x3F, pair >> CODE_BITS)) for pair in range(1 << 2 * CODE_BITS))
+
+
+def _unpack(raw: bytes | memoryview, record_size: int) -> bytes:
+    """Unpack a record of six-bit card encodings, two cards per table lookup.
+
+    Args:
+        raw (bytes | memoryview): The packed record.
+        record_size (int): The number of cards in the record.
+
+    Returns:
+        bytes: The card encodings.
+    """
+    value = int.from_bytes(raw, "little")
+    pairs = _PAIRS
+    codes = b"".join([pairs[(value >> shift) & 0xFFF] for shift in range(0, record_size * CODE_BITS, 2 * CODE_BITS)])
+    return codes[:record_size]
+
+
+class HandWriter:
+    """Stream fixed-size records of encoded cards to a binary file.
+
+    The header is written on construction and every record straight after, so the output can be read back at
+    any point once the stream is flushed.
+
+    Attributes:
+        _stream (BinaryIO): The output stream.
+        _owned (bool): Whether the writer opened the stream and must close it.
+        _record_size (int): The number of cards per record.
+        _record_bytes (int): The number of bytes per stored record.
+        _packed (bool): Whether cards are packed to six bits.
+        _count (int): The number of records written.
+    """
+
+    def __init__(
+        self, stream: BinaryIO, record_size: int, *, decks: int = 1, seed: int | None = None, packed: bool = False
+    ):
+        """Initialize a HandWriter and write the file header.
+
+        Args:
+            stream (BinaryIO): A binary stream opened for writing.
+            record_size (int): The number of cards per record, e.g. 52 for a deck or 23 for a nine-handed deal.
+            decks (int): The number of standard decks the cards come from.
+            seed (int | None): The seed of the RNG that shuffled the cards, if it should be stored.
+            packed (bool): Pack cards to six bits instead of one byte each.
+
+        Raises:
+            InvalidFormat: If the record size, deck count or seed cannot be stored.
+        """
+        if not 0 < record_size <= 0xFFFFFFFF or not 0 < decks <= 0xFFFFFFFF:
+            raise InvalidFormat(f"Invalid record size {record_size} or deck count {decks}")
+        if seed is not None and not 0 <= seed <= _MAX_SEED:
+            raise InvalidFormat(f"The seed must be an unsigned 64-bit integer: {seed}")
+        self._stream = stream
+        self._owned = False
+        self._record_size = record_size
+        self._packed = packed
+        self._record_bytes = _record_bytes(record_size, packed)
+        self._count = 0
+        flags = _HAS_SEED if seed is not None else 0
+        stream.write(HEADER.pack(MAGIC, FORMAT_VERSION, _PACKED if packed else _BYTES, flags, decks, record_size,
+                                 seed or 0))
+
+    @classmethod
+    def open(
+        cls,
+        path: str | PathLike[str],
+        record_size: int,
+        *,
+        decks: int = 1,
+        seed: int | None = None,
+        packed: bool = False,
+    ) -> "HandWriter":
+        """Create a file and a HandWriter that closes it when the writer is closed.
+
+        Args:
+            path (str | PathLike[str]): The file to create or overwrite.
+            record_size (int): The number of cards per record.
+            decks (int): The number of standard decks the cards come from.
+            seed (int | None): The seed of the RNG that shuffled the cards, if it should be stored.
+            packed (bool): Pack cards to six bits instead of one byte each.
+
+        Returns:
+            HandWriter: The writer.
+        """
+        # The handle outlives this call: the writer owns it and closes it, so it is only closed here on failure.
+        stream = open(path, "wb")  # noqa: SIM115  # pylint: disable=consider-using-with
+        try:
+            writer = cls(stream, record_size, decks=decks, seed=seed, packed=packed)
+        except BaseException:
+            stream.close()
+            raise
+        writer._owned = True
+        return writer
+
+    @classmethod
+    def append_to(cls, path: str | PathLike[str]) -> "HandWriter":
+        """Open an existing file to append records in its format.
+
+        Args:
+            path (str | PathLike[str]): A file written by a HandWriter.
+
+        Returns:
+            HandWriter: A writer that continues the file and closes it when the writer is closed.
+
+        Raises:
+            InvalidFormat: If the file is malformed.
+        """
+        with HandReader.open(path) as reader:
+            record_size, packed, count = reader.record_size, reader.packed, len(reader)
+        # The handle outlives this call: the writer owns it and closes it, so it is only closed here on failure.
+        stream = open(path, "ab")  # noqa: SIM115  # pylint: disable=consider-using-with
+        try:
+            writer = object.__new__(cls)
+            writer._stream = stream
+            writer._owned = True
+            writer._record_size = record_size
+            writer._packed = packed
+            writer._record_bytes = _record_bytes(record_size, packed)
+            writer._count = count
+        except BaseException:
+            stream.close()
+            raise
+        return writer
+
+    @property
+    def count(self) -> int:
+        """Get the number of records in the output, including any the file held when appending began.
+
+        Returns:
+            int: The number of records.
+        """
+        return self._count
+
+    def write(self, codes: bytes | bytearray | memoryview | Iterable[int]) -> None:
+        """Write one record.
+
+        Args:
+            codes (bytes | bytearray | memoryview | Iterable[int]): The card encodings, e.g. from `Deck.draw()`.
+
+        Returns:
+            None
+
+        Raises:
+            InvalidHand: If the record does not hold `record_size` cards.
+            InvalidCard: If an encoding is not in the range 0..51.
+        """
+        try:
+            record = bytes(codes)
+        except (TypeError, ValueError):
+            raise InvalidCard("Card encodings must be integers in the range 0..51") from None
+        if len(record) != self._record_size:
+            raise InvalidHand(f"Expected {self._record_size} card(s) per record, got {len(record)}")
+        if record.translate(None, _VALID_CODES):
+            raise InvalidCard("Card encodings must be integers in the range 0..51")
+        self._stream.write(_pack(record, self._record_bytes) if self._packed else record)
+        self._count += 1
+
+    def write_many(self, records: Iterable[bytes | bytearray | memoryview | Iterable[int]]) -> None:
+        """Write several records.
+
+        Args:
+            records (Iterable[bytes | bytearray | memoryview | Iterable[int]]): The records, in order.
+
+        Returns:
+            None
+
+        Raises:
+            InvalidHand: If a record does not hold `record_size` cards.
+            InvalidCard: If an encoding is not in the range 0..51.
+        """
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        """Flush the output stream.
+
+        Returns:
+            None
+        """
+        self._stream.flush()
+
+    def close(self) -> None:
+        """Flush the output, closing the stream if the writer opened it.
+
+        Returns:
+            None
+        """
+        if self._owned:
+            self._stream.close()
+        elif not self._stream.closed:
+            self._stream.flush()
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the writer on exit.
+
+        Returns:
+            Self: This writer.
+        """
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Close the writer.
+
+        Args:
+            exc_type (type[BaseException] | None): The exception type, if one was raised.
+            exc (BaseException | None): The exception, if one was raised.
+            traceback (TracebackType | None): The exception traceback, if one was raised.
+
+        Returns:
+            None
+        """
+        self.close()
+
+
+class HandReader:  # pylint: disable=too-many-instance-attributes
+    """Read fixed-size records of encoded cards from a buffer or memory-mapped file.
+
+    Attributes:
+        _view (memoryview): The whole serialized data.
+        _mmap (mmap.mmap | None): The memory map backing the view, when the reader opened a file.
+        _version (int): The format version.
+        _packed (bool): Whether cards are packed to six bits.
+        _decks (int): The number of standard decks the cards came from.
+        _seed (int | None): The stored seed, if any.
+        _record_size (int): The number of cards per record.
+        _record_bytes (int): The number of bytes per stored record.
+        _count (int): The number of records.
+    """
+
+    def __init__(self, buffer: bytes | bytearray | memoryview | mmap.mmap):
+        """Initialize a HandReader over serialized data without copying it.
+
+        Args:
+            buffer (bytes | bytearray | memoryview | mmap.mmap): The serialized data.
+
+        Raises:
+            InvalidFormat: If the header is malformed or the data does not hold a whole number of records.
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) < HEADER_SIZE:
+            raise InvalidFormat("The data is too short to hold a header")
+        magic, version, packing, flags, decks, record_size, seed = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise InvalidFormat(f"Unknown file signature: {magic!r}")
+        if version != FORMAT_VERSION:
+            raise InvalidFormat(f"Unsupported format version: {version}")
+        if packing not in (_BYTES, _PACKED) or not record_size:
+            raise InvalidFormat(f"Invalid packing {packing} or record size {record_size}")
+        self._view = view
+        self._mmap: mmap.mmap | None = None
+        self._version: int = version
+        self._packed: bool = packing == _PACKED
+        self._decks: int = decks
+        self._seed: int | None = seed if flags & _HAS_SEED else None
+        self._record_size: int = record_size
+        self._record_bytes = _record_bytes(record_size, self._packed)
+        self._count, extra = divmod(len(view) - HEADER_SIZE, self._record_bytes)
+        if extra:
+            raise InvalidFormat(f"The data ends with a partial record of {extra} byte(s)")
+
+    @classmethod
+    def open(cls, path: str | PathLike[str]) -> "HandReader":
+        """Memory-map a file and create a HandReader over it.
+
+        Args:
+            path (str | PathLike[str]): The file to read.
+
+        Returns:
+            HandReader: A reader that unmaps the file when closed.
+
+        Raises:
+            InvalidFormat: If the file is malformed.
+        """
+        with open(path, "rb") as stream:
+            try:
+                mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise InvalidFormat("The data is too short to hold a header") from None
+        try:
+            reader = cls(mapped)
+        except BaseException:
+            mapped.close()
+            raise
+        reader._mmap = mapped
+        return reader
+
+    @property
+    def version(self) -> int:
+        """Get the format version of the data.
+
+        Returns:
+            int: The format version.
+        """
+        return self._version
+
+    @property
+    def packed(self) -> bool:
+        """Get whether cards are packed to six bits.
+
+        Returns:
+            bool: True for six-bit packing, False for one byte per card.
+        """
+        return self._packed
+
+    @property
+    def decks(self) -> int:
+        """Get the number of standard decks the cards came from.
+
+        Returns:
+            int: The number of decks.
+        """
+        return self._decks
+
+    @property
+    def seed(self) -> int | None:
+        """Get the stored seed of the shuffle RNG.
+
+        Returns:
+            int | None: The seed, or None if none was stored.
+        """
+        return self._seed
+
+    @property
+    def record_size(self) -> int:
+        """Get the number of cards per record.
+
+        Returns:
+            int: The number of cards.
+        """
+        return self._record_size
+
+    @property
+    def record_bytes(self) -> int:
+        """Get the number of bytes per stored record.
+
+        Returns:
+            int: The number of bytes.
+        """
+        return self._record_bytes
+
+    def __len__(self) -> int:
+        """Return the number of records.
+
+        Returns:
+            int: The number of records.
+        """
+        return self._count
+
+    def raw(self, index: int) -> memoryview:
+        """Get a stored record without copying or decoding it.
+
+        For unpacked data the view holds the card encodings themselves.
+
+        Args:
+            index (int): The record index; negative indexes count from the end.
+
+        Returns:
+            memoryview: The stored bytes of the record.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Record index out of range: {index}")
+        start = HEADER_SIZE + index * self._record_bytes
+        return self._view[start:start + self._record_bytes]
+
+    def records(self) -> memoryview:
+        """Get the stored bytes of every record as one zero-copy view.
+
+        Record ``i`` occupies bytes ``i * record_bytes`` up to ``(i + 1) * record_bytes``, so the view can be
+        wrapped as a 2-D array with ``numpy.frombuffer(view, numpy.uint8).reshape(-1, reader.record_bytes)``.
+
+        Returns:
+            memoryview: The stored records, back to back.
+        """
+        return self._view[HEADER_SIZE:]
+
+    def __getitem__(self, index: int) -> bytes:
+        """Get the card encodings of a record.
+
+        Args:
+            index (int): The record index; negative indexes count from the end.
+
+        Returns:
+            bytes: The card encodings of the record.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        raw = self.raw(index)
+        return _unpack(raw, self._record_size) if self._packed else bytes(raw)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the card encodings of every record.
+
+        Yields:
+            bytes: The card encodings of each record, in file order.
+        """
+        view, size, step = self._view, self._record_size, self._record_bytes
+        for start in range(HEADER_SIZE, HEADER_SIZE + self._count * step, step):
+            raw = view[start:start + step]
+            yield _unpack(raw, size) if self._packed else bytes(raw)
+
+    def close(self) -> None:
+        """Release the buffer, unmapping the file if the reader opened it.
+
+        Views returned by `raw()` or `records()` stay valid; a file they still reference is unmapped once the
+        last of them is released.
+
+        Returns:
+            None
+        """
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+            self._mmap = None
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the reader on exit.
+
+        Returns:
+            Self: This reader.
+        """
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Close the reader.
+
+        Args:
+            exc_type (type[BaseException] | None): The exception type, if one was raised.
+            exc (BaseException | None): The exception, if one was raised.
+            traceback (TracebackType | None): The exception traceback, if one was raised.
+
+        Returns:
+            None
+        """
+        self.close()
+
+
+def dump_deck(deck: Deck, *, seed: int | None = None, packed: bool = False) -> bytes:
+    """Serialize the undealt cards of a deck as a single-record file.
+
+    Args:
+        deck (Deck): The deck or shoe; at least one card must remain.
+        seed (int | None): The seed of the deck's RNG, if it should be stored.
+        packed (bool): Pack cards to six bits instead of one byte each.
+
+    Returns:
+        bytes: The serialized deck.
+
+    Raises:
+        InvalidFormat: If the deck is empty or the seed cannot be stored.
+    """
+    stream = io.BytesIO()
+    HandWriter(stream, len(deck), decks=deck.decks, seed=seed, packed=packed).write(deck.remaining)
+    return stream.getvalue()
+
+
+def load_deck(data: bytes | bytearray | memoryview | mmap.mmap, *, rng: "ShuffleSource | None" = None) -> Deck:
+    """Rebuild a deck from the output of `dump_deck()`.
+
+    Args:
+        data (bytes | bytearray | memoryview | mmap.mmap): The serialized deck.
+        rng (ShuffleSource | None): The random source of the new deck; by default, an RNG seeded with the stored
+            seed.
+
+    Returns:
+        Deck: A deck holding the serialized cards in the same order.
+
+    Raises:
+        InvalidFormat: If the data is malformed or holds more than one record.
+        InvalidDeck: If the cards do not fit the stored deck count.
+    """
+    with HandReader(data) as reader:
+        if len(reader) != 1:
+            raise InvalidFormat(f"Expected a single deck record, found {len(reader)}")
+        if rng is None:
+            rng = random.Random(reader.seed)
+        return Deck.from_codes(reader[0], reader.decks, rng=rng)
@@ -0,0 +1,425 @@
+"""See Description below.
+
+Module Name: shared.py
+
+Description:
+This module places encoded decks and dealt hands in shared memory, so worker processes read and write them
+without pickling. A `SharedCards` block holds rows of card encodings, one byte per card, in a
+`multiprocessing.shared_memory` block. That is the layout of a `Deck` or of a `card_deck.batch` array: one deck,
+shoe or hand per row. Pickling a block sends only its name and shape. The receiving process attaches to the
+same memory, so a block passed to a `ProcessPoolExecutor` task costs a few dozen bytes of IPC whatever its size.
+
+Workers see a block through typed views: `row()` and `rows()` return `memoryview` slices of unsigned bytes, and
+`as_array()` wraps the block as an ``(rows, row_size)`` ``uint8`` NumPy array, usable with `card_deck.batch`.
+Writes through a view are visible to every process at once.
+
+A `SliceCoordinator` splits the rows of a block into contiguous slices and hands them out, one at a time with
+`next_slice()` or all at once to an executor with `map()`, returning the results in slice order.
+
+Views keep the shared memory mapped; release them (``view.release()``, or let them go out of scope) before
+closing a block. The process that creates a block owns it and unlinks it on `close()`; attached processes only
+unmap it.
+
+Classes:
+    - SharedCards: Rows of encoded cards in a shared memory block.
+    - SliceCoordinator: Hands out contiguous row slices to workers.
+
+Usage:
+Shuffle 100,000 six-deck shoes on every core, in place::
+
+    def shuffle_rows(rows: range, shoes: SharedCards, seed: int) -> None:
+        batch.shuffle(shoes.as_array()[rows.start:rows.stop], seed + rows.start)
+
+    with SharedCards.decks(100_000, decks=6) as shoes, ProcessPoolExecutor() as executor:
+        SliceCoordinator(len(shoes), 5_000).map(executor, shuffle_rows, shoes, 7)
+"""
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any
+from typing import Concatenate
+from typing import ParamSpec
+from typing import Self
+from typing import TypeVar
+
+from card_deck import trace
+from card_deck.card import CARD_COUNT
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidDeck
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_STANDARD_DECK = bytes(range(CARD_COUNT))
+
+
+class SharedCards:
+    """Rows of encoded cards in a shared memory block.
+
+    Attributes:
+        _memory (SharedMemory): The shared memory block; the OS may round its size up.
+        _rows (int): The number of rows.
+        _row_size (int): The number of cards per row.
+        _owner (bool): Whether this process created the block and unlinks it on close.
+    """
+
+    def __init__(self, memory: SharedMemory, rows: int, row_size: int, *, owner: bool):
+        """Wrap a shared memory block; use `create()`, `decks()`, `from_codes()` or `attach()` instead.
+
+        Args:
+            memory (SharedMemory): The shared memory block, at least ``rows * row_size`` bytes.
+            rows (int): The number of rows.
+            row_size (int): The number of cards per row.
+            owner (bool): Whether this process unlinks the block on close.
+        """
+        self._memory = memory
+        self._rows = rows
+        self._row_size = row_size
+        self._owner = owner
+
+    @classmethod
+    def create(cls, rows: int, row_size: int) -> "SharedCards":
+        """Create a zero-filled block.
+
+        Args:
+            rows (int): The number of rows.
+            row_size (int): The number of cards per row.
+
+        Returns:
+            SharedCards: The new block, owned by this process.
+
+        Raises:
+            CardDeckValueError: If `rows` or `row_size` is not positive.
+        """
+        if rows < 1 or row_size < 1:
+            raise CardDeckValueError(f"Invalid shared block shape: {rows} x {row_size}")
+        block = cls(SharedMemory(create=True, size=rows * row_size), rows, row_size, owner=True)
+        if trace.ENABLED:
+            trace.emit(__name__, "shared.create", name=block.name, rows=rows, row_size=row_size)
+        return block
+
+    @classmethod
+    def decks(cls, count: int, decks: int = 1) -> "SharedCards":
+        """Create a block of ordered decks, one shoe per row.
+
+        Args:
+            count (int): The number of shoes.
+            decks (int): The number of standard decks per shoe.
+
+        Returns:
+            SharedCards: The new block, owned by this process.
+
+        Raises:
+            InvalidDeck: If `decks` is not a positive integer.
+            CardDeckValueError: If `count` is not positive.
+        """
+        if not isinstance(decks, int) or decks < 1:
+            raise InvalidDeck(f"Invalid number of decks: {decks!r}")
+        row = _STANDARD_DECK * decks
+        block = cls.create(count, len(row))
+        block.buffer[:] = row * count
+        return block
+
+    @classmethod
+    def from_codes(cls, codes: bytes | bytearray | memoryview, row_size: int) -> "SharedCards":
+        """Create a block holding a copy of encoded cards.
+
+        Args:
+            codes (bytes | bytearray | memoryview): The card encodings, row after row, e.g. ``array.tobytes()``.
+            row_size (int): The number of cards per row.
+
+        Returns:
+            SharedCards: The new block, owned by this process.
+
+        Raises:
+            CardDeckValueError: If the codes do not fill whole rows.
+            InvalidCard: If a code is not a valid card encoding.
+        """
+        data = bytes(codes)
+        if row_size < 1 or not data or len(data) % row_size:
+            raise CardDeckValueError(f"{len(data)} card(s) do not fill rows of {row_size}")
+        if max(data) >= CARD_COUNT:
+            raise InvalidCard("Card encodings must be integers in the range 0..51")
+        block = cls.create(len(data) // row_size, row_size)
+        block.buffer[:] = data
+        return block
+
+    @classmethod
+    def attach(cls, name: str, rows: int, row_size: int) -> "SharedCards":
+        """Attach to a block created by another process.
+
+        Args:
+            name (str): The name of the shared memory block.
+            rows (int): The number of rows.
+            row_size (int): The number of cards per row.
+
+        Returns:
+            SharedCards: The attached block, owned by its creator.
+
+        Raises:
+            FileNotFoundError: If no block has that name.
+        """
+        return cls(SharedMemory(name=name, track=False), rows, row_size, owner=False)
+
+    def __reduce__(self) -> tuple[Callable[[str, int, int], "SharedCards"], tuple[str, int, int]]:
+        """Pickle the block as its name and shape; unpickling attaches to the same memory.
+
+        Returns:
+            tuple[Callable[[str, int, int], SharedCards], tuple[str, int, int]]: The attach function and arguments.
+        """
+        return SharedCards.attach, (self.name, self._rows, self._row_size)
+
+    def __len__(self) -> int:
+        """Return the number of rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return self._rows
+
+    def __repr__(self) -> str:
+        """Return a string representation of the block.
+
+        Returns:
+            str: The name and shape of the block.
+        """
+        return f"SharedCards(name={self.name!r}, rows={self._rows}, row_size={self._row_size})"
+
+    @property
+    def name(self) -> str:
+        """Get the name other processes attach to.
+
+        Returns:
+            str: The shared memory name.
+        """
+        return self._memory.name
+
+    @property
+    def row_size(self) -> int:
+        """Get the number of cards per row.
+
+        Returns:
+            int: The row size.
+        """
+        return self._row_size
+
+    @property
+    def owner(self) -> bool:
+        """Report whether this process created the block.
+
+        Returns:
+            bool: True if `close()` also unlinks the block.
+        """
+        return self._owner
+
+    def _view(self, start: int, stop: int) -> memoryview:
+        """Get a view of a byte range of the block.
+
+        Args:
+            start (int): The first byte.
+            stop (int): The byte after the last one.
+
+        Returns:
+            memoryview: A writable view of the bytes.
+
+        Raises:
+            CardDeckValueError: If the block is closed.
+        """
+        memory = self._memory.buf
+        if memory is None:
+            raise CardDeckValueError(f"The shared block {self.name} is closed")
+        return memory[start:stop]
+
+    @property
+    def buffer(self) -> memoryview:
+        """Get a view of every row, one byte per card.
+
+        Returns:
+            memoryview: A writable view of ``rows * row_size`` bytes.
+
+        Raises:
+            CardDeckValueError: If the block is closed.
+        """
+        return self._view(0, self._rows * self._row_size)
+
+    def _check(self, start: int, stop: int) -> None:
+        """Validate a row range.
+
+        Args:
+            start (int): The first row.
+            stop (int): The row after the last one.
+
+        Raises:
+            IndexError: If the range is outside the block.
+        """
+        if not 0 <= start <= stop <= self._rows:
+            raise IndexError(f"Rows {start}..{stop} are outside a block of {self._rows} rows")
+
+    def row(self, index: int) -> memoryview:
+        """Get a view of one row.
+
+        Args:
+            index (int): The row index.
+
+        Returns:
+            memoryview: A writable view of the row's card encodings.
+
+        Raises:
+            IndexError: If the row does not exist.
+            CardDeckValueError: If the block is closed.
+        """
+        self._check(index, index + 1)
+        return self._view(index * self._row_size, (index + 1) * self._row_size)
+
+    def rows(self, start: int, stop: int) -> memoryview:
+        """Get a view of consecutive rows.
+
+        Args:
+            start (int): The first row.
+            stop (int): The row after the last one.
+
+        Returns:
+            memoryview: A writable, flat view of the rows' card encodings.
+
+        Raises:
+            IndexError: If the range is outside the block.
+            CardDeckValueError: If the block is closed.
+        """
+        self._check(start, stop)
+        return self._view(start * self._row_size, stop * self._row_size)
+
+    def as_array(self) -> Any:
+        """Wrap the block as a NumPy array without copying; requires NumPy.
+
+        Returns:
+            numpy.ndarray: A writable ``(rows, row_size)`` ``uint8`` array over the shared memory.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        return np.frombuffer(self.buffer, dtype=np.uint8).reshape(self._rows, self._row_size)
+
+    def close(self) -> None:
+        """Unmap the block, and unlink it if this process created it.
+
+        Returns:
+            None
+
+        Raises:
+            BufferError: If views of the block are still in use.
+        """
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+            self._owner = False
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the block on exit.
+
+        Returns:
+            Self: This block.
+        """
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Close the block.
+
+        Args:
+            exc_type (type[BaseException] | None): The exception type, if one was raised.
+            exc (BaseException | None): The exception, if one was raised.
+            traceback (TracebackType | None): The exception traceback, if one was raised.
+
+        Returns:
+            None
+        """
+        self.close()
+
+
+class SliceCoordinator:
+    """Hands out contiguous slices of rows, so each worker owns the rows it writes.
+
+    Attributes:
+        _total (int): The number of rows to split.
+        _slice_size (int): The number of rows per slice; the last slice may be shorter.
+        _next (int): The first row of the next slice.
+        _lock (threading.Lock): Guards the next row.
+    """
+
+    def __init__(self, total: int, slice_size: int):
+        """Initialize a SliceCoordinator.
+
+        Args:
+            total (int): The number of rows to split, e.g. ``len(block)``.
+            slice_size (int): The number of rows per slice.
+
+        Raises:
+            CardDeckValueError: If `total` is negative or `slice_size` is not positive.
+        """
+        if total < 0 or slice_size < 1:
+            raise CardDeckValueError(f"Cannot split {total} rows into slices of {slice_size}")
+        self._total = total
+        self._slice_size = slice_size
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of slices.
+
+        Returns:
+            int: The number of slices.
+        """
+        return (self._total + self._slice_size - 1) // self._slice_size
+
+    @property
+    def remaining(self) -> int:
+        """Get the number of rows not handed out yet.
+
+        Returns:
+            int: The remaining rows.
+        """
+        return self._total - self._next
+
+    def next_slice(self) -> range | None:
+        """Hand out the next slice; safe to call from several threads.
+
+        Returns:
+            range | None: The rows of the slice, or None once every row has been handed out.
+        """
+        with self._lock:
+            start = self._next
+            if start >= self._total:
+                return None
+            self._next = min(start + self._slice_size, self._total)
+            return range(start, self._next)
+
+    def map(
+        self, executor: Executor | None, function: Callable[Concatenate[range, P], R], *args: P.args,
+        **kwargs: P.kwargs
+    ) -> list[R]:
+        """Call a function on every remaining slice, in worker processes or in this one.
+
+        Pass shared blocks as arguments: they are pickled as their names, so workers attach to them instead of
+        receiving copies.
+
+        Args:
+            executor (Executor | None): The executor running the calls, e.g. a `ProcessPoolExecutor`; None calls
+                the function in this thread.
+            function (Callable[Concatenate[range, P], R]): Called with each slice and the other arguments; it must
+                be picklable to run in another process.
+            *args (P.args): The other positional arguments.
+            **kwargs (P.kwargs): The keyword arguments.
+
+        Returns:
+            list[R]: The results, in slice order.
+        """
+        slices = iter(self.next_slice, None)
+        if trace.ENABLED:
+            trace.emit(__name__, "shared.map", slices=len(self), rows=self.remaining)
+        if executor is None:
+            return [function(rows, *args, **kwargs) for rows in slices]
+        futures = [executor.submit(function, rows, *args, **kwargs) for rows in slices]
+        return [future.result() for future in futures]
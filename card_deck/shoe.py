@@ -0,0 +1,399 @@
+"""See Description below.
+
+Module Name: shoe.py
+
+Description:
+This module provides a blackjack shoe and hand for simulations. A `Shoe` is a `Deck` of several decks that deals
+card encodings one at a time and keeps the Hi-Lo count incrementally as cards leave it. It reshuffles its own
+card storage once dealing passes the cut card at a configurable penetration, so no `Card` object is ever built.
+
+Blackjack values are precomputed per card encoding: `POINTS` holds the point value of each card (aces count 1,
+face cards 10) and `HI_LO` its Hi-Lo count tag (+1 for 2 to 6, 0 for 7 to 9, -1 for tens, faces and aces). A
+`BlackjackHand` adds its cards' points as they are dealt and keeps the hard total and whether an ace can count
+11, so the soft total is one comparison away.
+
+Classes:
+    - Shoe: A multi-deck blackjack shoe with a running Hi-Lo count and a cut card.
+    - BlackjackHand: A blackjack hand with incremental hard and soft totals.
+
+Functions:
+    - hand_total: Get the best total of encoded cards and whether it is soft.
+
+Usage:
+Play rounds until the cut card comes out::
+
+    shoe = Shoe(6, penetration=0.75, seed=1)
+    while True:
+        if shoe.start_round():
+            ...  # the shoe was reshuffled
+        bet = 10 if shoe.true_count < 2 else 50
+        player, dealer = BlackjackHand(), BlackjackHand()
+        for hand in (player, dealer, player, dealer):
+            hand.add(shoe.deal())
+        while player.total < 17:
+            player.add(shoe.deal())
+"""
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from card_deck import metrics
+from card_deck import trace
+from card_deck.card import CARD_COUNT
+from card_deck.card import RANK_SHIFT
+from card_deck.card import InternedCard
+from card_deck.deck import Deck
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import EmptyDeck
+from card_deck.exceptions import InvalidCard
+
+if TYPE_CHECKING:
+    from card_deck.rng import ShuffleSource
+
+BLACKJACK = 21
+SOFT_ACE_BONUS = 10
+DEFAULT_DECKS = 6
+DEFAULT_PENETRATION = 0.75
+
+# The point value and Hi-Lo tag of each card encoding, indexed by encoding.
+POINTS: tuple[int, ...] = tuple(min((code >> RANK_SHIFT) + 1, 10) for code in range(CARD_COUNT))
+HI_LO: tuple[int, ...] = tuple(1 if 2 <= points <= 6 else -1 if points in (1, 10) else 0 for points in POINTS)
+
+
+def hand_total(codes: Iterable[int]) -> tuple[int, bool]:
+    """Get the best blackjack total of encoded cards.
+
+    Args:
+        codes (Iterable[int]): The card encodings.
+
+    Returns:
+        tuple[int, bool]: The total, counting one ace as 11 if that does not bust the hand, and whether an ace is
+            counted as 11 (a soft total).
+
+    Raises:
+        InvalidCard: If a code is not in the range 0..51.
+    """
+    hard = 0
+    ace = False
+    for code in codes:
+        if not 0 <= code < CARD_COUNT:
+            raise InvalidCard(f"Card encodings must be integers in the range 0..51, got {code!r}")
+        points = POINTS[code]
+        hard += points
+        ace = ace or points == 1
+    if ace and hard + SOFT_ACE_BONUS <= BLACKJACK:
+        return hard + SOFT_ACE_BONUS, True
+    return hard, False
+
+
+class BlackjackHand:
+    """A blackjack hand keeping its hard total and aces as cards are added.
+
+    Attributes:
+        _codes (bytearray): The encoded cards, in the order they were added.
+        _hard (int): The total counting every ace as 1.
+        _ace (bool): Whether the hand holds an ace.
+    """
+
+    __slots__ = ("_ace", "_codes", "_hard")
+
+    def __init__(self, codes: Iterable[int] = ()):
+        """Initialize a BlackjackHand.
+
+        Args:
+            codes (Iterable[int]): The encodings of the initial cards.
+
+        Raises:
+            InvalidCard: If a code is not in the range 0..51.
+        """
+        self._codes = bytearray()
+        self._hard = 0
+        self._ace = False
+        for code in codes:
+            self.add(code)
+
+    def __len__(self) -> int:
+        """Return the number of cards in the hand.
+
+        Returns:
+            int: The number of cards.
+        """
+        return len(self._codes)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the hand.
+
+        Returns:
+            str: The cards and total of the hand.
+        """
+        kind = "soft" if self.soft else "hard"
+        return f"BlackjackHand({' '.join(card.format() for card in self.cards)}, {kind} {self.total})"
+
+    def add(self, code: int) -> int:
+        """Add a card to the hand.
+
+        Args:
+            code (int): The card encoding, e.g. from `Shoe.deal()`.
+
+        Returns:
+            int: The best total of the hand.
+
+        Raises:
+            InvalidCard: If the code is not in the range 0..51; the hand is left unchanged.
+        """
+        if not 0 <= code < CARD_COUNT:
+            raise InvalidCard(f"Card encodings must be integers in the range 0..51, got {code!r}")
+        points = POINTS[code]
+        self._codes.append(code)
+        self._hard += points
+        if points == 1:
+            self._ace = True
+        if self._ace and self._hard + SOFT_ACE_BONUS <= BLACKJACK:
+            return self._hard + SOFT_ACE_BONUS
+        return self._hard
+
+    def clear(self) -> None:
+        """Remove every card, so the hand can be reused for the next round.
+
+        Returns:
+            None
+        """
+        self._codes.clear()
+        self._hard = 0
+        self._ace = False
+
+    @property
+    def codes(self) -> bytes:
+        """Get the encoded cards.
+
+        Returns:
+            bytes: The card encodings, in the order they were added.
+        """
+        return bytes(self._codes)
+
+    @property
+    def cards(self) -> list[InternedCard]:
+        """Get the cards as canonical card objects.
+
+        Returns:
+            list[InternedCard]: The cards, in the order they were added.
+        """
+        return list(map(InternedCard.from_int, self._codes))
+
+    @property
+    def hard(self) -> int:
+        """Get the hard total, counting every ace as 1.
+
+        Returns:
+            int: The hard total.
+        """
+        return self._hard
+
+    @property
+    def soft(self) -> bool:
+        """Report whether the best total counts an ace as 11.
+
+        Returns:
+            bool: True for a soft total.
+        """
+        return self._ace and self._hard + SOFT_ACE_BONUS <= BLACKJACK
+
+    @property
+    def total(self) -> int:
+        """Get the best total, counting one ace as 11 if that does not bust the hand.
+
+        Returns:
+            int: The best total.
+        """
+        if self._ace and self._hard + SOFT_ACE_BONUS <= BLACKJACK:
+            return self._hard + SOFT_ACE_BONUS
+        return self._hard
+
+    @property
+    def is_blackjack(self) -> bool:
+        """Report whether the hand is a natural: an ace and a ten-point card as the first two cards.
+
+        Returns:
+            bool: True for a blackjack.
+        """
+        return len(self._codes) == 2 and self._ace and self._hard == BLACKJACK - SOFT_ACE_BONUS
+
+    @property
+    def is_bust(self) -> bool:
+        """Report whether the hand is over 21.
+
+        Returns:
+            bool: True if the hard total is over 21.
+        """
+        return self._hard > BLACKJACK
+
+
+# mypy sees Deck as Any when it checks this file on its own, with imports skipped.
+class Shoe(Deck):  # type: ignore[misc, unused-ignore]
+    """A multi-deck blackjack shoe keeping the Hi-Lo count and reshuffling at the cut card.
+
+    Attributes:
+        _cards (bytearray): The encoded cards, in dealing order.
+        _cursor (int): The index of the next card to draw.
+        _penetration (float): The fraction of the shoe dealt before the cut card comes out.
+        _running_count (int): The Hi-Lo running count of the cards dealt since the last shuffle.
+    """
+
+    # Redeclared from Deck so the cursor arithmetic below stays typed when Deck is Any.
+    _cards: bytearray
+    _cursor: int
+
+    def __init__(
+        self,
+        decks: int = DEFAULT_DECKS,
+        *,
+        penetration: float = DEFAULT_PENETRATION,
+        seed: int | None = None,
+        rng: "ShuffleSource | None" = None,
+    ):
+        """Initialize an unshuffled Shoe.
+
+        Args:
+            decks (int): The number of standard 52-card decks in the shoe.
+            penetration (float): The fraction of the shoe dealt before reshuffling, in the range (0, 1].
+            seed (int | None): A seed for a new private RNG; ignored when `rng` is given.
+            rng (ShuffleSource | None): The random source used for shuffling.
+
+        Raises:
+            InvalidDeck: If the number of decks is not a positive integer.
+            CardDeckValueError: If the penetration is not in the range (0, 1].
+        """
+        if not 0 < penetration <= 1:
+            raise CardDeckValueError(f"Invalid shoe penetration: {penetration!r}")
+        super().__init__(decks, seed=seed, rng=rng)
+        self._penetration = penetration
+        self._running_count = 0
+
+    def __repr__(self) -> str:
+        """Return a string representation of the shoe.
+
+        Returns:
+            str: A summary of the shoe size, remaining cards and running count.
+        """
+        return (
+            f"Shoe(decks={self.decks}, remaining={len(self)}/{self.size}, running_count={self._running_count})"
+        )
+
+    @property
+    def penetration(self) -> float:
+        """Get the fraction of the shoe dealt before the cut card comes out.
+
+        Returns:
+            float: The penetration.
+        """
+        return self._penetration
+
+    @property
+    def running_count(self) -> int:
+        """Get the Hi-Lo running count of the cards dealt since the last shuffle.
+
+        Returns:
+            int: The running count.
+        """
+        return self._running_count
+
+    @property
+    def decks_remaining(self) -> float:
+        """Get the number of decks left to deal.
+
+        Returns:
+            float: The undealt cards divided by 52.
+        """
+        remaining: float = len(self) / CARD_COUNT
+        return remaining
+
+    @property
+    def true_count(self) -> float:
+        """Get the Hi-Lo true count: the running count per deck left to deal.
+
+        Returns:
+            float: The true count; the running count once the shoe is empty.
+        """
+        remaining = len(self)
+        if not remaining:
+            return float(self._running_count)
+        count: float = self._running_count * CARD_COUNT / remaining
+        return count
+
+    @property
+    def needs_shuffle(self) -> bool:
+        """Report whether the cut card has come out.
+
+        Returns:
+            bool: True once the dealt cards reach the penetration.
+        """
+        return self._cursor >= len(self._cards) * self._penetration
+
+    def start_round(self) -> bool:
+        """Reshuffle the shoe before a round if the cut card has come out.
+
+        Returns:
+            bool: True if the shoe was reshuffled.
+        """
+        if self._cursor < len(self._cards) * self._penetration:
+            return False
+        self.shuffle()
+        return True
+
+    def reset(self) -> None:
+        """Return every card to the shoe in factory order and zero the count.
+
+        Returns:
+            None
+        """
+        super().reset()
+        self._running_count = 0
+
+    def shuffle(self, rng: "ShuffleSource | None" = None) -> None:
+        """Collect every card, shuffle the shoe in place and zero the count.
+
+        Args:
+            rng (ShuffleSource | None): The random source to use instead of the shoe's own.
+
+        Returns:
+            None
+        """
+        super().shuffle(rng)
+        self._running_count = 0
+
+    def deal(self) -> int:
+        """Deal the next card and add it to the running count.
+
+        Returns:
+            int: The card encoding.
+
+        Raises:
+            EmptyDeck: If the shoe is empty.
+        """
+        cursor = self._cursor
+        if cursor == len(self._cards):
+            raise EmptyDeck("Cannot deal from an empty shoe")
+        code = self._cards[cursor]
+        self._cursor = cursor + 1
+        self._running_count += HI_LO[code]
+        if metrics.ENABLED:
+            metrics.DEALS.inc()
+            metrics.CARDS_DEALT.inc()
+        if trace.ENABLED:
+            trace.emit(__name__, "shoe.deal", code=code, running_count=self._running_count)
+        return code
+
+    def draw(self, count: int = 1) -> bytes:
+        """Draw encoded cards from the shoe and add them to the running count.
+
+        Args:
+            count (int): The number of cards to draw.
+
+        Returns:
+            bytes: The drawn card encodings in dealing order.
+
+        Raises:
+            EmptyDeck: If fewer than `count` cards remain.
+        """
+        codes: bytes = super().draw(count)
+        self._running_count += sum(map(HI_LO.__getitem__, codes))
+        return codes
@@ -0,0 +1,315 @@
+"""See Description below.
+
+Module Name: simulate.py
+
+Description:
+This module estimates Texas Hold'em win/tie equity by Monte Carlo simulation. Trials are split into fixed-size
+shards, and each shard draws from its own random stream derived from the run seed and the shard index. The
+shards are spread across a `ProcessPoolExecutor` and their results are combined in shard order, so a seeded run
+returns the same estimate regardless of the number of workers. Workers receive and return only integers (card
+masks, counts and seeds), never pickled `Card` objects.
+
+The run can stop early once the confidence interval of every player's equity is narrower than a tolerance; the
+decision is made on the shards combined so far, in order, so early stopping is deterministic too.
+
+Classes:
+    - EquityResult: The equity estimate of a simulation run.
+
+Functions:
+    - equity: Estimate the equity of known hole cards against each other and random opponents.
+
+Usage:
+Estimate two hands on a flop, using four processes and stopping at +/-0.5% equity::
+
+    result = equity([hero, villain], board=flop, trials=1_000_000, workers=4, seed=7, tolerance=0.005)
+"""
+import math
+import os
+import random
+import secrets
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import NamedTuple
+
+from card_deck import trace
+from card_deck.card import CARD_COUNT
+from card_deck.card import Card
+from card_deck.cardset import CARD_BITS
+from card_deck.cardset import CardSet
+from card_deck.eval import evaluate_masks
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidHand
+
+HOLE_CARDS = 2
+BOARD_CARDS = 5
+DEFAULT_SHARD_SIZE = 10_000
+
+
+class EquityResult(NamedTuple):
+    """The equity estimate of a simulation run.
+
+    Attributes:
+        trials (int): The number of simulated deals.
+        equity (tuple[float, ...]): The equity of each known hand; ties are shared between the tied hands.
+        wins (tuple[int, ...]): The number of deals each known hand won outright.
+        ties (tuple[int, ...]): The number of deals each known hand tied for the best hand.
+        half_width (tuple[float, ...]): The confidence interval half-width of each equity.
+        seed (int): The run seed; pass it back to reproduce the run.
+        stopped_early (bool): True if the run stopped on the tolerance before all trials ran.
+    """
+    trials: int
+    equity: tuple[float, ...]
+    wins: tuple[int, ...]
+    ties: tuple[int, ...]
+    half_width: tuple[float, ...]
+    seed: int
+    stopped_early: bool
+
+
+# (trials, wins per hand, ties per hand, equity sum per hand, equity sum of squares per hand)
+_ShardResult = tuple[int, list[int], list[int], list[float], list[float]]
+
+
+def _codes(cards: Iterable[Card | int]) -> list[int]:
+    """Convert cards or card encodings to encodings.
+
+    Args:
+        cards (Iterable[Card | int]): Cards or card encodings.
+
+    Returns:
+        list[int]: The card encodings.
+
+    Raises:
+        InvalidCard: If an item is neither a card nor a valid encoding.
+    """
+    codes = []
+    for card in cards:
+        code = card.to_int() if isinstance(card, Card) else card
+        if not isinstance(code, int) or not 0 <= code < CARD_COUNT:
+            raise InvalidCard(f"Invalid card: {card!r}")
+        codes.append(code)
+    return codes
+
+
+def _run_shard(  # pylint: disable=too-many-locals
+    hands: tuple[int, ...], board: int, opponents: int, trials: int, seed: str
+) -> _ShardResult:
+    """Simulate one shard of deals.
+
+    Runs in a worker process, so it only takes and returns plain integers and strings.
+
+    Args:
+        hands (tuple[int, ...]): The `CardSet` mask of each known hand.
+        board (int): The `CardSet` mask of the known board cards.
+        opponents (int): The number of extra players with random hole cards.
+        trials (int): The number of deals to simulate.
+        seed (str): The seed of the shard's random stream.
+
+    Returns:
+        _ShardResult: The shard's trial count, wins, ties, equity sums and equity sums of squares.
+    """
+    rng = random.Random(seed)
+    dead = board
+    for hand in hands:
+        dead |= hand
+    live = [CARD_BITS[code] for code in range(CARD_COUNT) if not dead & CARD_BITS[code]]
+    board_missing = BOARD_CARDS - board.bit_count()
+    draw = board_missing + HOLE_CARDS * opponents
+    players = len(hands) + opponents
+
+    masks: list[int] = []
+    for _ in range(trials):
+        drawn = rng.sample(live, draw)
+        full_board = board + sum(drawn[:board_missing])
+        masks.extend(hand | full_board for hand in hands)
+        for seat in range(board_missing, draw, HOLE_CARDS):
+            masks.append(drawn[seat] | drawn[seat + 1] | full_board)
+    values = evaluate_masks(masks)
+
+    known = len(hands)
+    wins, ties = [0] * known, [0] * known
+    total, squares = [0.0] * known, [0.0] * known
+    for start in range(0, len(values), players):
+        deal = values[start:start + players]
+        best = max(deal)
+        winners = deal.count(best)
+        share = 1.0 / winners
+        for player in range(known):
+            if deal[player] == best:
+                if winners == 1:
+                    wins[player] += 1
+                else:
+                    ties[player] += 1
+                total[player] += share
+                squares[player] += share * share
+    return trials, wins, ties, total, squares
+
+
+class _Tally:
+    """The running totals of the shards combined so far.
+
+    Attributes:
+        trials (int): The number of deals combined.
+        wins (list[int]): The outright wins per known hand.
+        ties (list[int]): The ties per known hand.
+        total (list[float]): The equity sum per known hand.
+        squares (list[float]): The equity sum of squares per known hand.
+    """
+
+    def __init__(self, hands: int):
+        """Initialize empty totals.
+
+        Args:
+            hands (int): The number of known hands.
+        """
+        self.trials = 0
+        self.wins = [0] * hands
+        self.ties = [0] * hands
+        self.total = [0.0] * hands
+        self.squares = [0.0] * hands
+
+    def add(self, shard: _ShardResult) -> None:
+        """Combine a shard's results into the totals.
+
+        Args:
+            shard (_ShardResult): The shard's results.
+
+        Returns:
+            None
+        """
+        trials, wins, ties, total, squares = shard
+        self.trials += trials
+        for player, _ in enumerate(self.wins):
+            self.wins[player] += wins[player]
+            self.ties[player] += ties[player]
+            self.total[player] += total[player]
+            self.squares[player] += squares[player]
+
+    def result(self, seed: int, z_score: float, stopped_early: bool) -> EquityResult:
+        """Summarize the totals as an equity estimate.
+
+        Args:
+            seed (int): The run seed.
+            z_score (float): The normal quantile of the confidence level.
+            stopped_early (bool): Whether the run stopped on the tolerance.
+
+        Returns:
+            EquityResult: The equity estimate.
+        """
+        done = self.trials
+        means = [value / done for value in self.total]
+        half_width = tuple(
+            z_score * math.sqrt(max(squares / done - mean * mean, 0.0) / done)
+            for mean, squares in zip(means, self.squares)
+        )
+        return EquityResult(done, tuple(means), tuple(self.wins), tuple(self.ties), half_width, seed, stopped_early)
+
+
+def _check_deal(hands: list[list[int]], board: list[int], opponents: int) -> None:
+    """Validate the known cards of a simulation.
+
+    Args:
+        hands (list[list[int]]): The encoded hole cards of each known hand.
+        board (list[int]): The encoded known board cards.
+        opponents (int): The number of extra players with random hole cards.
+
+    Raises:
+        InvalidHand: If the hands or board are malformed, share cards, or leave too few cards to deal.
+    """
+    every_card = [code for hand in hands for code in hand] + board
+    if not hands or any(len(hand) != HOLE_CARDS for hand in hands):
+        raise InvalidHand(f"Every known hand must hold exactly {HOLE_CARDS} cards")
+    if opponents < 0 or len(hands) + opponents < 2:
+        raise InvalidHand("At least two players are needed")
+    if len(board) > BOARD_CARDS:
+        raise InvalidHand(f"The board holds at most {BOARD_CARDS} cards")
+    if len(set(every_card)) != len(every_card):
+        raise InvalidHand("The hands and board share a card")
+    if len(every_card) + BOARD_CARDS - len(board) + HOLE_CARDS * opponents > CARD_COUNT:
+        raise InvalidHand("Not enough cards left to deal every player")
+
+
+def equity(  # pylint: disable=too-many-arguments,too-many-locals
+    hands: Sequence[Sequence[Card | int]],
+    board: Sequence[Card | int] = (),
+    *,
+    opponents: int = 0,
+    trials: int = 100_000,
+    seed: int | None = None,
+    workers: int | None = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    tolerance: float | None = None,
+    confidence: float = 0.95,
+    progress: Callable[[EquityResult], None] | None = None,
+) -> EquityResult:
+    """Estimate the equity of known hole cards by Monte Carlo simulation.
+
+    Args:
+        hands (Sequence[Sequence[Card | int]]): The two hole cards of each known player.
+        board (Sequence[Card | int]): The known board cards, up to five.
+        opponents (int): The number of extra players with random hole cards.
+        trials (int): The maximum number of deals to simulate.
+        seed (int | None): The run seed; None picks a random seed, reported in the result.
+        workers (int | None): The number of worker processes, at least 1; 1 runs in this process, None uses every
+            CPU.
+        shard_size (int): The number of deals per shard, the unit of work and of seeding.
+        tolerance (float | None): Stop once every equity's confidence interval half-width is at most this.
+        confidence (float): The confidence level of the interval, e.g. 0.95.
+        progress (Callable[[EquityResult], None] | None): Called with the running estimate after each shard.
+
+    Returns:
+        EquityResult: The equity estimate.
+
+    Raises:
+        InvalidHand: If the hands or board are malformed, share cards, or leave too few cards to deal.
+        InvalidCard: If a card is neither a `Card` nor a valid encoding.
+        CardDeckValueError: If `workers`, `trials` or `shard_size` is less than 1, or `confidence` is not in the
+            range (0, 1).
+    """
+    if workers is not None and workers < 1:
+        raise CardDeckValueError(f"Invalid number of workers: {workers}")
+    if trials < 1 or shard_size < 1:
+        raise CardDeckValueError(f"The trials and shard size must be positive: {trials=}, {shard_size=}")
+    if not 0 < confidence < 1:
+        raise CardDeckValueError(f"Invalid confidence level: {confidence!r}")
+    hand_codes = [_codes(hand) for hand in hands]
+    board_codes = _codes(board)
+    _check_deal(hand_codes, board_codes, opponents)
+
+    seed = secrets.randbits(64) if seed is None else seed
+    hand_masks = tuple(CardSet.from_codes(hand).mask for hand in hand_codes)
+    board_mask = CardSet.from_codes(board_codes).mask
+    shards = [min(shard_size, trials - start) for start in range(0, trials, shard_size)]
+    z_score = NormalDist().inv_cdf((1 + confidence) / 2)
+    tally = _Tally(len(hand_masks))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    pending: list[Future[_ShardResult] | _ShardResult] = []
+    try:
+        next_shard = 0
+        while next_shard < len(shards) or pending:
+            # Keep a bounded window of shards in flight and combine them strictly in shard order.
+            while next_shard < len(shards) and len(pending) < 2 * workers:
+                arguments = (hand_masks, board_mask, opponents, shards[next_shard], f"{seed}/{next_shard}")
+                pending.append(executor.submit(_run_shard, *arguments) if executor else _run_shard(*arguments))
+                next_shard += 1
+            item = pending.pop(0)
+            tally.add(item.result() if isinstance(item, Future) else item)
+            if trace.ENABLED:
+                trace.emit(__name__, "simulate.shard", trials=tally.trials, of=trials)
+            running = tally.result(seed, z_score, False)
+            if progress is not None:
+                progress(running)
+            if tolerance is not None and tally.trials < trials and max(running.half_width) <= tolerance:
+                return tally.result(seed, z_score, True)
+        return running
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
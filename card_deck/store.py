@@ -0,0 +1,488 @@
+"""See Description below.
+
+Module Name: store.py
+
+Description:
+This module provides `HandStore`, an append-only store of dealt hands with a per-card index. Hands are kept in
+a `card_deck.serialize` file with one byte per card, read back through a memory map, so a stored hand is a
+zero-copy `memoryview` of the file. Next to the data file, an index file holds one posting bitmap per card
+encoding: bit ``i`` of the bitmap of a card is set when hand ``i`` holds that card.
+
+Queries by card, suit or rank combine the bitmaps of the matching encodings with integer operations and only
+touch the records of the matching hands; a query restricted to record positions (e.g. one seat's hole cards)
+checks those positions in the matching records alone. The index is saved on `flush()` and `close()`; hands
+appended to the data file after the index was last saved are indexed again when the store is opened.
+
+Classes:
+    - HandStore: An append-only, memory-mapped hand store with a per-card posting index.
+
+Functions:
+    - seat_positions: Get the record positions of one seat's hole cards.
+
+Usage:
+Find every hand where the ace of spades was dealt to seat 3::
+
+    with HandStore("hands.cdh", record_size=23) as store:
+        store.append(deck.draw(23))
+        hands = store.query(InternedCard(Suite.SPADES, Rank.ACE), positions=seat_positions(3))
+"""
+import logging
+import os
+import re
+import struct
+import tempfile
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from os import PathLike
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from card_deck import trace
+from card_deck.card import CARD_COUNT
+from card_deck.card import RANK_SHIFT
+from card_deck.card import SUITE_MASK
+from card_deck.card import Card
+from card_deck.card import Rank
+from card_deck.card import Suite
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidFormat
+from card_deck.exceptions import InvalidHand
+from card_deck.serialize import HandReader
+from card_deck.serialize import HandWriter
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+HOLE_CARDS = 2
+
+_INDEX_MAGIC = b"CDIX"
+_INDEX_HEADER = struct.Struct("<4sBxxxQ")
+# Posting bitmaps grow by this many bytes (hands / 8) at a time.
+_GROWTH = 4096
+_NONZERO = re.compile(rb"[^\x00]")
+# The set bit positions of every byte value.
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+
+def seat_positions(seat: int, hole_cards: int = HOLE_CARDS) -> range:
+    """Get the record positions of one seat's hole cards, for records that start with every seat's hole cards.
+
+    Args:
+        seat (int): The seat number, starting at 0.
+        hole_cards (int): The number of hole cards per seat.
+
+    Returns:
+        range: The positions of the seat's cards in a record.
+    """
+    return range(seat * hole_cards, (seat + 1) * hole_cards)
+
+
+class HandStore:
+    """An append-only store of dealt hands, memory-mapped for reading and indexed by card.
+
+    Attributes:
+        _path (Path): The data file.
+        _writer (HandWriter): The writer appending to the data file.
+        _reader (HandReader): The memory-mapped reader of the data file, remapped as the file grows.
+        _record_size (int): The number of cards per hand.
+        _postings (list[bytearray]): The posting bitmap of each card encoding, little-endian by hand id.
+    """
+
+    def __init__(
+        self, path: str | PathLike[str], record_size: int | None = None, *, decks: int = 1, seed: int | None = None
+    ):
+        """Open a hand store, creating its data file if it does not exist.
+
+        Args:
+            path (str | PathLike[str]): The data file; the index is kept next to it with an ``.idx`` suffix.
+            record_size (int | None): The number of cards per hand; required to create a store.
+            decks (int): The number of standard decks the hands are dealt from, stored in a new file.
+            seed (int | None): The seed of the shuffle RNG, stored in a new file.
+
+        Raises:
+            InvalidFormat: If the data file is malformed or packed, or a new store has no record size.
+        """
+        self._path = Path(path)
+        if not self._path.exists():
+            if record_size is None:
+                raise InvalidFormat(f"A record size is needed to create the hand store {self._path}")
+            HandWriter.open(self._path, record_size, decks=decks, seed=seed).close()
+        self._reader = HandReader.open(self._path)
+        if self._reader.packed or record_size not in (None, self._reader.record_size):
+            self._reader.close()
+            raise InvalidFormat(f"{self._path} does not hold unpacked records of {record_size} card(s)")
+        self._record_size: int = self._reader.record_size
+        self._writer = HandWriter.append_to(self._path)
+        self._postings = [bytearray() for _ in range(CARD_COUNT)]
+        indexed = self._load_index()
+        for hand in range(indexed, len(self._reader)):
+            self._index(hand, self._reader.raw(hand))
+
+    @property
+    def path(self) -> Path:
+        """Get the path of the data file.
+
+        Returns:
+            Path: The data file.
+        """
+        return self._path
+
+    @property
+    def index_path(self) -> Path:
+        """Get the path of the index file.
+
+        Returns:
+            Path: The index file.
+        """
+        return self._path.with_name(self._path.name + INDEX_SUFFIX)
+
+    @property
+    def record_size(self) -> int:
+        """Get the number of cards per hand.
+
+        Returns:
+            int: The number of cards.
+        """
+        return self._record_size
+
+    def __len__(self) -> int:
+        """Return the number of stored hands.
+
+        Returns:
+            int: The number of hands.
+        """
+        count: int = self._writer.count
+        return count
+
+    def append(self, codes: bytes | bytearray | memoryview | Iterable[int]) -> int:
+        """Append a hand and index its cards.
+
+        Args:
+            codes (bytes | bytearray | memoryview | Iterable[int]): The card encodings of the hand.
+
+        Returns:
+            int: The id of the hand, its position in the store.
+
+        Raises:
+            InvalidHand: If the hand does not hold `record_size` cards.
+            InvalidCard: If an encoding is not in the range 0..51.
+        """
+        try:
+            record = bytes(codes)
+        except (TypeError, ValueError):
+            raise InvalidCard("Card encodings must be integers in the range 0..51") from None
+        hand: int = self._writer.count
+        self._writer.write(record)
+        self._index(hand, record)
+        return hand
+
+    def extend(self, records: Iterable[bytes | bytearray | memoryview | Iterable[int]]) -> range:
+        """Append several hands.
+
+        Args:
+            records (Iterable[bytes | bytearray | memoryview | Iterable[int]]): The hands, in order.
+
+        Returns:
+            range: The ids of the appended hands.
+
+        Raises:
+            InvalidHand: If a hand does not hold `record_size` cards.
+            InvalidCard: If an encoding is not in the range 0..51.
+        """
+        start = len(self)
+        for record in records:
+            self.append(record)
+        return range(start, len(self))
+
+    def _index(self, hand: int, record: bytes | memoryview) -> None:
+        """Set the bit of a hand in the posting bitmap of each of its cards.
+
+        Args:
+            hand (int): The hand id.
+            record (bytes | memoryview): The card encodings of the hand.
+
+        Returns:
+            None
+        """
+        postings = self._postings
+        offset, bit = hand >> 3, 1 << (hand & 7)
+        if offset >= len(postings[0]):
+            for posting in postings:
+                posting.extend(bytes(_GROWTH))
+        for code in record:
+            postings[code][offset] |= bit
+
+    def _mapped(self) -> HandReader:
+        """Get a reader whose memory map covers every appended hand, remapping the file if it grew.
+
+        Returns:
+            HandReader: The reader.
+        """
+        if len(self._reader) < self._writer.count:
+            self._writer.flush()
+            self._reader.close()
+            self._reader = HandReader.open(self._path)
+        return self._reader
+
+    def _check(self, hand: int) -> int:
+        """Validate a hand id.
+
+        Args:
+            hand (int): The hand id; negative ids count from the end.
+
+        Returns:
+            int: The non-negative hand id.
+
+        Raises:
+            IndexError: If the id is out of range.
+        """
+        count = len(self)
+        if hand < 0:
+            hand += count
+        if not 0 <= hand < count:
+            raise IndexError(f"Hand id out of range: {hand}")
+        return hand
+
+    def __getitem__(self, hand: int) -> memoryview:
+        """Get the card encodings of a hand without copying them.
+
+        Args:
+            hand (int): The hand id; negative ids count from the end.
+
+        Returns:
+            memoryview: The card encodings, a view of the memory-mapped file.
+
+        Raises:
+            IndexError: If the id is out of range.
+        """
+        record: memoryview = self._mapped().raw(self._check(hand))
+        return record
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """Iterate over the stored hands without copying them.
+
+        Yields:
+            memoryview: The card encodings of each hand, in id order.
+        """
+        reader = self._mapped()
+        for hand in range(len(reader)):
+            yield reader.raw(hand)
+
+    def records(self, start: int = 0, stop: int | None = None) -> memoryview:
+        """Get the card encodings of a run of consecutive hands as one zero-copy view.
+
+        Args:
+            start (int): The id of the first hand.
+            stop (int | None): The id after the last hand, None for the end of the store.
+
+        Returns:
+            memoryview: The encodings of the hands, `record_size` bytes per hand, back to back.
+
+        Raises:
+            IndexError: If the range is out of bounds.
+        """
+        stop = len(self) if stop is None else stop
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError(f"Hand range out of bounds: {start}..{stop}")
+        records: memoryview = self._mapped().records()
+        return records[start * self._record_size:stop * self._record_size]
+
+    def postings(self, code: int) -> int:
+        """Get the posting bitmap of a card.
+
+        Args:
+            code (int): The card encoding.
+
+        Returns:
+            int: A bitmap with bit ``i`` set when hand ``i`` holds the card.
+
+        Raises:
+            InvalidCard: If the encoding is not in the range 0..51.
+        """
+        if not 0 <= code < CARD_COUNT:
+            raise InvalidCard(f"Invalid card encoding: {code}")
+        return int.from_bytes(self._postings[code][:(len(self) + 7) >> 3], "little")
+
+    def query(
+        self,
+        card: Card | int | None = None,
+        *,
+        suite: Suite | None = None,
+        rank: Rank | None = None,
+        positions: Sequence[int] | None = None,
+    ) -> list[int]:
+        """Find the hands holding a card, or any card of a suit and/or rank.
+
+        The criteria narrow each other: ``suite=Suite.SPADES`` matches the 13 spades, adding ``rank=Rank.ACE``
+        matches the ace of spades alone.
+
+        Args:
+            card (Card | int | None): A card or card encoding.
+            suite (Suite | None): Match only cards of this suite.
+            rank (Rank | None): Match only cards of this rank.
+            positions (Sequence[int] | None): Match only cards at these positions of a hand, e.g. `seat_positions()`.
+
+        Returns:
+            list[int]: The ids of the matching hands, in increasing order.
+
+        Raises:
+            InvalidCard: If `card` is not a card or valid encoding.
+            InvalidHand: If a position is outside the records.
+        """
+        codes = set(range(CARD_COUNT))
+        if card is not None:
+            code = card.to_int() if isinstance(card, Card) else card
+            if not isinstance(code, int) or not 0 <= code < CARD_COUNT:
+                raise InvalidCard(f"Invalid card: {card!r}")
+            codes &= {code}
+        if suite is not None:
+            codes &= {code for code in range(CARD_COUNT) if code & SUITE_MASK == suite.value - 1}
+        if rank is not None:
+            codes &= {code for code in range(CARD_COUNT) if code >> RANK_SHIFT == rank.value - 1}
+        bitmap = 0
+        for code in codes:
+            bitmap |= self.postings(code)
+        hands = self._hands(bitmap)
+        if positions is not None:
+            hands = self._filter(hands, codes, positions)
+        if trace.ENABLED:
+            trace.emit(logger, "store.query", codes=len(codes), matches=len(hands))
+        return hands
+
+    def query_all(self, cards: Iterable[Card | int]) -> list[int]:
+        """Find the hands holding every one of some cards.
+
+        Args:
+            cards (Iterable[Card | int]): Cards or card encodings.
+
+        Returns:
+            list[int]: The ids of the matching hands, in increasing order.
+
+        Raises:
+            InvalidCard: If an item is not a card or valid encoding.
+        """
+        bitmap = (1 << len(self)) - 1
+        for card in cards:
+            code = card.to_int() if isinstance(card, Card) else card
+            if not isinstance(code, int):
+                raise InvalidCard(f"Invalid card: {card!r}")
+            bitmap &= self.postings(code)
+        return self._hands(bitmap)
+
+    def _hands(self, bitmap: int) -> list[int]:
+        """Get the hand ids set in a bitmap.
+
+        Args:
+            bitmap (int): A posting bitmap.
+
+        Returns:
+            list[int]: The ids of the set bits, in increasing order.
+        """
+        data = bitmap.to_bytes((len(self) + 7) >> 3, "little")
+        hands: list[int] = []
+        for match in _NONZERO.finditer(data):
+            base = match.start() << 3
+            hands.extend(base + bit for bit in _BYTE_BITS[data[match.start()]])
+        return hands
+
+    def _filter(self, hands: list[int], codes: set[int], positions: Sequence[int]) -> list[int]:
+        """Keep the hands holding one of some cards at one of some positions.
+
+        Args:
+            hands (list[int]): The candidate hand ids.
+            codes (set[int]): The card encodings to look for.
+            positions (Sequence[int]): The positions to check in each hand.
+
+        Returns:
+            list[int]: The ids of the hands that match.
+
+        Raises:
+            InvalidHand: If a position is outside the records.
+        """
+        if any(not 0 <= position < self._record_size for position in positions):
+            raise InvalidHand(f"Record positions must be in the range 0..{self._record_size - 1}: {positions}")
+        view = self._mapped().records()
+        size = self._record_size
+        return [hand for hand in hands if any(view[hand * size + position] in codes for position in positions)]
+
+    def _load_index(self) -> int:
+        """Load the saved posting bitmaps, ignoring a missing, invalid or stale index file.
+
+        Returns:
+            int: The number of hands covered by the loaded index; later hands still need indexing.
+        """
+        try:
+            data = self.index_path.read_bytes()
+        except OSError:
+            return 0
+        if len(data) < _INDEX_HEADER.size:
+            return 0
+        magic, version, count = _INDEX_HEADER.unpack_from(data)
+        size = (count + 7) >> 3
+        if magic != _INDEX_MAGIC or version != INDEX_VERSION or count > len(self) or \
+                len(data) != _INDEX_HEADER.size + CARD_COUNT * size:
+            logger.warning("Ignoring the invalid hand store index %s", self.index_path)
+            return 0
+        for code in range(CARD_COUNT):
+            start = _INDEX_HEADER.size + code * size
+            self._postings[code] = bytearray(data[start:start + size])
+        return int(count)
+
+    def _save_index(self) -> None:
+        """Write the posting bitmaps to the index file atomically.
+
+        Returns:
+            None
+        """
+        count = len(self)
+        size = (count + 7) >> 3
+        with tempfile.NamedTemporaryFile("wb", dir=self._path.parent, delete=False) as index:
+            index.write(_INDEX_HEADER.pack(_INDEX_MAGIC, INDEX_VERSION, count))
+            for posting in self._postings:
+                index.write(posting[:size].ljust(size, b"\x00"))
+        os.replace(index.name, self.index_path)
+
+    def flush(self) -> None:
+        """Write appended hands to the data file and save the index.
+
+        Returns:
+            None
+        """
+        self._writer.flush()
+        self._save_index()
+
+    def close(self) -> None:
+        """Flush the store and release its files.
+
+        Returns:
+            None
+        """
+        self.flush()
+        self._writer.close()
+        self._reader.close()
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the store on exit.
+
+        Returns:
+            Self: This store.
+        """
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Close the store.
+
+        Args:
+            exc_type (type[BaseException] | None): The exception type, if one was raised.
+            exc (BaseException | None): The exception, if one was raised.
+            traceback (TracebackType | None): The exception traceback, if one was raised.
+
+        Returns:
+            None
+        """
+        self.close()
@@ -0,0 +1,87 @@
+"""See Description below.
+
+Module Name: trace.py
+
+Description:
+This module provides the opt-in trace mode of the card_deck library. Hot paths (card construction,
+setters, string conversion, shuffles and draws) do not call `logging` directly; they check the
+module-level `ENABLED` switch and only then emit a structured trace event. With tracing off, the cost
+of instrumentation is a single attribute check.
+
+Tracing is off by default. It is switched on once at import when the ``CARD_DECK_TRACE`` environment
+variable is set to ``1``, ``true``, ``yes`` or ``on``, or at runtime with `enable_trace()`.
+
+Each event is logged at DEBUG level to the emitting module's logger. The record carries the event name
+and its fields as the ``card_deck_event`` and ``card_deck_fields`` attributes, so handlers and formatters
+can process them without parsing the message. Modules imported by ``import card_deck`` name their logger
+instead of creating it, so `logging` is only imported once the first event is emitted.
+
+Functions:
+    - enable_trace: Turn trace mode on.
+    - disable_trace: Turn trace mode off.
+    - is_trace_enabled: Report whether trace mode is on.
+    - emit: Log a structured trace event.
+
+Usage:
+Guard every trace point with the switch so arguments are not even built when tracing is off::
+
+    if trace.ENABLED:
+        trace.emit(__name__, "card.init", code=code)
+"""
+import os
+
+from card_deck import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import logging
+
+ENABLED = os.environ.get("CARD_DECK_TRACE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def enable_trace() -> None:
+    """Turn trace mode on for the whole card_deck library.
+
+    Returns:
+        None
+    """
+    global ENABLED  # pylint: disable=global-statement
+    ENABLED = True
+
+
+def disable_trace() -> None:
+    """Turn trace mode off for the whole card_deck library.
+
+    Returns:
+        None
+    """
+    global ENABLED  # pylint: disable=global-statement
+    ENABLED = False
+
+
+def is_trace_enabled() -> bool:
+    """Report whether trace mode is on.
+
+    Returns:
+        bool: True if trace events are emitted.
+    """
+    return ENABLED
+
+
+def emit(logger: "logging.Logger | str", event: str, **fields: object) -> None:
+    """Log a structured trace event at DEBUG level.
+
+    Callers check `ENABLED` first; this function does not.
+
+    Args:
+        logger (logging.Logger | str): The logger of the emitting module, or its name.
+        event (str): The dotted event name, e.g. ``"card.init"``.
+        **fields (object): The event's data.
+
+    Returns:
+        None
+    """
+    if isinstance(logger, str):
+        import logging  # pylint: disable=import-outside-toplevel
+
+        logger = logging.getLogger(logger)
+    logger.debug("%s %s", event, fields, extra={"card_deck_event": event, "card_deck_fields": fields})
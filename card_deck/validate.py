@@ -0,0 +1,307 @@
+"""See Description below.
+
+Module Name: validate.py
+
+Description:
+This module validates untrusted card data in bulk. `Card` and `encode()` check one suite and rank at a time and
+raise on the first bad value, which is the right contract for building a card but far too slow for ingesting
+hand histories of millions of cards. The validators here check a whole array in one pass and return a
+`ValidationReport` listing every offending index instead of raising.
+
+Encoded cards given as bytes, or any buffer of unsigned bytes such as a NumPy ``uint8`` array, are checked with
+C-level scans: a regular expression finds the bytes that are not card encodings, and each group of cards is
+tested for duplicates by comparing its length with the size of its set (or the largest count of a
+``collections.Counter`` for multi-deck groups). Only a group that holds a duplicate is walked in Python to find
+its indices, so clean data never runs a per-card Python loop.
+
+Duplicates are counted within groups of consecutive cards, e.g. each deck of a batch or each hand of a history,
+and a card may appear up to ``copies`` times in a group, e.g. six times in a six-deck shoe.
+
+Classes:
+    - ValidationReport: The offending indices found in an array of cards.
+
+Functions:
+    - validate_codes: Validate an array of card encodings.
+    - validate_pairs: Validate an array of (suite, rank) pairs.
+
+Usage:
+Check an uploaded batch of decks and reject it with every problem listed::
+
+    report = validate_codes(upload, group_size=52)
+    if not report.ok:
+        log_rejection(report.invalid, report.duplicates)
+    report.raise_for_errors()
+"""
+import operator
+import re
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+from typing import NamedTuple
+
+from card_deck import metrics
+from card_deck.card import CARD_COUNT
+from card_deck.card import RANK_SHIFT
+from card_deck.card import Rank
+from card_deck.card import Suite
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidDeck
+
+# Stands in for a value that is not a card encoding; any byte of 52 or more is invalid.
+_INVALID = 0xFF
+_INVALID_BYTES = bytes(range(CARD_COUNT, 256))
+_NOT_A_CARD = re.compile(b"[\\x34-\\xff]")
+# The suite and rank bits of each enum member and of its integer value.
+_SUITE_BITS: dict[Any, int] = {key: suite.value - 1 for suite in Suite for key in (suite, suite.value)}
+_RANK_BITS: dict[Any, int] = {key: (rank.value - 1) << RANK_SHIFT for rank in Rank for key in (rank, rank.value)}
+# The exact types of valid suites and ranks; subclasses of int such as bool are rejected.
+_SUITE_TYPES = (Suite, int)
+_RANK_TYPES = (Rank, int)
+# The number of offending indices quoted in an exception message.
+_QUOTED_INDICES = 10
+
+
+class ValidationReport(NamedTuple):
+    """The offending indices found in an array of cards, in ascending order.
+
+    Attributes:
+        size (int): The number of values checked.
+        invalid (tuple[int, ...]): The indices of values that are not cards.
+        invalid_suites (tuple[int, ...]): The indices of pairs with an invalid suite; empty for encodings.
+        invalid_ranks (tuple[int, ...]): The indices of pairs with an invalid rank; empty for encodings.
+        duplicates (tuple[int, ...]): The indices of cards appearing more than the allowed number of times in their
+            group; the first allowed copies are not listed.
+    """
+    size: int
+    invalid: tuple[int, ...] = ()
+    invalid_suites: tuple[int, ...] = ()
+    invalid_ranks: tuple[int, ...] = ()
+    duplicates: tuple[int, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        """Report whether every value is a card and no group holds too many copies of one.
+
+        Returns:
+            bool: True if nothing was found.
+        """
+        return not self.invalid and not self.duplicates
+
+    def raise_for_errors(self) -> None:
+        """Raise an exception if the report found anything.
+
+        Returns:
+            None
+
+        Raises:
+            InvalidCard: If any value is not a card.
+            InvalidDeck: If any group holds too many copies of a card.
+        """
+        if self.invalid:
+            raise InvalidCard(f"{len(self.invalid)} invalid card(s) at {_quote(self.invalid)}")
+        if self.duplicates:
+            raise InvalidDeck(f"{len(self.duplicates)} duplicate card(s) at {_quote(self.duplicates)}")
+
+
+def _quote(indices: tuple[int, ...]) -> str:
+    """Format the first offending indices for an exception message.
+
+    Args:
+        indices (tuple[int, ...]): The indices.
+
+    Returns:
+        str: The indices, shortened with an ellipsis if there are many.
+    """
+    quoted = ", ".join(map(str, indices[:_QUOTED_INDICES]))
+    return f"index {quoted}, ..." if len(indices) > _QUOTED_INDICES else f"index {quoted}"
+
+
+def _check_limits(copies: int, group_size: int | None) -> None:
+    """Validate the duplicate limits.
+
+    Args:
+        copies (int): The allowed copies of each card per group.
+        group_size (int | None): The number of cards per group.
+
+    Raises:
+        CardDeckValueError: If either limit is not positive.
+    """
+    if copies < 1:
+        raise CardDeckValueError(f"Invalid number of allowed copies: {copies!r}")
+    if group_size is not None and group_size < 1:
+        raise CardDeckValueError(f"Invalid validation group size: {group_size!r}")
+
+
+def _find_duplicates(codes: bytes, copies: int, group_size: int | None, has_invalid: bool) -> list[int]:
+    """Find the cards appearing more than the allowed number of times in their group.
+
+    Args:
+        codes (bytes): The card encodings, with 52 or more marking a value that is not a card.
+        copies (int): The allowed copies of each card per group.
+        group_size (int | None): The number of cards per group; None checks the whole array as one group.
+        has_invalid (bool): Whether any value is not a card.
+
+    Returns:
+        list[int]: The offending indices in ascending order.
+    """
+    size = group_size or len(codes) or 1
+    duplicates = []
+    for start in range(0, len(codes), size):
+        group = codes[start:start + size]
+        cards = group.translate(None, _INVALID_BYTES) if has_invalid else group
+        if copies == 1:
+            if len(set(cards)) == len(cards):
+                continue
+        elif max(Counter(cards).values(), default=0) <= copies:
+            continue
+        seen = [0] * 256
+        for index, code in enumerate(group, start):
+            seen[code] += 1
+            if seen[code] > copies and code < CARD_COUNT:
+                duplicates.append(index)
+    return duplicates
+
+
+def _report(
+    codes: bytes, copies: int, group_size: int | None, invalid_suites: list[int], invalid_ranks: list[int]
+) -> ValidationReport:
+    """Build the report of validated card encodings.
+
+    Args:
+        codes (bytes): The card encodings, with 52 or more marking a value that is not a card.
+        copies (int): The allowed copies of each card per group.
+        group_size (int | None): The number of cards per group.
+        invalid_suites (list[int]): The indices of pairs with an invalid suite.
+        invalid_ranks (list[int]): The indices of pairs with an invalid rank.
+
+    Returns:
+        ValidationReport: The report.
+    """
+    invalid = tuple(match.start() for match in _NOT_A_CARD.finditer(codes))
+    duplicates = _find_duplicates(codes, copies, group_size, bool(invalid))
+    if metrics.ENABLED and (invalid_suites or invalid_ranks):
+        metrics.INVALID_SUITES.inc(len(invalid_suites))
+        metrics.INVALID_RANKS.inc(len(invalid_ranks))
+    return ValidationReport(len(codes), invalid, tuple(invalid_suites), tuple(invalid_ranks), tuple(duplicates))
+
+
+def _lookup(table: dict[Any, int], key: Any) -> int | None:
+    """Look up a suite or rank that may be unhashable.
+
+    Args:
+        table (dict[Any, int]): The bits of each valid suite or rank.
+        key (Any): The suite or rank.
+
+    Returns:
+        int | None: The bits, or None if the key is not valid.
+    """
+    try:
+        return table.get(key)
+    except TypeError:
+        return None
+
+
+def _as_bytes(codes: Iterable[Any]) -> bytes:
+    """Convert card encodings to bytes, marking every value that is not an encoding as invalid.
+
+    Args:
+        codes (Iterable[Any]): The card encodings.
+
+    Returns:
+        bytes: One byte per value.
+    """
+    if isinstance(codes, bytes):
+        return codes
+    try:
+        view = memoryview(codes)  # type: ignore[arg-type]
+    except TypeError:
+        pass
+    else:
+        with view:
+            if view.format == "B":
+                return view.tobytes()
+    values = list(codes)
+    try:
+        return bytes(values)
+    except (TypeError, ValueError):
+        pass
+    data = bytearray(len(values))
+    for index, value in enumerate(values):
+        try:
+            code = operator.index(value)
+        except TypeError:
+            code = _INVALID
+        data[index] = code if 0 <= code < CARD_COUNT else _INVALID
+    return bytes(data)
+
+
+def validate_codes(codes: Iterable[Any], *, copies: int = 1, group_size: int | None = None) -> ValidationReport:
+    """Validate an array of card encodings in one pass.
+
+    Args:
+        codes (Iterable[Any]): The values to check, ideally bytes or a buffer of unsigned bytes such as a NumPy
+            ``uint8`` array (flattened in C order); any iterable of integers is accepted.
+        copies (int): The number of times each card may appear in a group, e.g. the decks of a shoe.
+        group_size (int | None): The number of consecutive cards per group, e.g. 52 for a batch of decks; None
+            checks the whole array as one group.
+
+    Returns:
+        ValidationReport: The indices of values that are not encodings in the range 0..51 and of duplicates.
+
+    Raises:
+        CardDeckValueError: If `copies` or `group_size` is not positive.
+    """
+    _check_limits(copies, group_size)
+    return _report(_as_bytes(codes), copies, group_size, [], [])
+
+
+def validate_pairs(pairs: Iterable[Any], *, copies: int = 1, group_size: int | None = None) -> ValidationReport:
+    """Validate an array of raw (suite, rank) pairs in one pass.
+
+    A suite is valid if it is a `Suite` member or its integer value, and likewise for a rank, so rows read from a
+    file need not be converted to enums first. Only exact integers count as values, so booleans and floats such as
+    ``1.0`` are invalid. A row that is not a pair is reported as invalid, but neither as an invalid suite nor as an
+    invalid rank.
+
+    Args:
+        pairs (Iterable[Any]): The (suite, rank) pairs to check.
+        copies (int): The number of times each card may appear in a group, e.g. the decks of a shoe.
+        group_size (int | None): The number of consecutive cards per group; None checks the whole array as one
+            group.
+
+    Returns:
+        ValidationReport: The indices of invalid pairs, split by invalid suite and rank, and of duplicates.
+
+    Raises:
+        CardDeckValueError: If `copies` or `group_size` is not positive.
+    """
+    _check_limits(copies, group_size)
+    suite_bits, rank_bits = _SUITE_BITS.get, _RANK_BITS.get
+    codes = bytearray()
+    invalid_suites = []
+    invalid_ranks = []
+    for index, pair in enumerate(pairs):
+        try:
+            suite, rank = pair
+        except (TypeError, ValueError):
+            codes.append(_INVALID)
+            continue
+        try:
+            suite_code, rank_code = suite_bits(suite), rank_bits(rank)
+        except TypeError:
+            suite_code, rank_code = _lookup(_SUITE_BITS, suite), _lookup(_RANK_BITS, rank)
+        # True and 1.0 hash and compare equal to 1, so they would pass for clubs or an ace.
+        if type(suite) not in _SUITE_TYPES:
+            suite_code = None
+        if type(rank) not in _RANK_TYPES:
+            rank_code = None
+        if suite_code is None or rank_code is None:
+            if suite_code is None:
+                invalid_suites.append(index)
+            if rank_code is None:
+                invalid_ranks.append(index)
+            codes.append(_INVALID)
+        else:
+            codes.append(rank_code | suite_code)
+    return _report(bytes(codes), copies, group_size, invalid_suites, invalid_ranks)
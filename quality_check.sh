@@ -131,6 +131,39 @@ run_pytest() {
   echo "Passed project tests."
 }
 
+run_benchmarks() {
+  # Performance regression testing
+  echo "Starting benchmarks"
+  if compgen -G "${benchmark_baseline}/*/*.json" > /dev/null; then
+    uv run python -m pytest "${benchmark_directory}" --benchmark-enable --benchmark-only \
+      --benchmark-storage="file://${benchmark_baseline}" --benchmark-compare \
+      --benchmark-compare-fail="${benchmark_threshold}"
+  else
+    echo "No benchmark baseline found, saving this run as the baseline"
+    uv run python -m pytest "${benchmark_directory}" --benchmark-enable --benchmark-only \
+      --benchmark-storage="file://${benchmark_baseline}" --benchmark-save=baseline
+  fi
+  exit_code=$?
+
+  if [ ${exit_code} != 0 ]; then
+    exit ${exit_code}
+  fi
+  echo "Passed benchmarks."
+}
+
+run_benchmark_baseline() {
+  # Save a new performance baseline
+  echo "Saving benchmark baseline"
+  uv run python -m pytest "${benchmark_directory}" --benchmark-enable --benchmark-only \
+    --benchmark-storage="file://${benchmark_baseline}" --benchmark-save=baseline
+  exit_code=$?
+
+  if [ ${exit_code} != 0 ]; then
+    exit ${exit_code}
+  fi
+  echo "Benchmark baseline saved."
+}
+
 run_coverage() {
   # Unit Testing
   echo "Starting project coverage tests"
@@ -228,10 +261,11 @@ show_usage() {
   # Display usage
   echo "Card Deck Quality Check Manual"
   echo "USAGE"
-  echo "  quality_check [-a] [-d] [-l] [-q [<check type>]] [-s] [-t]"
+  echo "  quality_check [-a] [-b] [-d] [-l] [-q [<check type>]] [-s] [-t]"
   echo ""
   echo "OPTIONS"
   echo "  -a  Run all quality checks. (DEFAULT)"
+  echo "  -b  Run benchmarks and fail on regressions against the saved baseline."
   echo "  -c  Run coverage report."
   echo "  -d  Build documentation."
   echo "  -h  Shows Usage."
@@ -259,16 +293,23 @@ show_usage() {
 app_directory_list=(
   card_deck/*.py
   tests/*.py
+  tests/benchmarks/*.py
 )
 test_directory="tests"
+benchmark_directory="tests/benchmarks"
+benchmark_baseline="tests/benchmarks/baseline"
+# Fail when a benchmark's fastest round slows down by more than this versus the baseline (the minimum is the
+# least noisy statistic); override with e.g. BENCHMARK_THRESHOLD="mean:10%".
+benchmark_threshold="${BENCHMARK_THRESHOLD:-min:25%}"
 read -r -d '' options << EOM
-Please use [bandit | coverage | documentation | installation | mypy | pip-audit |
+Please use [bandit | baseline | benchmark | coverage | documentation | installation | mypy | pip-audit |
             pycodestyle | pydocstyle | pylint | pytest | ruff]
 EOM
 
-while getopts 'aclhistduq:' flag; do
+while getopts 'abclhistduq:' flag; do
   case "${flag}" in
     a) quality_check ;;
+    b) run_benchmarks ;;
     c) run_coverage ;;
     s) run_security_check ;;
     h) show_usage ;;
@@ -279,6 +320,8 @@ while getopts 'aclhistduq:' flag; do
     u) run_update_all_the_things ;;
     q) case "${OPTARG}" in
       bandit) run_bandit_check ;;
+      baseline) run_benchmark_baseline ;;
+      benchmark) run_benchmarks ;;
       coverage) run_coverage ;;
       documentation) run_automated_docs ;;
       installation) verify_card_deck_installation ;;
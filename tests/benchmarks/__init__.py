@@ -0,0 +1,10 @@
+"""See Description below.
+
+Module Name: __init__.py
+
+Description:
+Satisfying linters
+
+Usage:
+To make the benchmark directory a package.
+"""
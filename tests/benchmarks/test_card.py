@@ -0,0 +1,85 @@
+"""See Description below.
+
+Module Name: test_card.py
+
+Description:
+This module benchmarks the per-card operations of card_deck.card: construction, suite and rank access, string
+formatting, and hashing and equality. Each benchmark round runs the operation once for each of the 52 cards, so
+the "OPS" column counts passes over a whole deck.
+
+Dependencies:
+- pytest
+- pytest-benchmark
+- card_deck.Card
+"""
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import pytest
+
+from card_deck import Card
+from card_deck import InternedCard
+from card_deck import Rank
+from card_deck import Suite
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+PAIRS = [(suite, rank) for suite in Suite for rank in Rank]
+CARDS = [Card(suite, rank) for suite, rank in PAIRS]
+CODES = list(range(52))
+
+CONSTRUCTORS: dict[str, Callable[[], list[Card]]] = {
+    "Card": lambda: [Card(suite, rank) for suite, rank in PAIRS],
+    "Card.from_int": lambda: [Card.from_int(code) for code in CODES],
+    "InternedCard": lambda: [InternedCard(suite, rank) for suite, rank in PAIRS],
+    "InternedCard.from_int": lambda: [InternedCard.from_int(code) for code in CODES],
+}
+
+OPERATIONS: dict[str, tuple[str, Callable[[], object]]] = {
+    "suite": ("attribute access", lambda: [card.suite for card in CARDS]),
+    "rank": ("attribute access", lambda: [card.rank for card in CARDS]),
+    "to_int": ("attribute access", lambda: [card.to_int() for card in CARDS]),
+    "repr": ("formatting", lambda: [repr(card) for card in CARDS]),
+    "format short": ("formatting", lambda: [card.format() for card in CARDS]),
+    "hash": ("hashing and equality", lambda: {card: None for card in CARDS}),
+    "equality": ("hashing and equality", lambda: [card == card.intern() for card in CARDS]),
+    "sorted": ("hashing and equality", lambda: sorted(CARDS, reverse=True)),
+}
+
+
+@pytest.mark.parametrize("name", list(CONSTRUCTORS))  # type: ignore
+def test_construction(benchmark: "BenchmarkFixture", name: str) -> None:
+    """Benchmark building the 52 cards with one constructor.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+        name (str): The name of the constructor.
+
+    Asserts:
+        - Every card is built.
+
+    Returns:
+        None
+    """
+    benchmark.group = "card construction"
+    cards = benchmark(CONSTRUCTORS[name])
+    assert sorted(cards) == sorted(CARDS)
+
+
+@pytest.mark.parametrize("name", list(OPERATIONS))  # type: ignore
+def test_card_operation(benchmark: "BenchmarkFixture", name: str) -> None:
+    """Benchmark one card operation on each of the 52 cards.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+        name (str): The name of the operation.
+
+    Asserts:
+        - The operation produces a result for the deck.
+
+    Returns:
+        None
+    """
+    benchmark.group, operation = OPERATIONS[name]
+    assert len(benchmark(operation)) == 52
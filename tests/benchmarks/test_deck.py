@@ -0,0 +1,97 @@
+"""See Description below.
+
+Module Name: test_deck.py
+
+Description:
+This module benchmarks the life of a `Deck`: building, resetting and shuffling a shoe, and dealing it out in
+hands of two cards, as encodings and as card objects, for one- and six-deck shoes.
+
+Dependencies:
+- pytest
+- pytest-benchmark
+- card_deck.Deck
+"""
+from typing import TYPE_CHECKING
+
+import pytest
+
+from card_deck import Deck
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("decks", [1, 6])  # type: ignore
+def test_new_shuffled_deck(benchmark: "BenchmarkFixture", decks: int) -> None:
+    """Benchmark building and shuffling a new shoe.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+        decks (int): The number of decks in the shoe.
+
+    Asserts:
+        - The shoe is full.
+
+    Returns:
+        None
+    """
+    benchmark.group = f"deck {decks} deck(s)"
+
+    def new_deck() -> Deck:
+        deck = Deck(decks, seed=1)
+        deck.shuffle()
+        return deck
+
+    assert len(benchmark(new_deck)) == 52 * decks
+
+
+@pytest.mark.parametrize("decks", [1, 6])  # type: ignore
+def test_reset_and_shuffle(benchmark: "BenchmarkFixture", decks: int) -> None:
+    """Benchmark reusing a shoe: resetting and reshuffling it.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+        decks (int): The number of decks in the shoe.
+
+    Asserts:
+        - The shoe is full.
+
+    Returns:
+        None
+    """
+    benchmark.group = f"deck {decks} deck(s)"
+    deck = Deck(decks, seed=1)
+
+    def reshuffle() -> None:
+        deck.reset()
+        deck.shuffle()
+
+    benchmark(reshuffle)
+    assert len(deck) == 52 * decks
+
+
+@pytest.mark.parametrize("as_cards", [False, True])  # type: ignore
+@pytest.mark.parametrize("decks", [1, 6])  # type: ignore
+def test_deal_shoe(benchmark: "BenchmarkFixture", decks: int, as_cards: bool) -> None:
+    """Benchmark dealing a whole shuffled shoe in hands of two cards.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+        decks (int): The number of decks in the shoe.
+        as_cards (bool): Deal card objects instead of encodings.
+
+    Asserts:
+        - Every card of the shoe is dealt.
+
+    Returns:
+        None
+    """
+    benchmark.group = f"deck {decks} deck(s)"
+    deck = Deck(decks, seed=1)
+    deck.shuffle()
+
+    def deal() -> int:
+        deck.reset()
+        draw = deck.draw_cards if as_cards else deck.draw
+        return sum(len(draw(2)) for _ in range(26 * decks))
+
+    assert benchmark(deal) == 52 * decks
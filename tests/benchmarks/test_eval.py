@@ -0,0 +1,98 @@
+"""See Description below.
+
+Module Name: test_eval.py
+
+Description:
+This module benchmarks 7-card hand evaluation in card_deck.eval at several batch sizes: one hand at a time with
+`evaluate`, lists of hands with `evaluate_many`, and NumPy arrays with `evaluate_batch`. Divide the batch size by
+the mean time for hands per second.
+
+Dependencies:
+- pytest
+- pytest-benchmark
+- card_deck.eval
+"""
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from card_deck.eval import evaluate
+from card_deck.eval import evaluate_batch
+from card_deck.eval import evaluate_many
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+BATCH_SIZES = [1, 100, 10_000]
+
+
+def _hands(count: int) -> list[list[int]]:
+    """Deal random 7-card hands.
+
+    Args:
+        count (int): The number of hands.
+
+    Returns:
+        list[list[int]]: The encoded hands.
+    """
+    generator = random.Random(count)
+    return [generator.sample(range(52), 7) for _ in range(count)]
+
+
+@pytest.mark.parametrize("size", BATCH_SIZES)  # type: ignore
+def test_evaluate_loop(benchmark: "BenchmarkFixture", size: int) -> None:
+    """Benchmark evaluating hands one at a time.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+        size (int): The number of hands.
+
+    Asserts:
+        - Every hand gets a value.
+
+    Returns:
+        None
+    """
+    benchmark.group = f"evaluate {size} hand(s)"
+    hands = _hands(size)
+    assert len(benchmark(lambda: [evaluate(hand) for hand in hands])) == size
+
+
+@pytest.mark.parametrize("size", BATCH_SIZES)  # type: ignore
+def test_evaluate_many(benchmark: "BenchmarkFixture", size: int) -> None:
+    """Benchmark evaluating a list of hands.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+        size (int): The number of hands.
+
+    Asserts:
+        - The values match single-hand evaluation.
+
+    Returns:
+        None
+    """
+    benchmark.group = f"evaluate {size} hand(s)"
+    hands = _hands(size)
+    assert benchmark(evaluate_many, hands) == [evaluate(hand) for hand in hands]
+
+
+@pytest.mark.parametrize("size", BATCH_SIZES)  # type: ignore
+def test_evaluate_batch(benchmark: "BenchmarkFixture", size: int) -> None:
+    """Benchmark evaluating a NumPy array of hands.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+        size (int): The number of hands.
+
+    Asserts:
+        - The values match single-hand evaluation.
+
+    Returns:
+        None
+    """
+    np = pytest.importorskip("numpy")
+    benchmark.group = f"evaluate {size} hand(s)"
+    hands = _hands(size)
+    values = benchmark(evaluate_batch, np.array(hands, dtype=np.uint8))
+    assert values.tolist() == [evaluate(hand) for hand in hands]
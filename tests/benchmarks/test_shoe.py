@@ -0,0 +1,61 @@
+"""See Description below.
+
+Module Name: test_shoe.py
+
+Description:
+This module benchmarks blackjack rounds dealt from a six-deck `Shoe`: each round deals the player and dealer two
+cards, draws both to 17, reads the true count and reshuffles at the cut card.
+
+Dependencies:
+- pytest
+- pytest-benchmark
+- card_deck.shoe
+"""
+from typing import TYPE_CHECKING
+
+import pytest
+
+from card_deck.shoe import BlackjackHand
+from card_deck.shoe import Shoe
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+ROUNDS = 1_000
+
+
+def test_blackjack_rounds(benchmark: "BenchmarkFixture") -> None:
+    """Benchmark dealing 1,000 blackjack rounds from a six-deck shoe.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+
+    Asserts:
+        - Every round ends with both hands at 17 or more.
+
+    Returns:
+        None
+    """
+    benchmark.group = "shoe"
+    shoe = Shoe(6, seed=1)
+    shoe.shuffle()
+    player, dealer = BlackjackHand(), BlackjackHand()
+
+    def play() -> float:
+        true_count = 0.0
+        for _ in range(ROUNDS):
+            shoe.start_round()
+            player.clear()
+            dealer.clear()
+            for hand in (player, dealer, player, dealer):
+                hand.add(shoe.deal())
+            while player.total < 17:
+                player.add(shoe.deal())
+            while dealer.total < 17:
+                dealer.add(shoe.deal())
+            true_count = shoe.true_count
+        return true_count
+
+    benchmark(play)
+    assert player.total >= 17 and dealer.total >= 17
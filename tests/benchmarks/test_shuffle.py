@@ -0,0 +1,58 @@
+"""See Description below.
+
+Module Name: test_shuffle.py
+
+Description:
+This module benchmarks shuffling a 52-card deck and a six-deck shoe with each shuffle source: the default
+`random.Random`, the seeded `SeededSource`, the buffered CSPRNG `SecureSource`, and `secrets.SystemRandom`, which
+makes a system call for every swap. Compare the "OPS" column (shuffles per second) within each group.
+
+Dependencies:
+- pytest
+- pytest-benchmark
+- card_deck.rng
+"""
+import random
+import secrets
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import pytest
+
+from card_deck.rng import SecureSource
+from card_deck.rng import SeededSource
+from card_deck.rng import ShuffleSource
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+SOURCES: dict[str, Callable[[], ShuffleSource]] = {
+    "random.Random": lambda: random.Random(1),
+    "SeededSource": lambda: SeededSource(1),
+    "SecureSource": SecureSource,
+    "secrets.SystemRandom": secrets.SystemRandom,
+}
+
+
+@pytest.mark.parametrize("decks", [1, 6])  # type: ignore
+@pytest.mark.parametrize("name", list(SOURCES))  # type: ignore
+def test_shuffle_throughput(benchmark: "BenchmarkFixture", name: str, decks: int) -> None:
+    """Benchmark shuffling a shoe in place with one source.
+    Args:
+        benchmark (BenchmarkFixture): The pytest-benchmark fixture.
+        name (str): The name of the shuffle source.
+        decks (int): The number of decks in the shoe.
+
+    Asserts:
+        - The shuffled shoe still holds every card.
+
+    Returns:
+        None
+    """
+    benchmark.group = f"shuffle {decks} deck(s)"
+    source = SOURCES[name]()
+    cards = bytearray(range(52)) * decks
+    benchmark(source.shuffle, cards)
+    assert sorted(cards) == sorted(bytearray(range(52)) * decks)
@@ -0,0 +1,29 @@
+"""See Description below.
+
+Module Name: conftest.py
+
+Description:
+This module holds fixtures shared by every test module. It points the evaluator's disk cache at a temporary directory
+for the whole session, so running the tests never writes to ``~/.cache/card_deck``.
+
+Dependencies:
+- pytest
+"""
+from collections.abc import Iterator
+
+import pytest
+
+
+@pytest.fixture(name="cache_dir", scope="session", autouse=True)  # type: ignore
+def fixture_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Set ``CARD_DECK_CACHE_DIR`` to a session temporary directory and restore it afterwards.
+
+    Args:
+        tmp_path_factory (pytest.TempPathFactory): The pytest session temporary path factory.
+
+    Yields:
+        None
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("CARD_DECK_CACHE_DIR", str(tmp_path_factory.mktemp("card_deck_cache")))
+        yield
@@ -0,0 +1,121 @@
+"""See Description below.
+
+Module Name: test_batch.py
+
+Description:
+This module contains test cases for the NumPy-vectorized deck engine in card_deck.batch. It verifies batch creation,
+independent and reproducible per-row shuffling, round-robin dealing into hands and conversion between encodings and
+InternedCard objects. The tests are skipped when NumPy is not installed.
+
+Dependencies:
+- pytest
+- numpy
+- card_deck.batch
+- card_deck.InternedCard
+"""
+import pytest
+
+from card_deck import InternedCard
+from card_deck import Rank
+from card_deck import Suite
+from card_deck.exceptions import EmptyDeck
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidDeck
+
+np = pytest.importorskip("numpy")
+batch = pytest.importorskip("card_deck.batch")
+
+
+@pytest.mark.parametrize("decks", [1, 6])  # type: ignore
+def test_new_decks(decks: int) -> None:
+    """Test creating a batch of ordered decks.
+    Args:
+        decks (int): The number of standard decks per row.
+
+    Asserts:
+        - The batch is a (N, 52 * decks) uint8 array of ordered decks.
+
+    Returns:
+        None
+    """
+    decks_array = batch.new_decks(3, decks)
+    assert decks_array.shape == (3, 52 * decks)
+    assert decks_array.dtype == np.uint8
+    assert (decks_array[:, :52] == np.arange(52)).all()
+
+
+def test_shuffle_rows_independently() -> None:
+    """Test that shuffling permutes each row independently and reproducibly.
+
+    Asserts:
+        - Every row remains a permutation of a deck.
+        - Rows are shuffled differently from each other.
+        - The same seed produces the same batch.
+
+    Returns:
+        None
+    """
+    first = batch.shuffled_decks(100, rng=7)
+    second = batch.shuffled_decks(100, rng=np.random.default_rng(7))
+    assert (np.sort(first, axis=1) == np.arange(52)).all()
+    assert len({row.tobytes() for row in first}) == 100
+    assert (first == second).all()
+
+
+def test_shuffle_rejects_non_batches() -> None:
+    """Test that malformed batches raise InvalidDeck.
+
+    Asserts:
+        - Arrays with the wrong dtype or dimensions raise InvalidDeck.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidDeck):
+        batch.shuffle(np.arange(52, dtype=np.uint8))
+    with pytest.raises(InvalidDeck):
+        batch.shuffle(np.zeros((2, 52), dtype=np.int64))
+    with pytest.raises(InvalidDeck):
+        batch.new_decks(1, 0)
+
+
+def test_deal_round_robin() -> None:
+    """Test dealing hands round-robin from a batch.
+
+    Asserts:
+        - Player p receives cards start + p, start + p + players, ...
+        - The next position follows the dealt cards.
+        - Dealing past the end of the decks raises EmptyDeck.
+
+    Returns:
+        None
+    """
+    decks_array = batch.shuffled_decks(4, rng=1)
+    hands, position = batch.deal(decks_array, players=3, cards=2, start=1)
+    assert hands.shape == (4, 3, 2)
+    assert position == 7
+    assert (hands[:, 0] == decks_array[:, [1, 4]]).all()
+    assert (hands[:, 2] == decks_array[:, [3, 6]]).all()
+    with pytest.raises(EmptyDeck):
+        batch.deal(decks_array, players=9, cards=6)
+
+
+def test_card_conversion() -> None:
+    """Test conversion between encoded arrays and InternedCard objects.
+
+    Asserts:
+        - Encodings convert to canonical cards, keeping the nesting.
+        - Cards convert back to the same encodings.
+        - Out-of-range encodings raise InvalidCard.
+
+    Returns:
+        None
+    """
+    ace_of_spades = InternedCard(Suite.SPADES, Rank.ACE)
+    assert batch.to_cards(ace_of_spades.to_int()) is ace_of_spades
+    nested = batch.to_cards(np.array([[0, 1], [2, 3]], dtype=np.uint8))
+    assert nested == [[InternedCard.from_int(0), InternedCard.from_int(1)],
+                      [InternedCard.from_int(2), InternedCard.from_int(3)]]
+    assert batch.from_cards([ace_of_spades, InternedCard.from_int(5)]).tolist() == [3, 5]
+    with pytest.raises(InvalidCard):
+        batch.to_cards([52])
@@ -0,0 +1,191 @@
+"""See Description below.
+
+Module Name: test_cache.py
+
+Description:
+This module contains test cases for the result cache in card_deck.cache. It checks LRU eviction and time to live
+against a scripted clock, that results written to the sqlite tier survive a new cache, that the statistics
+count every outcome, that card arguments encode to compact deterministic keys, and that memoized equity and
+evaluation calls are computed once.
+
+Dependencies:
+- pytest
+- card_deck.cache
+- card_deck.eval
+- card_deck.isomorphism
+- card_deck.simulate
+"""
+from pathlib import Path
+
+import pytest
+
+from card_deck import CardSet
+from card_deck import InternedCard
+from card_deck import parse_many
+from card_deck.cache import CacheStats
+from card_deck.cache import ResultCache
+from card_deck.cache import cards_key
+from card_deck.cache import memoize
+from card_deck.eval import evaluate_cards
+from card_deck.exceptions import CardDeckTypeError
+from card_deck.exceptions import CardDeckValueError
+from card_deck.isomorphism import canonicalize
+from card_deck.simulate import EquityResult
+from card_deck.simulate import equity
+
+
+class Clock:  # pylint: disable=too-few-public-methods
+    """A scripted wall clock.
+
+    Attributes:
+        now (float): The current time in seconds.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the clock at time 1000."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time.
+
+        Returns:
+            float: The time in seconds.
+        """
+        return self.now
+
+
+def test_lru_eviction() -> None:
+    """Test that the least recently used entries are evicted.
+
+    Asserts:
+        - Reading an entry protects it from eviction.
+        - Evictions, hits and misses are counted.
+
+    Returns:
+        None
+    """
+    cache = ResultCache(2)
+    cache.set(b"a", 1)
+    cache.set(b"b", 2)
+    assert cache.get(b"a") == 1
+    cache.set(b"c", 3)
+    assert cache.get(b"b") is None and cache.get(b"b", "missing") == "missing"
+    assert cache.get(b"a") == 1 and cache.get(b"c") == 3
+    assert len(cache) == cache.maxsize == 2
+    assert cache.stats() == CacheStats(hits=3, misses=2, hit_rate=0.6, disk_hits=0, evictions=1, expirations=0, size=2)
+    cache.clear()
+    assert len(cache) == 0
+    for limits in ({"maxsize": 0}, {"ttl": 0}):
+        with pytest.raises(CardDeckValueError):
+            ResultCache(**limits)  # type: ignore[arg-type, unused-ignore]
+
+
+def test_time_to_live(tmp_path: Path) -> None:
+    """Test that entries expire in memory and on disk.
+    Args:
+        tmp_path (Path): The pytest temporary directory fixture.
+
+    Asserts:
+        - An entry is returned until its time to live has passed, then counted as one expiration.
+        - purge() deletes the expired entries of both tiers.
+
+    Returns:
+        None
+    """
+    clock = Clock()
+    with ResultCache(10, ttl=60, path=tmp_path / "cache.sqlite", clock=clock) as cache:
+        cache.set(b"a", 1)
+        clock.now += 59
+        assert cache.get(b"a") == 1
+        clock.now += 1
+        assert cache.get(b"a") is None
+        assert cache.stats().expirations == 1
+        cache.set(b"b", 2)
+        cache.set(b"c", 3)
+        clock.now += 60
+        assert cache.purge() == 4
+        assert len(cache) == 0 and cache.get(b"b") is None
+
+
+def test_disk_tier(tmp_path: Path) -> None:
+    """Test that results survive in the database and are promoted to memory.
+    Args:
+        tmp_path (Path): The pytest temporary directory fixture.
+
+    Asserts:
+        - A new cache on the same database finds the results, counting disk hits only for the first lookup.
+        - Entries evicted from memory are still found on disk.
+        - Closing the database keeps the memory tier usable.
+
+    Returns:
+        None
+    """
+    path = tmp_path / "cache.sqlite"
+    with ResultCache(1, path=path) as cache:
+        cache.set(b"a", {"equity": 0.5})
+        cache.set(b"b", [1, 2])
+        assert cache.get(b"a") == {"equity": 0.5}
+        assert cache.stats().disk_hits == 1
+    with ResultCache(path=path) as cache:
+        assert cache.get(b"b") == [1, 2] and cache.get(b"b") == [1, 2]
+        assert cache.stats().disk_hits == 1 and cache.stats().hits == 2
+    assert cache.get(b"b") == [1, 2] and cache.get(b"a") is None
+    with ResultCache(path=path) as cache:
+        cache.clear()
+    with ResultCache(path=path) as cache:
+        assert cache.get(b"a") is None
+
+
+def test_cards_key() -> None:
+    """Test the encoding of call arguments.
+
+    Asserts:
+        - Cards and their encodings give the same compact key.
+        - Keyword arguments are order-independent, and different values give different keys.
+        - Unsupported arguments are rejected.
+
+    Returns:
+        None
+    """
+    hero, villain = parse_many("As Kd"), parse_many("7h 7c")
+    key = cards_key([hero, villain], board=parse_many("2c 3d 4h"), trials=1000)
+    codes = [[card.to_int() for card in hero], [card.to_int() for card in villain]]
+    assert key == cards_key(codes, trials=1000, board=[4, 9, 14])
+    assert len(key) < 60
+    assert cards_key(hero[0]) != cards_key(hero[1]) != cards_key(CardSet(hero))
+    assert cards_key([1, 2]) != cards_key([1, 2, 60]) != cards_key((1, 2, "x"))
+    assert cards_key(None, True, 1, 1.0, "1", b"1") == cards_key(None, True, 1, 1.0, "1", b"1")
+    assert cards_key(True) != cards_key(1)
+    with pytest.raises(CardDeckTypeError):
+        cards_key(print)
+
+
+def test_memoize() -> None:
+    """Test memoizing equity and evaluation calls.
+
+    Asserts:
+        - A repeated equity request is answered from the cache with the same result.
+        - Functions sharing a cache do not share keys.
+        - A custom key can reuse results across suit-isomorphic hands.
+
+    Returns:
+        None
+    """
+    cache = ResultCache()
+    cached_equity = memoize(cache)(equity)
+    result = cached_equity([parse_many("As Ad"), parse_many("Kh Kd")], trials=2000, seed=3, workers=1)
+    assert isinstance(result, EquityResult)
+    assert cached_equity([parse_many("As Ad"), parse_many("Kh Kd")], trials=2000, seed=3, workers=1) is result
+    assert cache.stats()[:2] == (1, 1)
+    cached_evaluate = memoize(cache)(evaluate_cards)
+    assert cached_evaluate(parse_many("As Ks Qs Js Ts")) == evaluate_cards(parse_many("As Ks Qs Js Ts"))
+    assert cache.stats().misses == 2
+    calls = []
+
+    def suited(hand: list[InternedCard]) -> int:
+        calls.append(hand)
+        return len(calls)
+
+    cached_suited = memoize(cache, key=lambda hand: canonicalize(hand).key.to_bytes(16, "little"))(suited)
+    assert cached_suited(parse_many("Ah Kh")) == cached_suited(parse_many("As Ks")) == 1
+    assert len(calls) == 1
@@ -22,11 +22,23 @@ Dependencies:
 - card_deck.exceptions.InvalidCardSuite
 """
 
+import copy
+import pickle
+
 import pytest
 
 from card_deck import Card
+from card_deck import InternedCard
 from card_deck import Rank
 from card_deck import Suite
+from card_deck import format_many
+from card_deck import parse_many
+from card_deck.card import CARD_COUNT
+from card_deck.card import decode
+from card_deck.card import encode
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidCardAttribute
 from card_deck.exceptions import InvalidCardRank
 from card_deck.exceptions import InvalidCardSuite
 
@@ -67,7 +79,7 @@ def test_invalid_card_initialization_suite(rank: Rank) -> None:
         None
     """
     with pytest.raises(InvalidCardSuite):
-        Card("InvalidSuit", rank)
+        Card("InvalidSuit", rank)  # type: ignore[arg-type, unused-ignore]
 
 
 @pytest.mark.parametrize("suite", list(Suite))  # type: ignore
@@ -83,7 +95,7 @@ def test_invalid_card_initialization_rank(suite: Suite) -> None:
         None
     """
     with pytest.raises(InvalidCardRank):
-        Card(suite, "InvalidRank")
+        Card(suite, "InvalidRank")  # type: ignore[arg-type, unused-ignore]
 
 
 @pytest.mark.parametrize("rank", list(Rank))  # type: ignore
@@ -184,7 +196,7 @@ def test_set_suite_invalid(suite: Suite, rank: Rank) -> None:
     """
     card = Card(suite, rank)
     with pytest.raises(InvalidCardSuite):
-        card.suite = "InvalidSuite"
+        card.suite = "InvalidSuite"  # type: ignore[assignment, unused-ignore]
 
 
 @pytest.mark.parametrize("rank", list(Rank))  # type: ignore
@@ -203,7 +215,7 @@ def test_set_rank_invalid(suite: Suite, rank: Rank) -> None:
     """
     card = Card(suite, rank)
     with pytest.raises(InvalidCardRank):
-        card.rank = "InvalidRank"
+        card.rank = "InvalidRank"  # type: ignore[assignment, unused-ignore]
 
 
 @pytest.mark.parametrize("rank", list(Rank))  # type: ignore
@@ -242,3 +254,296 @@ def test_del_rank(suite: Suite, rank: Rank) -> None:
     card = Card(suite, rank)
     with pytest.raises(AttributeError):
         del card.rank
+
+
+@pytest.mark.parametrize("rank", list(Rank))  # type: ignore
+@pytest.mark.parametrize("suite", list(Suite))  # type: ignore
+def test_interned_card_is_canonical(suite: Suite, rank: Rank) -> None:
+    """Test that InternedCard returns one shared instance per suite and rank.
+    Args:
+        suite (Suite): A valid suite from the Suite enum.
+        rank (Rank): A valid rank from the Rank enum.
+
+    Asserts:
+        - Repeated construction returns the same object.
+        - Interning a regular Card returns that same object.
+        - Copies of an interned card are the card itself.
+
+    Returns:
+        None
+    """
+    card = InternedCard(suite, rank)
+    assert card is InternedCard(suite, rank)
+    assert card is Card(suite, rank).intern()
+    assert copy.copy(card) is card
+    assert copy.deepcopy(card) is card
+    assert card.suite == suite
+    assert card.rank == rank
+    assert repr(card) == f"{rank} of {suite}"
+
+
+def test_interned_card_invalid() -> None:
+    """Test the initialization of an InternedCard object with an invalid suite or rank.
+
+    Asserts:
+        - Raises an InvalidCardSuite exception when the suite is invalid.
+        - Raises an InvalidCardRank exception when the rank is invalid.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidCardSuite):
+        InternedCard("InvalidSuite", Rank.ACE)  # type: ignore[arg-type, unused-ignore]
+    with pytest.raises(InvalidCardSuite):
+        InternedCard([], Rank.ACE)  # type: ignore[arg-type, unused-ignore]
+    with pytest.raises(InvalidCardRank):
+        InternedCard(Suite.SPADES, "InvalidRank")  # type: ignore[arg-type, unused-ignore]
+
+
+def test_interned_card_immutable() -> None:
+    """Test that the suite and rank of an InternedCard cannot be set or deleted.
+
+    Asserts:
+        - Raises an InvalidCardAttribute exception on every mutation.
+
+    Returns:
+        None
+    """
+    card = InternedCard(Suite.HEARTS, Rank.TEN)
+    with pytest.raises(InvalidCardAttribute):
+        card.suite = Suite.CLUBS
+    with pytest.raises(InvalidCardAttribute):
+        card.rank = Rank.TWO
+    with pytest.raises(InvalidCardAttribute):
+        del card.suite
+    with pytest.raises(InvalidCardAttribute):
+        del card.rank
+    assert card.suite == Suite.HEARTS
+    assert card.rank == Rank.TEN
+
+
+@pytest.mark.parametrize("rank", list(Rank))  # type: ignore
+@pytest.mark.parametrize("suite", list(Suite))  # type: ignore
+def test_card_int_round_trip(suite: Suite, rank: Rank) -> None:
+    """Test the canonical integer encoding of a Card object.
+    Args:
+        suite (Suite): A valid suite from the Suite enum.
+        rank (Rank): A valid rank from the Rank enum.
+
+    Asserts:
+        - The encoding is derived from the enum values.
+        - Card.from_int and InternedCard.from_int round-trip the encoding.
+
+    Returns:
+        None
+    """
+    card = Card(suite, rank)
+    code = card.to_int()
+    assert code == (rank.value - 1) * 4 + suite.value - 1
+    assert encode(suite, rank) == code
+    assert decode(code) == (suite, rank)
+    assert Card.from_int(code).suite == suite
+    assert Card.from_int(code).rank == rank
+    assert InternedCard.from_int(code) is InternedCard(suite, rank)
+
+
+def test_card_encoding_is_dense() -> None:
+    """Test that the card encodings cover 0..51 exactly once.
+
+    Asserts:
+        - Every suite and rank pair has a distinct encoding in range.
+
+    Returns:
+        None
+    """
+    codes = sorted(encode(suite, rank) for suite in Suite for rank in Rank)
+    assert codes == list(range(CARD_COUNT))
+
+
+@pytest.mark.parametrize("code", [-1, CARD_COUNT, 1.0, "1", None])  # type: ignore
+def test_card_from_int_invalid(code: object) -> None:
+    """Test creating a Card object from an invalid encoding.
+    Args:
+        code (object): An invalid card encoding.
+
+    Asserts:
+        - Raises an InvalidCard exception.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidCard):
+        Card.from_int(code)  # type: ignore[arg-type, unused-ignore]
+    with pytest.raises(InvalidCard):
+        InternedCard.from_int(code)  # type: ignore[arg-type, unused-ignore]
+
+
+def test_card_uses_slots() -> None:
+    """Test that a Card object has no per-instance dictionary.
+
+    Asserts:
+        - Arbitrary attributes cannot be assigned.
+
+    Returns:
+        None
+    """
+    card = Card(Suite.CLUBS, Rank.TWO)
+    assert not hasattr(card, "__dict__")
+    with pytest.raises(AttributeError):
+        card.colour = "black"  # type: ignore[attr-defined, unused-ignore]  # pylint: disable=assigning-non-slot
+
+
+@pytest.mark.parametrize("rank", list(Rank))  # type: ignore
+@pytest.mark.parametrize("suite", list(Suite))  # type: ignore
+def test_card_parse_format_round_trip(suite: Suite, rank: Rank) -> None:
+    """Test parsing and formatting a Card object in short and long notation.
+    Args:
+        suite (Suite): A valid suite from the Suite enum.
+        rank (Rank): A valid rank from the Rank enum.
+
+    Asserts:
+        - The short and long forms parse back to the same card, in any letter case.
+        - The long form matches the card's repr.
+        - InternedCard.parse returns the canonical card.
+
+    Returns:
+        None
+    """
+    card = Card(suite, rank)
+    short, long = card.format(), card.format("long")
+    assert long == repr(card) == f"{rank} of {suite}"
+    assert len(short) == 2
+    for text in (short, short.upper(), short.lower(), long, long.lower()):
+        assert Card.parse(text).to_int() == card.to_int()
+    assert InternedCard.parse(short) is card.intern()
+
+
+@pytest.mark.parametrize(("text", "expected"), [  # type: ignore
+    ("10h", (Suite.HEARTS, Rank.TEN)),
+    ("Th", (Suite.HEARTS, Rank.TEN)),
+    ("10 of HEARTS", (Suite.HEARTS, Rank.TEN)),
+    ("  two   of  clubs ", (Suite.CLUBS, Rank.TWO)),
+    ("kS", (Suite.SPADES, Rank.KING)),
+])
+def test_card_parse_spellings(text: str, expected: tuple[Suite, Rank]) -> None:
+    """Test the accepted spellings of card text.
+    Args:
+        text (str): The card text.
+        expected (tuple[Suite, Rank]): The expected suite and rank.
+
+    Asserts:
+        - The parsed card has the expected suite and rank.
+
+    Returns:
+        None
+    """
+    card = Card.parse(text)
+    assert (card.suite, card.rank) == expected
+
+
+@pytest.mark.parametrize("text", ["", "1s", "Ax", "11 of HEARTS", "As Kd", None])  # type: ignore
+def test_card_parse_invalid(text: str) -> None:
+    """Test parsing invalid card text.
+    Args:
+        text (str): Invalid card text.
+
+    Asserts:
+        - Raises an InvalidCard exception.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidCard):
+        Card.parse(text)
+
+
+def test_parse_many_and_format_many() -> None:
+    """Test parsing and formatting whole hands.
+
+    Asserts:
+        - Whitespace, commas and concatenated short cards are accepted.
+        - Long-notation cards are separated by commas.
+        - Formatting joins the cached card strings.
+        - Invalid parts and styles raise exceptions.
+
+    Returns:
+        None
+    """
+    hand = [InternedCard(Suite.SPADES, Rank.ACE), InternedCard(Suite.DIAMONDS, Rank.KING),
+            InternedCard(Suite.HEARTS, Rank.TEN)]
+    assert parse_many("As Kd, Th") == hand
+    assert parse_many("AsKd10h") == hand
+    assert parse_many("ACE of SPADES, king of diamonds,10 of HEARTS") == hand
+    assert not parse_many(" , ")
+    assert format_many(hand) == "As Kd Th"
+    assert format_many(hand, "long", ", ") == "ACE of SPADES, KING of DIAMONDS, TEN of HEARTS"
+    assert parse_many(format_many(hand, "long", ", ")) == hand
+    with pytest.raises(InvalidCard):
+        parse_many("As Kx")
+    with pytest.raises(CardDeckValueError):
+        format_many(hand, "emoji")
+    with pytest.raises(CardDeckValueError):
+        hand[0].format("emoji")
+
+
+def test_card_equality_hash_and_ordering() -> None:
+    """Test comparing, hashing and sorting cards by their encoding.
+
+    Asserts:
+        - Cards with the same suite and rank are equal and hash alike, interned or not.
+        - Cards are not equal to other objects, and ordering them against other objects raises TypeError.
+        - Cards sort by rank, ace low, and then by suite.
+
+    Returns:
+        None
+    """
+    card = Card(Suite.HEARTS, Rank.ACE)
+    assert card == Card(Suite.HEARTS, Rank.ACE) == card.intern()
+    assert card != Card(Suite.SPADES, Rank.ACE)
+    assert card != card.to_int()
+    assert len({card, Card(Suite.HEARTS, Rank.ACE), card.intern()}) == 1
+    assert hash(card) == card.to_int()
+    with pytest.raises(TypeError):
+        assert card < card.to_int()  # type: ignore[operator, unused-ignore]
+    cards = [Card.from_int(code) for code in reversed(range(CARD_COUNT))]
+    assert [c.to_int() for c in sorted(cards)] == list(range(CARD_COUNT))
+    two, three = Card(Suite.SPADES, Rank.TWO), Card(Suite.CLUBS, Rank.THREE)
+    assert card < two < three and three > two >= Card(Suite.SPADES, Rank.TWO) >= card
+
+
+def test_card_pickling() -> None:
+    """Test that cards pickle as their encoding.
+
+    Asserts:
+        - Plain cards unpickle to new, equal cards.
+        - Interned cards unpickle to the canonical instance.
+        - A pickled deck takes under 10 bytes per card.
+
+    Returns:
+        None
+    """
+    card = Card(Suite.CLUBS, Rank.KING)
+    restored = pickle.loads(pickle.dumps(card))
+    assert not isinstance(restored, InternedCard) and restored == card and restored is not card
+    hand = [InternedCard.from_int(code) for code in range(CARD_COUNT)]
+    assert all(a is b for a, b in zip(pickle.loads(pickle.dumps(hand)), hand))
+    assert len(pickle.dumps(hand)) < 10 * CARD_COUNT
+
+
+def test_interned_card_is_frozen() -> None:
+    """Test that no attribute of an interned card can be set or deleted.
+
+    Asserts:
+        - Setting or deleting the encoding or a new attribute raises InvalidCardAttribute.
+
+    Returns:
+        None
+    """
+    card = InternedCard(Suite.CLUBS, Rank.KING)
+    with pytest.raises(InvalidCardAttribute):
+        card._code = 0  # pylint: disable=protected-access
+    with pytest.raises(InvalidCardAttribute):
+        del card._code  # pylint: disable=protected-access
+    with pytest.raises(InvalidCardAttribute):
+        card.owner = "table 1"
+    assert card.to_int() == encode(Suite.CLUBS, Rank.KING)
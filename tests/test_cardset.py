@@ -0,0 +1,194 @@
+"""See Description below.
+
+Module Name: test_cardset.py
+
+Description:
+This module contains test cases for validating the CardSet bitmask hand representation. It uses the pytest framework
+to verify construction from cards, encodings and masks, set algebra (|, &, -, ^, ~), membership, popcount length,
+per-suit and per-rank masks, iteration in rank order, and exception handling (InvalidCard) for invalid input.
+
+Dependencies:
+- pytest
+- card_deck.Card
+- card_deck.CardSet
+- card_deck.Rank
+- card_deck.Suite
+- card_deck.exceptions.CardDeckTypeError
+- card_deck.exceptions.InvalidCard
+"""
+import random
+from collections.abc import Callable
+
+import pytest
+
+from card_deck import Card
+from card_deck import CardSet
+from card_deck import InternedCard
+from card_deck import Rank
+from card_deck import Suite
+from card_deck.exceptions import CardDeckTypeError
+from card_deck.exceptions import InvalidCard
+
+
+def test_cardset_construction() -> None:
+    """Test building CardSet objects from cards, encodings and masks.
+
+    Asserts:
+        - Cards and their encodings produce equal sets.
+        - Duplicates are ignored.
+        - A set round-trips through its mask.
+
+    Returns:
+        None
+    """
+    cards = [Card(Suite.SPADES, Rank.ACE), Card(Suite.HEARTS, Rank.KING), Card(Suite.SPADES, Rank.ACE)]
+    card_set = CardSet(cards)
+    assert card_set == CardSet.from_codes(card.to_int() for card in cards)
+    assert len(card_set) == 2
+    assert CardSet.from_mask(card_set.mask) == card_set
+    assert hash(CardSet.from_mask(card_set.mask)) == hash(card_set)
+    assert len(CardSet.full()) == 52
+    assert not CardSet()
+
+
+@pytest.mark.parametrize("codes", [[52], [-1], ["As"]])  # type: ignore
+def test_cardset_invalid_codes(codes: list[object]) -> None:
+    """Test that invalid encodings raise InvalidCard.
+    Args:
+        codes (list[object]): Invalid card encodings.
+
+    Asserts:
+        - Raises an InvalidCard exception.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidCard):
+        CardSet.from_codes(codes)  # type: ignore[arg-type, unused-ignore]
+
+
+def test_cardset_invalid_mask() -> None:
+    """Test that masks with bits outside the card lanes raise InvalidCard.
+
+    Asserts:
+        - Raises an InvalidCard exception.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidCard):
+        CardSet.from_mask(1 << 13)
+
+
+def test_cardset_algebra_matches_frozenset() -> None:
+    """Test that CardSet set algebra matches Python set semantics on random hands.
+
+    Asserts:
+        - Union, intersection, difference, symmetric difference and complement match frozenset.
+        - Subset, superset and disjointness match frozenset.
+
+    Returns:
+        None
+    """
+    rng = random.Random(6)
+    for _ in range(200):
+        left = frozenset(rng.sample(range(52), rng.randint(0, 20)))
+        right = frozenset(rng.sample(range(52), rng.randint(0, 20)))
+        left_set, right_set = CardSet.from_codes(left), CardSet.from_codes(right)
+        assert set((left_set | right_set).codes()) == left | right
+        assert set((left_set & right_set).codes()) == left & right
+        assert set((left_set - right_set).codes()) == left - right
+        assert set((left_set ^ right_set).codes()) == left ^ right
+        assert set((~left_set).codes()) == frozenset(range(52)) - left
+        assert (left_set <= right_set) == (left <= right)
+        assert (left_set >= right_set) == (left >= right)
+        assert left_set.isdisjoint(right_set) == left.isdisjoint(right)
+        assert all((code in left_set) == (code in left) for code in range(52))
+
+
+class Reflected:  # pylint: disable=too-few-public-methods
+    """An operand that handles the reflected union of a CardSet."""
+
+    def __ror__(self, other: object) -> str:
+        """Return a marker for the reflected union.
+
+        Args:
+            other (object): The left operand.
+
+        Returns:
+            str: The marker.
+        """
+        return "reflected"
+
+
+def test_cardset_rejects_other_operands() -> None:
+    """Test that set operators and comparisons reject operands that are not card sets.
+
+    Asserts:
+        - Operators and comparisons raise TypeError rather than AttributeError.
+        - The reflected operator of the other operand is used.
+        - isdisjoint raises a CardDeckTypeError.
+
+    Returns:
+        None
+    """
+    card_set = CardSet.from_codes([0, 1])
+    operations: tuple[Callable[[], object], ...] = (
+        lambda: card_set | 5,  # type: ignore[operator, unused-ignore]
+        lambda: card_set & {1},  # type: ignore[operator, unused-ignore]
+        lambda: card_set - [1],  # type: ignore[operator, unused-ignore]
+        lambda: card_set ^ 5,  # type: ignore[operator, unused-ignore]
+        lambda: card_set <= {1},  # type: ignore[operator, unused-ignore]
+        lambda: card_set >= frozenset(),  # type: ignore[operator, unused-ignore]
+    )
+    for operation in operations:
+        with pytest.raises(TypeError):
+            operation()
+    assert card_set | Reflected() == "reflected"
+    with pytest.raises(CardDeckTypeError):
+        card_set.isdisjoint({1})  # type: ignore[arg-type, unused-ignore]
+
+
+def test_cardset_iterates_in_rank_order() -> None:
+    """Test that iteration yields canonical cards by rank, then suite.
+
+    Asserts:
+        - Iteration order matches sorting by (rank, suite).
+        - Iterated cards are the interned instances.
+
+    Returns:
+        None
+    """
+    codes = [51, 0, 13, 26, 4, 7]
+    card_set = CardSet.from_codes(codes)
+    assert list(card_set.codes()) == sorted(codes)
+    assert list(card_set) == [InternedCard.from_int(code) for code in sorted(codes)]
+    assert [(card.rank.value, card.suite.value) for card in card_set] == sorted(
+        (card.rank.value, card.suite.value) for card in card_set
+    )
+
+
+def test_cardset_suit_and_rank_masks() -> None:
+    """Test the per-suit and per-rank masks of a CardSet.
+
+    Asserts:
+        - Each suit mask has bit rank.value - 1 set for the ranks of that suit.
+        - The rank mask is the union of the suit masks.
+        - Membership accepts cards and encodings.
+
+    Returns:
+        None
+    """
+    card_set = CardSet([
+        Card(Suite.HEARTS, Rank.ACE), Card(Suite.HEARTS, Rank.TEN), Card(Suite.CLUBS, Rank.TEN),
+        Card(Suite.SPADES, Rank.KING),
+    ])
+    assert card_set.suit_mask(Suite.HEARTS) == 1 << 0 | 1 << 9
+    assert card_set.suit_mask(Suite.CLUBS) == 1 << 9
+    assert card_set.suit_mask(Suite.DIAMONDS) == 0
+    assert card_set.suit_mask(Suite.SPADES) == 1 << 12
+    assert card_set.count(Suite.HEARTS) == 2
+    assert card_set.rank_mask() == 1 << 0 | 1 << 9 | 1 << 12
+    assert Card(Suite.CLUBS, Rank.TEN) in card_set
+    assert Card(Suite.CLUBS, Rank.ACE) not in card_set
+    assert "10C" not in card_set
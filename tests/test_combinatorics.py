@@ -0,0 +1,111 @@
+"""See Description below.
+
+Module Name: test_combinatorics.py
+
+Description:
+This module contains test cases for the combination enumeration helpers in card_deck.combinatorics. It checks Gosper's
+hack against itertools, the colex ranking and unranking round trip, enumeration of index ranges, mapping of
+combinations onto CardSet masks and card encodings, and range splitting.
+
+Dependencies:
+- pytest
+- card_deck.combinatorics
+- card_deck.CardSet
+"""
+import itertools
+
+import pytest
+
+from card_deck import CardSet
+from card_deck.combinatorics import combination_count
+from card_deck.combinatorics import iter_card_codes
+from card_deck.combinatorics import iter_card_masks
+from card_deck.combinatorics import iter_index_masks
+from card_deck.combinatorics import rank_combination
+from card_deck.combinatorics import split_range
+from card_deck.combinatorics import unrank_combination
+from card_deck.exceptions import CardDeckValueError
+
+
+@pytest.mark.parametrize(("n", "k"), [(5, 0), (5, 5), (10, 3), (16, 4), (52, 2)])  # type: ignore
+def test_index_masks_match_itertools(n: int, k: int) -> None:
+    """Test that Gosper's hack visits every combination once, in colex order.
+    Args:
+        n (int): The number of items.
+        k (int): The number of items per combination.
+
+    Asserts:
+        - The masks are the itertools combinations, sorted colexicographically.
+        - Each combination's rank is its position.
+
+    Returns:
+        None
+    """
+    masks = list(iter_index_masks(n, k))
+    expected = sorted(itertools.combinations(range(n), k), key=lambda combo: tuple(reversed(combo)))
+    assert masks == [sum(1 << index for index in combo) for combo in expected]
+    assert len(masks) == combination_count(n, k)
+    for position, combo in enumerate(expected[:200]):
+        assert rank_combination(combo) == position
+        assert unrank_combination(position, k) == combo
+
+
+def test_index_mask_ranges() -> None:
+    """Test enumerating contiguous index ranges.
+
+    Asserts:
+        - Concatenating the split parts gives the full enumeration.
+        - Empty ranges yield nothing and invalid ranges raise CardDeckValueError.
+
+    Returns:
+        None
+    """
+    full = list(iter_index_masks(20, 4))
+    parts = split_range(len(full), 7)
+    assert [len(part) for part in parts] == [693] + [692] * 6
+    assert [mask for part in parts for mask in iter_index_masks(20, 4, part.start, part.stop)] == full
+    assert not list(iter_index_masks(20, 4, 10, 10))
+    with pytest.raises(CardDeckValueError):
+        list(iter_index_masks(20, 4, 0, len(full) + 1))
+    with pytest.raises(CardDeckValueError):
+        split_range(10, 0)
+
+
+def test_rank_combination_invalid() -> None:
+    """Test ranking and unranking invalid combinations.
+
+    Asserts:
+        - Repeated or negative indexes and negative ranks raise CardDeckValueError.
+
+    Returns:
+        None
+    """
+    with pytest.raises(CardDeckValueError):
+        rank_combination([1, 1])
+    with pytest.raises(CardDeckValueError):
+        rank_combination([-1, 2])
+    with pytest.raises(CardDeckValueError):
+        unrank_combination(-1, 2)
+
+
+def test_card_combinations() -> None:
+    """Test mapping combinations onto CardSet masks and card encodings.
+
+    Asserts:
+        - Card masks and card code tuples describe the same combinations.
+        - Every 2-card combination of the live cards appears once.
+
+    Returns:
+        None
+    """
+    live = CardSet.full() - CardSet.from_codes([0, 5, 17, 30, 51])
+    masks = list(iter_card_masks(live, 2))
+    codes = list(iter_card_codes(live, 2))
+    assert len(masks) == len(set(masks)) == combination_count(47, 2)
+    assert masks == [CardSet.from_codes(combo).mask for combo in codes]
+    assert {frozenset(combo) for combo in codes} == {
+        frozenset(combo) for combo in itertools.combinations(live.codes(), 2)
+    }
+    assert list(iter_card_codes([9, 3, 40], 2, 1, 2)) == [(9, 40)]
+    with pytest.raises(CardDeckValueError):
+        list(iter_card_masks([1, 1], 1))
@@ -0,0 +1,141 @@
+"""See Description below.
+
+Module Name: test_dealer.py
+
+Description:
+This module contains test cases for the asyncio Dealer in card_deck.dealer. It checks that seeded tables deal
+reproducible sequences whatever the batching and concurrency, that deals come from whole shuffled shoes, that
+concurrent tables are served independently, and that invalid deals and closed dealers raise exceptions.
+
+Dependencies:
+- pytest
+- card_deck.dealer.Dealer
+"""
+import asyncio
+from collections import Counter
+
+import pytest
+
+from card_deck import InternedCard
+from card_deck.dealer import DEFAULT_BATCH_SIZE
+from card_deck.dealer import DEFAULT_PREFETCH
+from card_deck.dealer import DEFAULT_WORKERS
+from card_deck.dealer import Dealer
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import EmptyDeck
+
+
+async def _deal_all(dealer: Dealer, tables: int, deals: int, count: int) -> dict[int, list[bytes]]:
+    """Deal concurrently on several tables.
+
+    Args:
+        dealer (Dealer): The dealer.
+        tables (int): The number of tables.
+        deals (int): The number of deals per table.
+        count (int): The number of cards per deal.
+
+    Returns:
+        dict[int, list[bytes]]: The deals of each table, in order.
+    """
+    async def play(table: int) -> list[bytes]:
+        return [await dealer.deal(table, count) for _ in range(deals)]
+
+    results = await asyncio.gather(*(play(table) for table in range(tables)))
+    return dict(enumerate(results))
+
+
+def test_seeded_deals_are_reproducible() -> None:
+    """Test that seeded deals do not depend on batching or concurrency.
+
+    Asserts:
+        - Two dealers with the same seed and different batch settings deal the same cards to every table.
+        - Different tables get different shoes.
+        - Deals come from one shoe until it runs short.
+
+    Returns:
+        None
+    """
+    async def run(
+        prefetch: int = DEFAULT_PREFETCH, batch_size: int = DEFAULT_BATCH_SIZE, max_batches: int = DEFAULT_WORKERS
+    ) -> dict[int, list[bytes]]:
+        async with Dealer(seed=42, prefetch=prefetch, batch_size=batch_size, max_batches=max_batches) as dealer:
+            return await _deal_all(dealer, 5, 12, 10)
+
+    first = asyncio.run(run())
+    second = asyncio.run(run(prefetch=1, batch_size=1, max_batches=1))
+    assert first == second
+    assert first[0] != first[1]
+    # Five 10-card deals use 50 cards of each 52-card shoe before the next shoe starts.
+    for start in (0, 5):
+        assert len(set(b"".join(first[3][start:start + 5]))) == 50
+
+
+def test_deal_cards_and_tables() -> None:
+    """Test dealing card objects and opening and closing tables.
+
+    Asserts:
+        - deal_cards returns canonical cards from a multi-deck shoe.
+        - Opened tables are listed until they are closed.
+
+    Returns:
+        None
+    """
+    async def run() -> None:
+        async with Dealer(decks=2, seed=1) as dealer:
+            dealer.open_table("a")
+            cards = await dealer.deal_cards("b", 104)
+            assert all(isinstance(card, InternedCard) for card in cards)
+            assert Counter(card.to_int() for card in cards) == Counter(list(range(52)) * 2)
+            assert dealer.tables == ["a", "b"]
+            dealer.close_table("a")
+            assert dealer.tables == ["b"]
+            assert len(await dealer.deal("b", 0)) == 0
+
+    asyncio.run(run())
+
+
+def test_invalid_use() -> None:
+    """Test invalid dealer settings and deals.
+
+    Asserts:
+        - Non-positive settings raise CardDeckValueError.
+        - Deals larger than a shoe, negative deals and deals from a closed dealer raise EmptyDeck.
+
+    Returns:
+        None
+    """
+    with pytest.raises(CardDeckValueError):
+        Dealer(prefetch=0)
+
+    async def run() -> None:
+        dealer = Dealer()
+        for count in (-1, 53):
+            with pytest.raises(EmptyDeck):
+                await dealer.deal("t", count)
+        await dealer.aclose()
+        with pytest.raises(EmptyDeck):
+            await dealer.deal("t", 1)
+
+    asyncio.run(run())
+
+
+def test_close_while_dealing() -> None:
+    """Test closing the dealer while deals wait for their shoes.
+
+    Asserts:
+        - Every waiting deal completes, with its cards or with EmptyDeck, and none is cancelled.
+
+    Returns:
+        None
+    """
+    async def run() -> list[bytes | BaseException]:
+        dealer = Dealer(seed=1, batch_size=1, max_batches=1)
+        deals = [asyncio.create_task(dealer.deal(table, 2)) for table in range(12)]
+        await asyncio.sleep(0)
+        await dealer.aclose()
+        return await asyncio.wait_for(asyncio.gather(*deals, return_exceptions=True), timeout=5)
+
+    results = asyncio.run(run())
+    assert len(results) == 12
+    assert all(isinstance(result, (bytes, EmptyDeck)) for result in results)
+    assert any(isinstance(result, EmptyDeck) for result in results)
@@ -0,0 +1,160 @@
+"""See Description below.
+
+Module Name: test_deck.py
+
+Description:
+This module contains test cases for validating the functionality of the Deck class. It uses the pytest framework
+to verify construction of single decks and multi-deck shoes, seeded in-place shuffling, cursor-based drawing, and
+exception handling (InvalidDeck, EmptyDeck) for malformed decks and over-drawing.
+
+Dependencies:
+- pytest
+- card_deck.Deck
+- card_deck.InternedCard
+- card_deck.exceptions.CardDeckTypeError
+- card_deck.exceptions.EmptyDeck
+- card_deck.exceptions.InvalidDeck
+"""
+import random
+from collections import Counter
+
+import pytest
+
+from card_deck import Deck
+from card_deck import InternedCard
+from card_deck.exceptions import CardDeckTypeError
+from card_deck.exceptions import EmptyDeck
+from card_deck.exceptions import InvalidDeck
+
+
+@pytest.mark.parametrize("decks", [1, 2, 6, 8])  # type: ignore
+def test_deck_initialization(decks: int) -> None:
+    """Test the initialization of a Deck object with one or more decks.
+    Args:
+        decks (int): The number of standard decks in the shoe.
+
+    Asserts:
+        - The shoe holds 52 cards per deck, each card exactly `decks` times.
+        - No cards have been dealt.
+
+    Returns:
+        None
+    """
+    deck = Deck(decks)
+    assert deck.decks == decks
+    assert deck.size == len(deck) == 52 * decks
+    assert Counter(deck.remaining) == {code: decks for code in range(52)}
+    assert deck.dealt == b""
+
+
+@pytest.mark.parametrize("decks", [0, -1, 1.5, "1", True])  # type: ignore
+def test_deck_invalid_decks(decks: object) -> None:
+    """Test the initialization of a Deck object with an invalid number of decks.
+    Args:
+        decks (object): An invalid number of decks.
+
+    Asserts:
+        - Raises an InvalidDeck exception.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidDeck):
+        Deck(decks)  # type: ignore[arg-type, unused-ignore]
+
+
+def test_deck_from_codes() -> None:
+    """Test creating a Deck object from encoded cards.
+
+    Asserts:
+        - The cards are kept in the given order.
+        - Invalid encodings and excess duplicates raise InvalidDeck.
+        - A bare integer or string raises CardDeckTypeError.
+
+    Returns:
+        None
+    """
+    assert Deck.from_codes([5, 0, 51]).remaining == bytes([5, 0, 51])
+    assert len(Deck.from_codes([7, 7], decks=2)) == 2
+    with pytest.raises(InvalidDeck):
+        Deck.from_codes([52])
+    with pytest.raises(InvalidDeck):
+        Deck.from_codes([-1])
+    with pytest.raises(InvalidDeck):
+        Deck.from_codes([7, 7])
+    with pytest.raises(InvalidDeck):
+        Deck.from_codes(["As"])  # type: ignore[list-item, unused-ignore]
+    for codes in (3, "As"):
+        with pytest.raises(CardDeckTypeError):
+            Deck.from_codes(codes, decks=4)  # type: ignore[arg-type, unused-ignore]
+
+
+def test_deck_shuffle_is_seeded_permutation() -> None:
+    """Test that shuffling permutes the deck in place and is reproducible with a seed.
+
+    Asserts:
+        - Two decks with the same seed shuffle identically.
+        - Shuffling keeps the same multiset of cards and collects dealt cards.
+
+    Returns:
+        None
+    """
+    first = Deck(2, seed=42)
+    second = Deck(2, rng=random.Random(42))
+    first.draw(10)
+    first.shuffle()
+    second.shuffle()
+    assert first.remaining == second.remaining
+    assert first.remaining != Deck(2).remaining
+    assert len(first) == 104
+    assert sorted(first.remaining) == sorted(Deck(2).remaining)
+
+
+def test_deck_draw() -> None:
+    """Test drawing encoded cards and card objects from a Deck object.
+
+    Asserts:
+        - Draws advance a cursor through the deck in order.
+        - Drawn cards are the canonical InternedCard instances.
+        - Over-drawing raises EmptyDeck without consuming cards.
+
+    Returns:
+        None
+    """
+    deck = Deck(seed=1)
+    deck.shuffle()
+    order = deck.remaining
+    assert deck.draw(2) == order[:2]
+    assert deck.draw_cards(3) == [InternedCard.from_int(code) for code in order[2:5]]
+    assert deck.dealt == order[:5]
+    assert list(deck) == [InternedCard.from_int(code) for code in order[5:]]
+    assert deck.draw(47) == order[5:]
+    with pytest.raises(EmptyDeck):
+        deck.draw()
+    assert len(deck) == 0
+    with pytest.raises(EmptyDeck):
+        Deck().draw(-1)
+
+
+def test_deck_reset() -> None:
+    """Test returning every card to a dealt shoe.
+
+    Asserts:
+        - The shoe is full and in factory order again.
+        - The card storage is reused.
+        - A deck holding part of a shoe is refilled to whole decks.
+
+    Returns:
+        None
+    """
+    deck = Deck(2, seed=1)
+    storage = deck._cards  # pylint: disable=protected-access
+    deck.shuffle()
+    deck.draw(30)
+    deck.reset()
+    assert deck.remaining == bytes(range(52)) * 2
+    assert deck.dealt == b""
+    assert deck._cards is storage  # pylint: disable=protected-access
+    partial = Deck.from_codes([5, 7])
+    partial.reset()
+    assert len(partial) == 52
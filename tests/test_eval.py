@@ -0,0 +1,250 @@
+"""See Description below.
+
+Module Name: test_eval.py
+
+Description:
+This module contains test cases for the lookup-table poker hand evaluator in card_deck.eval. It checks the category
+of well-known hands, compares 5-, 6- and 7-card evaluation against a straightforward reference implementation, checks
+that the pure Python, CardSet and NumPy entry points agree, and verifies the on-disk table cache.
+
+Dependencies:
+- pytest
+- card_deck.eval
+- card_deck.Card
+- card_deck.CardSet
+"""
+import itertools
+import random
+from collections import Counter
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from card_deck import Card
+from card_deck import CardSet
+from card_deck import Rank
+from card_deck import Suite
+from card_deck import eval as evaluator
+from card_deck.eval import HandCategory
+from card_deck.exceptions import InvalidHand
+
+
+def _code(text: str) -> int:
+    """Encode a two-character card such as 'As' or 'Td'.
+
+    Args:
+        text (str): The rank character followed by the suite character.
+
+    Returns:
+        int: The card encoding.
+    """
+    rank = "A23456789TJQK".index(text[0])
+    suite = "cdhs".index(text[1])
+    return rank << 2 | suite
+
+
+def _reference(codes: Sequence[int]) -> int:
+    """Evaluate a hand by brute force over its 5-card subsets.
+
+    Args:
+        codes (Sequence[int]): 5 to 7 card encodings.
+
+    Returns:
+        int: The hand value.
+    """
+    def five(hand: Sequence[int]) -> int:
+        ranks = sorted(((code >> 2) - 1) % 13 for code in hand)
+        groups = sorted(Counter(ranks).items(), key=lambda item: (item[1], item[0]), reverse=True)
+        shape = [count for _, count in groups]
+        ordered = [rank for rank, _ in groups]
+        flush = len({code & 3 for code in hand}) == 1
+        top = -1
+        if len(set(ranks)) == 5 and ranks[4] - ranks[0] == 4:
+            top = ranks[4]
+        elif ranks == [0, 1, 2, 3, 12]:
+            top = 3
+        if top >= 0 and flush:
+            category, ordered = HandCategory.STRAIGHT_FLUSH, [top]
+        elif shape[0] == 4:
+            category = HandCategory.FOUR_OF_A_KIND
+        elif shape[:2] == [3, 2]:
+            category = HandCategory.FULL_HOUSE
+        elif flush:
+            category, ordered = HandCategory.FLUSH, sorted(ranks, reverse=True)
+        elif top >= 0:
+            category, ordered = HandCategory.STRAIGHT, [top]
+        elif shape[0] == 3:
+            category = HandCategory.THREE_OF_A_KIND
+        elif shape[:2] == [2, 2]:
+            category = HandCategory.TWO_PAIR
+        elif shape[0] == 2:
+            category = HandCategory.PAIR
+        else:
+            category = HandCategory.HIGH_CARD
+        value: int = category.value
+        for position in range(5):
+            value = value << 4 | (ordered[position] if position < len(ordered) else 0)
+        return value
+
+    return max(five(hand) for hand in itertools.combinations(codes, 5))
+
+
+@pytest.mark.parametrize(("hand", "category"), [  # type: ignore
+    ("As Ks Qs Js Ts", HandCategory.STRAIGHT_FLUSH),
+    ("5d 4d 3d 2d Ad", HandCategory.STRAIGHT_FLUSH),
+    ("9c 9d 9h 9s 2c", HandCategory.FOUR_OF_A_KIND),
+    ("9c 9d 9h 2s 2c", HandCategory.FULL_HOUSE),
+    ("Ah 9h 7h 4h 2h", HandCategory.FLUSH),
+    ("5c 4d 3h 2s Ac", HandCategory.STRAIGHT),
+    ("Qc Qd Qh 7s 2c", HandCategory.THREE_OF_A_KIND),
+    ("Qc Qd 7h 7s 2c", HandCategory.TWO_PAIR),
+    ("Qc Qd 8h 7s 2c", HandCategory.PAIR),
+    ("Kc Qd 8h 7s 2c", HandCategory.HIGH_CARD),
+    ("Kc Kd Kh 7s 7c 7d 2c", HandCategory.FULL_HOUSE),
+    ("Ah Kh 7h 4h 2h 2c 2d", HandCategory.FLUSH),
+])
+def test_hand_categories(hand: str, category: HandCategory) -> None:
+    """Test the category of well-known hands.
+    Args:
+        hand (str): Space separated two-character cards.
+        category (HandCategory): The expected category.
+
+    Asserts:
+        - The evaluated hand has the expected category.
+
+    Returns:
+        None
+    """
+    assert evaluator.hand_category(evaluator.evaluate(_code(text) for text in hand.split())) == category
+
+
+def test_hand_ordering() -> None:
+    """Test that hand values order hands the way poker does.
+
+    Asserts:
+        - Kickers break ties, the wheel is the lowest straight and identical ranks tie across suites.
+
+    Returns:
+        None
+    """
+    def value(hand: str) -> int:
+        result: int = evaluator.evaluate(_code(text) for text in hand.split())
+        return result
+
+    assert value("As Ad Kc 7h 2s") > value("As Ad Qc Jh Ts")
+    assert value("6c 5d 4h 3s 2c") > value("5c 4d 3h 2s Ac")
+    assert value("As Ks Qs Js 9s") == value("Ad Kd Qd Jd 9d")
+    assert value("2c 2d 3h 3s 4c") < value("Ac Ad 3h 3s 4c")
+
+
+@pytest.mark.parametrize("size", [5, 6, 7])  # type: ignore
+def test_evaluate_matches_reference(size: int) -> None:
+    """Test random hands against the brute-force reference evaluator.
+    Args:
+        size (int): The number of cards per hand.
+
+    Asserts:
+        - Every entry point returns the reference value.
+
+    Returns:
+        None
+    """
+    rng = random.Random(size)
+    hands = [rng.sample(range(52), size) for _ in range(500)]
+    expected = [_reference(hand) for hand in hands]
+    assert evaluator.evaluate_many(hands) == expected
+    assert evaluator.evaluate_masks(CardSet.from_codes(hand).mask for hand in hands) == expected
+    assert [evaluator.evaluate_cards(map(Card.from_int, hand)) for hand in hands[:20]] == expected[:20]
+
+
+def test_evaluate_invalid_size() -> None:
+    """Test evaluating hands with too few or too many cards.
+
+    Asserts:
+        - Raises an InvalidHand exception.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidHand):
+        evaluator.evaluate([0, 1, 2, 3])
+    with pytest.raises(InvalidHand):
+        evaluator.evaluate(range(0, 32, 4))
+    with pytest.raises(InvalidHand):
+        evaluator.evaluate_cards([Card(Suite.CLUBS, Rank.ACE)])
+
+
+@pytest.mark.parametrize("hand", [  # type: ignore
+    [0, 0, 49, 46, 43, 32, 29],
+    [-1, 49, 46, 43, 32, 29, 26],
+    [52, 49, 46, 43, 32, 29, 26],
+])
+def test_evaluate_invalid_cards(hand: list[int]) -> None:
+    """Test evaluating hands with repeated or out-of-range card encodings.
+    Args:
+        hand (list[int]): The card encodings.
+
+    Asserts:
+        - Every evaluator raises an InvalidHand exception.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidHand):
+        evaluator.evaluate(hand)
+    with pytest.raises(InvalidHand):
+        evaluator.evaluate_many([list(range(7)), hand])
+    if min(hand) >= 0 and max(hand) < 52:
+        with pytest.raises(InvalidHand):
+            evaluator.evaluate_cards(map(Card.from_int, hand))
+    np = pytest.importorskip("numpy")
+    with pytest.raises(InvalidHand, match=r"rows: \[1\]"):
+        evaluator.evaluate_batch(np.array([list(range(7)), hand]))
+
+
+def test_evaluate_batch() -> None:
+    """Test that the NumPy batch evaluator agrees with the pure Python evaluator.
+
+    Asserts:
+        - Batch values equal per-hand values.
+        - Malformed batches raise InvalidHand.
+
+    Returns:
+        None
+    """
+    np = pytest.importorskip("numpy")
+    rng = random.Random(11)
+    hands = [rng.sample(range(52), 7) for _ in range(2000)]
+    values = evaluator.evaluate_batch(np.array(hands, dtype=np.uint8))
+    assert values.tolist() == evaluator.evaluate_many(hands)
+    assert evaluator.evaluate_batch(np.array(hands)[:, :5]).tolist() == evaluator.evaluate_many(h[:5] for h in hands)
+    with pytest.raises(InvalidHand):
+        evaluator.evaluate_batch(np.zeros((2, 4), dtype=np.uint8))
+    with pytest.raises(InvalidHand):
+        evaluator.evaluate_batch(np.zeros((2, 5), dtype=np.uint8))
+
+
+def test_table_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the multiset table is written to and read back from the disk cache.
+    Args:
+        tmp_path (Path): A temporary directory for the cache.
+        monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+
+    Asserts:
+        - The first load writes the cache file.
+        - The cached table equals the built table.
+        - A corrupt cache file is ignored.
+
+    Returns:
+        None
+    """
+    monkeypatch.setenv("CARD_DECK_CACHE_DIR", str(tmp_path))
+    # pylint: disable=protected-access
+    built = evaluator._multiset_arrays()
+    path = evaluator._cache_path()
+    assert path.parent == tmp_path
+    assert path.exists()
+    assert evaluator._read_cache(path) == built
+    path.write_bytes(b"garbage")
+    assert evaluator._read_cache(path) is None
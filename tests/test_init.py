@@ -0,0 +1,97 @@
+"""See Description below.
+
+Module Name: test_init.py
+
+Description:
+This module contains test cases for the lazily loaded card_deck package. It checks that importing the package loads
+no submodule, that public names and submodules are imported on first access, and that cold imports stay within an
+``-X importtime`` budget.
+
+Dependencies:
+- pytest
+- card_deck
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import card_deck
+from card_deck.card import Card
+
+# Cumulative import time budgets in microseconds, several times the measured times to absorb slow machines.
+IMPORT_BUDGETS = {
+    "import card_deck": 5_000,
+    "from card_deck import Deck": 40_000,
+    "import card_deck.eval": 50_000,
+}
+
+
+def _run(statement: str, *options: str) -> subprocess.CompletedProcess[str]:
+    """Run a statement in a fresh interpreter that writes bytecode caches, as installed packages do.
+
+    Args:
+        statement (str): The Python statement.
+        *options (str): Interpreter options placed before ``-c``.
+
+    Returns:
+        subprocess.CompletedProcess[str]: The finished process.
+    """
+    environment = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    return subprocess.run(
+        [sys.executable, *options, "-c", statement], capture_output=True, text=True, env=environment, check=True
+    )
+
+
+def _import_time(statement: str) -> int:
+    """Measure the import time of a statement with ``-X importtime``.
+
+    Args:
+        statement (str): The import statement.
+
+    Returns:
+        int: The cumulative microseconds of every module imported after interpreter startup.
+    """
+    lines = [line.split("|") for line in _run(f"import site; {statement}", "-X", "importtime").stderr.splitlines()]
+    entries = [(int(cumulative), name) for _, cumulative, name in lines[1:]]
+    start = max(index for index, (_, name) in enumerate(entries) if name.strip() == "site") + 1
+    return sum(cumulative for cumulative, name in entries[start:] if not name.startswith("  "))
+
+
+def test_lazy_attributes() -> None:
+    """Test that public names and submodules are imported on first access.
+
+    Asserts:
+        - Importing the package imports no submodule.
+        - Public names resolve to the submodule objects.
+        - Submodules are attributes of the package, and unknown names raise AttributeError.
+
+    Returns:
+        None
+    """
+    modules = _run("import sys, card_deck; print(sorted(name for name in sys.modules if 'card_deck' in name))").stdout
+    assert modules.split() == ["['card_deck']"]
+    assert card_deck.Card is Card
+    assert card_deck.eval is sys.modules["card_deck.eval"]
+    assert {"Deck", "eval", "ordering"} <= set(dir(card_deck))
+    with pytest.raises(AttributeError):
+        _ = card_deck.missing
+
+
+@pytest.mark.parametrize("statement", list(IMPORT_BUDGETS))  # type: ignore
+def test_import_time_budget(statement: str) -> None:
+    """Test that cold imports stay within budget and do not load logging or typing.
+    Args:
+        statement (str): The import statement.
+
+    Asserts:
+        - The fastest of three cold imports, after a run that writes the bytecode caches, is within budget.
+        - The import does not load logging or typing.
+
+    Returns:
+        None
+    """
+    loaded = _run(f"import sys; before = set(sys.modules); {statement}; print(set(sys.modules) - before)").stdout
+    assert not {"'logging'", "'typing'"} & set(loaded.strip("{}\n").split(", "))
+    assert min(_import_time(statement) for _ in range(3)) < IMPORT_BUDGETS[statement]
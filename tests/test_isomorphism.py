@@ -0,0 +1,136 @@
+"""See Description below.
+
+Module Name: test_isomorphism.py
+
+Description:
+This module contains test cases for the suit-isomorphism canonicalization in card_deck.isomorphism. It checks the
+class counts of the precomputed preflop and flop tables, that every suit permutation of a situation maps to the
+same representative, that the permutation maps canonical cards back to the original suits, and that equity
+and hand values are unchanged by canonicalization.
+
+Dependencies:
+- pytest
+- card_deck.isomorphism
+- card_deck.CardSet
+"""
+from collections import Counter
+
+import pytest
+
+from card_deck import CardSet
+from card_deck import parse_many
+from card_deck.combinatorics import iter_card_masks
+from card_deck.eval import evaluate_mask
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidHand
+from card_deck.isomorphism import FLOP_CLASS_COUNT
+from card_deck.isomorphism import PREFLOP_CLASS_COUNT
+from card_deck.isomorphism import SUITE_PERMUTATIONS
+from card_deck.isomorphism import canonicalize
+from card_deck.isomorphism import flop_class
+from card_deck.isomorphism import preflop_class
+
+
+def _rename(cards: CardSet, permutation: tuple[int, ...]) -> CardSet:
+    """Rename the suits of cards one card at a time.
+
+    Args:
+        cards (CardSet): The cards.
+        permutation (tuple[int, ...]): The new suit index of each suit index.
+
+    Returns:
+        CardSet: The renamed cards.
+    """
+    return CardSet.from_codes(code & ~3 | permutation[code & 3] for code in cards.codes())
+
+
+def test_preflop_and_flop_classes() -> None:
+    """Test the class counts and dense indices of the precomputed tables.
+
+    Asserts:
+        - The 1,326 hands fall into 169 classes and the 22,100 flops into 1,755.
+        - The variants of the classes add up to every hand and flop.
+        - Each dense index is used.
+
+    Returns:
+        None
+    """
+    hands = Counter(preflop_class(CardSet.from_mask(mask)) for mask in iter_card_masks(range(52), 2))
+    assert len(hands) == PREFLOP_CLASS_COUNT and sorted(hands) == list(range(PREFLOP_CLASS_COUNT))
+    assert sum(hands.values()) == 1_326
+    assert sorted(hands.values()) == [4] * 78 + [6] * 13 + [12] * 78
+    flops = Counter(flop_class(CardSet.from_mask(mask)) for mask in iter_card_masks(range(52), 3))
+    assert len(flops) == FLOP_CLASS_COUNT and sorted(flops) == list(range(FLOP_CLASS_COUNT))
+    total = 0
+    for mask in iter_card_masks(range(52), 3):
+        isomorph = canonicalize((), CardSet.from_mask(mask))
+        assert isomorph.variants == flops[flop_class(CardSet.from_mask(mask))]
+        total += 1
+    assert total == 22_100
+
+
+@pytest.mark.parametrize(("hand", "board"), [  # type: ignore
+    ("Ah Kh", ""),
+    ("Ah Kd", ""),
+    ("7c 7d", ""),
+    ("", "Qs Js 2d"),
+    ("Ah Kd", "Qh Jh 2c"),
+    ("9s 8s", "Ts 7d 2s Ac"),
+    ("As Ad", "Ac Ah 2c 3d 4h"),
+])
+def test_canonicalize_is_suit_invariant(hand: str, board: str) -> None:
+    """Test that every suit renaming of a situation has the same representative.
+    Args:
+        hand (str): The hole cards.
+        board (str): The board cards.
+
+    Asserts:
+        - All 24 renamings share the key, and the number of distinct renamings is the number of variants.
+        - The permutation maps the canonical cards back to the original ones and the original to the canonical.
+        - Hand values are unchanged by canonicalization.
+
+    Returns:
+        None
+    """
+    hand_cards, board_cards = CardSet(parse_many(hand)), CardSet(parse_many(board))
+    isomorph = canonicalize(hand_cards, board_cards)
+    renamings = set()
+    for permutation in SUITE_PERMUTATIONS:
+        renamed_hand, renamed_board = _rename(hand_cards, permutation), _rename(board_cards, permutation)
+        renamings.add((renamed_hand, renamed_board))
+        assert canonicalize(renamed_hand, renamed_board).key == isomorph.key
+    assert len(renamings) == isomorph.variants
+    assert isomorph.to_original(isomorph.hand) == hand_cards
+    assert isomorph.to_original(isomorph.board) == board_cards
+    assert isomorph.to_canonical(hand_cards | board_cards) == isomorph.hand | isomorph.board
+    if len(hand_cards | board_cards) >= 5:
+        assert evaluate_mask((isomorph.hand | isomorph.board).mask) == evaluate_mask((hand_cards | board_cards).mask)
+
+
+def test_canonicalize_inputs() -> None:
+    """Test the accepted inputs and the representative of suited and offsuit hands.
+
+    Asserts:
+        - Cards, encodings and card sets give the same result.
+        - The most significant suit is renamed clubs, and a hand differs from the same cards on the board.
+        - Invalid and repeated cards are rejected.
+
+    Returns:
+        None
+    """
+    cards = parse_many("Ah Kh")
+    isomorph = canonicalize(cards)
+    assert isomorph == canonicalize([card.to_int() for card in cards]) == canonicalize(CardSet(cards))
+    assert isomorph.hand == CardSet(parse_many("Ac Kc")) and isomorph.board == CardSet()
+    assert isomorph.permutation[2] == 0
+    assert canonicalize(cards, parse_many("2c")).key != canonicalize(parse_many("Ah Kh 2c")).key
+    with pytest.raises(InvalidHand):
+        canonicalize(cards, cards[:1])
+    with pytest.raises(InvalidHand):
+        canonicalize([0, 0])
+    with pytest.raises(InvalidCard):
+        canonicalize([52])
+    with pytest.raises(InvalidHand):
+        preflop_class(parse_many("Ah Kh Qh"))
+    with pytest.raises(InvalidHand):
+        flop_class(cards)
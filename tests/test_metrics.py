@@ -0,0 +1,182 @@
+"""See Description below.
+
+Module Name: test_metrics.py
+
+Description:
+This module contains test cases for the opt-in metrics in card_deck.metrics. It checks the precision of the HDR-style
+histogram buckets and percentiles, that card, deck and evaluator operations update the counters only while metrics
+are on, and the dictionary and Prometheus text exports.
+
+Dependencies:
+- pytest
+- card_deck.metrics
+- card_deck.Card
+- card_deck.Deck
+"""
+import random
+from collections.abc import Iterator
+
+import pytest
+
+from card_deck import Card
+from card_deck import Deck
+from card_deck import Rank
+from card_deck import Suite
+from card_deck import metrics
+from card_deck.eval import evaluate_many
+from card_deck.exceptions import InvalidCardRank
+from card_deck.exceptions import InvalidCardSuite
+from card_deck.metrics import Histogram
+
+
+@pytest.fixture(name="measuring")  # type: ignore
+def fixture_measuring() -> Iterator[None]:
+    """Enable metrics with zeroed values for a test and restore the previous state afterwards.
+
+    Yields:
+        None
+    """
+    previous = metrics.is_metrics_enabled()
+    metrics.reset_metrics()
+    metrics.enable_metrics()
+    yield
+    if not previous:
+        metrics.disable_metrics()
+    metrics.reset_metrics()
+
+
+def _exercise() -> None:
+    """Create cards, shuffle and deal a deck, evaluate hands and reject an invalid suite and rank.
+
+    Returns:
+        None
+    """
+    Card(Suite.HEARTS, Rank.ACE)
+    Card.from_int(7)
+    Card.parse("Kd")
+    deck = Deck(seed=1)
+    deck.shuffle()
+    deck.draw(2)
+    deck.draw_cards(5)
+    evaluate_many([list(range(7)), list(range(10, 15))])
+    with pytest.raises(InvalidCardSuite):
+        Card("HEARTS", Rank.ACE)  # type: ignore[arg-type, unused-ignore]
+    with pytest.raises(InvalidCardRank):
+        Card(Suite.HEARTS, 14)  # type: ignore[arg-type, unused-ignore]
+
+
+def test_bucket_precision() -> None:
+    """Test that every value falls in a bucket no wider than 1/16 of its value.
+
+    Asserts:
+        - Bucket indexes increase with the value and their bounds hold the value.
+
+    Returns:
+        None
+    """
+    generator = random.Random(5)
+    values = list(range(300)) + [generator.getrandbits(bits) for bits in range(9, 64) for _ in range(20)]
+    previous = -1
+    for value in sorted(values):
+        index = metrics._bucket_index(value)  # pylint: disable=protected-access
+        low, high = metrics._bucket_bounds(index)  # pylint: disable=protected-access
+        assert low <= value < high
+        assert high - low <= max(1, value // 16)
+        assert index >= previous
+        previous = index
+
+
+def test_histogram_percentiles() -> None:
+    """Test histogram totals, percentiles and cumulative buckets.
+
+    Asserts:
+        - Percentiles are within the bucket precision of the exact values.
+        - The summary reports the count, extremes and mean in seconds.
+        - Buckets are cumulative and end at the total count.
+
+    Returns:
+        None
+    """
+    histogram = Histogram("test_seconds", "A test histogram.")
+    assert histogram.percentile(50) == 0.0
+    for value in range(1, 10_001):
+        histogram.record(value * 1_000)
+    assert histogram.percentile(50) == pytest.approx(5e-3, rel=1 / 16)
+    assert histogram.percentile(99) == pytest.approx(9.9e-3, rel=1 / 16)
+    assert histogram.percentile(100) == 10e-3
+    summary = histogram.summary()
+    assert (summary["count"], summary["min"], summary["max"]) == (10_000, 1e-6, 10e-3)
+    assert summary["mean"] == pytest.approx(5.0005e-3)
+    counts = [count for _, count in histogram.buckets()]
+    assert counts == sorted(counts) and counts[-1] == 10_000
+    histogram.reset()
+    assert histogram.count == 0 and not histogram.buckets()
+
+
+def test_library_counters(measuring: None) -> None:  # pylint: disable=unused-argument
+    """Test that library operations update the metrics.
+    Args:
+        measuring (None): Enables metrics for the test.
+
+    Asserts:
+        - Created cards, shuffles, deals, evaluations and validation failures are counted.
+        - Shuffle and evaluation calls are timed.
+
+    Returns:
+        None
+    """
+    _exercise()
+    assert metrics.CARDS_CREATED.value == 3
+    assert metrics.SHUFFLES.value == 1 and metrics.SHUFFLE_SECONDS.count == 1
+    assert (metrics.DEALS.value, metrics.CARDS_DEALT.value) == (2, 7)
+    assert metrics.EVALUATIONS.value == 2 and metrics.EVALUATION_SECONDS.count == 1
+    assert (metrics.INVALID_SUITES.value, metrics.INVALID_RANKS.value) == (1, 1)
+
+
+def test_metrics_disabled_records_nothing() -> None:
+    """Test that nothing is recorded while metrics are off.
+
+    Asserts:
+        - Every counter and histogram stays at zero.
+
+    Returns:
+        None
+    """
+    metrics.disable_metrics()
+    metrics.reset_metrics()
+    _exercise()
+    assert not any(value if isinstance(value, int) else value["count"] for value in metrics.as_dict().values())
+
+
+def test_exports(measuring: None) -> None:  # pylint: disable=unused-argument
+    """Test the dictionary and Prometheus text exports.
+    Args:
+        measuring (None): Enables metrics for the test.
+
+    Asserts:
+        - The dictionary holds counter values and histogram summaries keyed by series name.
+        - The Prometheus text describes each metric once and holds cumulative histogram buckets.
+
+    Returns:
+        None
+    """
+    _exercise()
+    exported = metrics.as_dict()
+    assert exported["card_deck_cards_created_total"] == 3
+    assert exported['card_deck_validation_failures_total{error="InvalidCardRank"}'] == 1
+    shuffle_seconds = exported["card_deck_shuffle_seconds"]
+    evaluation_seconds = exported["card_deck_evaluation_seconds"]
+    assert isinstance(shuffle_seconds, dict)
+    assert isinstance(evaluation_seconds, dict)
+    assert shuffle_seconds["count"] == 1
+    assert set(evaluation_seconds) >= {"sum", "mean", "p50", "p99.9"}
+    text = metrics.to_prometheus()
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    assert lines.count("# TYPE card_deck_validation_failures_total counter") == 1
+    assert 'card_deck_validation_failures_total{error="InvalidCardSuite"} 1' in lines
+    assert "# TYPE card_deck_shuffle_seconds histogram" in lines
+    assert 'card_deck_shuffle_seconds_bucket{le="+Inf"} 1' in lines
+    assert "card_deck_shuffle_seconds_count 1" in lines
+    buckets = [line for line in lines if line.startswith("card_deck_evaluation_seconds_bucket")]
+    assert buckets[-2].endswith(" 1") and buckets[-1] == 'card_deck_evaluation_seconds_bucket{le="+Inf"} 1'
@@ -0,0 +1,128 @@
+"""See Description below.
+
+Module Name: test_ordering.py
+
+Description:
+This module contains test cases for the card orderings in card_deck.ordering. It checks the precomputed sort keys
+against tuple keys built from the suite and rank, that the counting sort matches a stable `sorted` in both
+directions, and that cards are grouped by suite and rank in input order.
+
+Dependencies:
+- pytest
+- card_deck.ordering
+- card_deck.InternedCard
+"""
+import random
+
+import pytest
+
+from card_deck import Card
+from card_deck import InternedCard
+from card_deck import Rank
+from card_deck import Suite
+from card_deck import parse_many
+from card_deck.ordering import SORT_KEYS
+from card_deck.ordering import SortOrder
+from card_deck.ordering import group_by_rank
+from card_deck.ordering import group_by_suite
+from card_deck.ordering import sort_hand
+from card_deck.ordering import sort_key
+
+
+def _tuple_key(order: SortOrder, card: Card) -> tuple[int, int]:
+    """Build the naive tuple sort key of a card for an ordering.
+
+    Args:
+        order (SortOrder): The ordering.
+        card (Card): The card.
+
+    Returns:
+        tuple[int, int]: The key, major field first.
+    """
+    rank = card.rank.value
+    if order in (SortOrder.RANK_ACE_HIGH, SortOrder.SUITE_ACE_HIGH) and card.rank is Rank.ACE:
+        rank = 14
+    if order in (SortOrder.SUITE_ACE_LOW, SortOrder.SUITE_ACE_HIGH):
+        return card.suite.value, rank
+    return rank, card.suite.value
+
+
+@pytest.mark.parametrize("order", list(SortOrder))  # type: ignore
+def test_sort_keys(order: SortOrder) -> None:
+    """Test that the precomputed keys order cards like tuple keys.
+    Args:
+        order (SortOrder): The ordering.
+
+    Asserts:
+        - Each key table is a permutation of 0..51.
+        - Sorting every card by the key function matches sorting by the tuple key.
+
+    Returns:
+        None
+    """
+    assert sorted(SORT_KEYS[order]) == list(range(52))
+    cards = [InternedCard.from_int(code) for code in range(52)]
+    assert sorted(cards, key=sort_key(order)) == sorted(cards, key=lambda card: _tuple_key(order, card))
+
+
+@pytest.mark.parametrize("order", list(SortOrder))  # type: ignore
+@pytest.mark.parametrize("reverse", [False, True])  # type: ignore
+def test_sort_hand_matches_sorted(order: SortOrder, reverse: bool) -> None:
+    """Test the counting sort against a stable sort of a two-deck hand.
+    Args:
+        order (SortOrder): The ordering.
+        reverse (bool): Whether to sort in descending order.
+
+    Asserts:
+        - The sorted cards, including the order of equal cards, match `sorted`.
+        - Any iterable is accepted and the input list is left unchanged.
+
+    Returns:
+        None
+    """
+    generator = random.Random(order.value)
+    cards = [Card.from_int(generator.randrange(52)) for _ in range(60)]
+    original = list(cards)
+    expected = sorted(cards, key=sort_key(order), reverse=reverse)
+    assert [id(card) for card in sort_hand(cards, order, reverse=reverse)] == [id(card) for card in expected]
+    assert cards == original
+    assert sort_hand(iter(cards), order, reverse=reverse) == expected
+    assert not sort_hand([], order)
+
+
+def test_sort_hand_orders() -> None:
+    """Test each ordering on a small hand.
+
+    Asserts:
+        - The ace sorts first when low and last when high, and suites sort clubs to spades.
+
+    Returns:
+        None
+    """
+    hand = parse_many("As 2c Kd 2h Ac")
+    assert sort_hand(hand) == parse_many("Ac As 2c 2h Kd")
+    assert sort_hand(hand, SortOrder.RANK_ACE_HIGH) == parse_many("2c 2h Kd Ac As")
+    assert sort_hand(hand, SortOrder.SUITE_ACE_LOW) == parse_many("Ac 2c Kd 2h As")
+    assert sort_hand(hand, SortOrder.SUITE_ACE_HIGH, reverse=True) == parse_many("As 2h Kd Ac 2c")
+
+
+def test_grouping() -> None:
+    """Test grouping cards by suite and rank.
+
+    Asserts:
+        - Only present groups are returned, keyed in order, with cards in input order.
+        - Aces key the last rank group when high.
+
+    Returns:
+        None
+    """
+    hand = parse_many("Kh As 2h Ks Ah")
+    suites = group_by_suite(hand)
+    assert list(suites) == [Suite.HEARTS, Suite.SPADES]
+    assert suites[Suite.HEARTS] == parse_many("Kh 2h Ah")
+    assert suites[Suite.SPADES] == parse_many("As Ks")
+    ranks = group_by_rank(hand)
+    assert list(ranks) == [Rank.ACE, Rank.TWO, Rank.KING]
+    assert ranks[Rank.ACE] == parse_many("As Ah")
+    assert list(group_by_rank(hand, ace_high=True)) == [Rank.TWO, Rank.KING, Rank.ACE]
+    assert not group_by_suite([])
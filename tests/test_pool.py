@@ -0,0 +1,126 @@
+"""See Description below.
+
+Module Name: test_pool.py
+
+Description:
+This module contains test cases for the DeckPool ring buffer in card_deck.pool. It checks that pooled decks are
+shuffled, full and reused rather than reallocated, that manual and background refills keep the ring full, that the
+hit, miss, allocation and refill counters add up, and that closed pools and foreign decks are rejected.
+
+Dependencies:
+- pytest
+- card_deck.pool
+- card_deck.Deck
+"""
+import time
+
+import pytest
+
+from card_deck import Deck
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import InvalidDeck
+from card_deck.pool import DeckPool
+
+
+def test_manual_refill() -> None:
+    """Test a pool refilled by hand.
+
+    Asserts:
+        - Acquired decks are full, shuffled shoes.
+        - Released decks are reused: nothing is allocated after construction.
+        - Acquiring from an empty ring is a miss, and the counters add up.
+
+    Returns:
+        None
+    """
+    with DeckPool(3, 2, seed=9, background=False) as pool:
+        assert pool.capacity == 3
+        assert pool.refill() == 3
+        decks = [pool.acquire() for _ in range(4)]
+        for deck in decks:
+            assert len(deck) == 104 and sorted(deck.remaining) == sorted(bytes(range(52)) * 2)
+            assert deck.remaining != bytes(range(52)) * 2
+            deck.draw(10)
+        for deck in decks:
+            pool.release(deck)
+        assert pool.refill() == 3
+        assert {id(pool.acquire()) for _ in range(3)} <= {id(deck) for deck in decks}
+        stats = pool.stats()
+    assert (stats.acquires, stats.hits, stats.misses, stats.allocations, stats.refills) == (7, 6, 1, 4, 6)
+    assert stats.hit_rate == pytest.approx(6 / 7)
+    assert stats.ready == 0
+    assert 0.0 <= stats.mean_refill_lag <= stats.max_refill_lag
+
+
+def test_seeded_pool_is_reproducible() -> None:
+    """Test that a seeded pool deals the same decks every time.
+
+    Asserts:
+        - Two manually refilled pools with the same seed hand out the same shuffles.
+
+    Returns:
+        None
+    """
+    def orders() -> list[bytes]:
+        with DeckPool(2, seed=4, background=False) as pool:
+            result = []
+            for _ in range(5):
+                pool.refill()
+                deck = pool.acquire()
+                result.append(deck.remaining)
+                pool.release(deck)
+            return result
+
+    assert orders() == orders()
+
+
+def test_background_refill() -> None:
+    """Test the background refill thread.
+
+    Asserts:
+        - The ring fills up without manual refills, and stays full as decks cycle through.
+
+    Returns:
+        None
+    """
+    with DeckPool(4) as pool:
+        deadline = time.monotonic() + 5
+        while pool.stats().ready < 4 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert pool.stats().ready == 4
+        for _ in range(20):
+            deck = pool.acquire()
+            pool.release(deck)
+            while pool.stats().ready < 4 and time.monotonic() < deadline:
+                time.sleep(0.001)
+        stats = pool.stats()
+    assert stats.misses == 0 and stats.allocations == 4
+
+
+def test_invalid_use() -> None:
+    """Test invalid pools and decks.
+
+    Asserts:
+        - A non-positive capacity raises CardDeckValueError.
+        - Releasing a shoe of another size and acquiring from a closed pool raise InvalidDeck.
+        - Releasing a deck twice, or one not acquired from the pool, raises CardDeckValueError.
+
+    Returns:
+        None
+    """
+    with pytest.raises(CardDeckValueError):
+        DeckPool(0)
+    pool = DeckPool(1, background=False)
+    with pytest.raises(InvalidDeck):
+        pool.release(Deck(2))
+    with pytest.raises(CardDeckValueError):
+        pool.release(Deck())
+    deck = pool.acquire()
+    pool.release(deck)
+    with pytest.raises(CardDeckValueError):
+        pool.release(deck)
+    pool.refill()
+    assert pool.acquire() is deck and pool.stats().ready == 0
+    pool.close()
+    with pytest.raises(InvalidDeck):
+        pool.acquire()
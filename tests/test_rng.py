@@ -0,0 +1,144 @@
+"""See Description below.
+
+Module Name: test_rng.py
+
+Description:
+This module contains test cases for the shuffle sources in card_deck.rng. It checks the rejection sampling of the
+buffered CSPRNG against scripted entropy, that its shuffles are permutations spread evenly over every ordering,
+that the seeded source reproduces `random.Random`, and that decks accept any shuffle source.
+
+Dependencies:
+- pytest
+- card_deck.rng
+- card_deck.Deck
+"""
+import random
+from collections import Counter
+from collections.abc import Iterator
+
+import pytest
+
+from card_deck import Deck
+from card_deck.exceptions import CardDeckValueError
+from card_deck.rng import RandomSource
+from card_deck.rng import SecureSource
+from card_deck.rng import SeededSource
+from card_deck.rng import ShuffleSource
+
+
+def test_secure_source_rejection_sampling(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that out-of-range draws are rejected and entropy is read in blocks.
+    Args:
+        monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+
+    Asserts:
+        - Draws are masked to the bit length of the range and values out of range are skipped.
+        - Multi-byte draws read little-endian bytes.
+        - Entropy is only requested when the buffer runs out.
+
+    Returns:
+        None
+    """
+    blocks: Iterator[bytes] = iter([bytes([0xFF, 0x07, 0x02, 0x05]), bytes([0x2A, 0x81, 0x00, 0x00])])
+    requests = []
+
+    def urandom(size: int) -> bytes:
+        requests.append(size)
+        return next(blocks)
+
+    monkeypatch.setattr("card_deck.rng.os.urandom", urandom)
+    source = SecureSource(block_size=4)
+    # Range 6 uses 3 bits: 0xFF -> 7 and 0x07 -> 7 are rejected, 0x02 -> 2 is accepted.
+    assert source.randbelow(6) == 2
+    assert source.randbelow(6) == 5
+    assert requests == [4]
+    # Range 300 uses 9 bits of two bytes: 0x812A & 0x1FF = 0x12A = 298.
+    assert source.randbelow(300) == 298
+    assert requests == [4, 4]
+    assert source.randbelow(1) == 0
+    with pytest.raises(CardDeckValueError):
+        source.randbelow(0)
+    with pytest.raises(CardDeckValueError):
+        SecureSource(block_size=0)
+
+
+@pytest.mark.parametrize("size", [2, 3, 52, 300])  # type: ignore
+def test_secure_source_shuffle_is_permutation(size: int) -> None:
+    """Test that CSPRNG shuffles keep every card, including shoes larger than a byte's range.
+    Args:
+        size (int): The number of items to shuffle.
+
+    Asserts:
+        - The shuffled sequence holds the same items.
+
+    Returns:
+        None
+    """
+    items = list(range(size))
+    SecureSource(block_size=64).shuffle(items)
+    assert sorted(items) == list(range(size))
+
+
+def test_secure_source_shuffle_is_uniform() -> None:
+    """Test that every ordering of three items is about equally likely.
+
+    Asserts:
+        - Each of the six orderings appears within 10% of its expected count.
+
+    Returns:
+        None
+    """
+    source = SecureSource()
+    counts: Counter[tuple[int, ...]] = Counter()
+    for _ in range(30_000):
+        items = [0, 1, 2]
+        source.shuffle(items)
+        counts[tuple(items)] += 1
+    assert len(counts) == 6
+    assert all(4_500 <= count <= 5_500 for count in counts.values())
+
+
+def test_seeded_source() -> None:
+    """Test the seeded source.
+
+    Asserts:
+        - SeededSource shuffles exactly like random.Random with the same seed.
+        - randbelow stays in range and rejects empty ranges.
+
+    Returns:
+        None
+    """
+    expected = bytearray(range(52))
+    random.Random(8).shuffle(expected)
+    cards = bytearray(range(52))
+    SeededSource(8).shuffle(cards)
+    assert cards == expected
+    source = SeededSource(1)
+    assert all(0 <= source.randbelow(7) < 7 for _ in range(100))
+    with pytest.raises(CardDeckValueError):
+        source.randbelow(-1)
+
+
+@pytest.mark.parametrize(("source", "draws"), [  # type: ignore
+    (SecureSource(), True),
+    (SeededSource(2), True),
+    (random.Random(2), False),
+])
+def test_deck_accepts_shuffle_sources(source: ShuffleSource, draws: bool) -> None:
+    """Test shuffling decks with each source.
+    Args:
+        source (ShuffleSource): The shuffle source.
+        draws (bool): Whether the source also draws uniform integers.
+
+    Asserts:
+        - Every source satisfies the ShuffleSource protocol, and the backends satisfy RandomSource.
+        - The shuffled shoe holds every card.
+
+    Returns:
+        None
+    """
+    assert isinstance(source, ShuffleSource)
+    assert isinstance(source, RandomSource) == draws
+    deck = Deck(2, rng=source)
+    deck.shuffle()
+    assert sorted(deck.remaining) == sorted(bytes(range(52)) * 2)
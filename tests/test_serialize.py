@@ -0,0 +1,183 @@
+"""See Description below.
+
+Module Name: test_serialize.py
+
+Description:
+This module contains test cases for the binary card format in card_deck.serialize. It checks the header fields, round
+trips of byte-per-card and six-bit packed records through buffers and memory-mapped files, zero-copy record access,
+deck serialization, and rejection of malformed records and data.
+
+Dependencies:
+- pytest
+- card_deck.serialize
+- card_deck.Deck
+"""
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+from card_deck import Deck
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidDeck
+from card_deck.exceptions import InvalidFormat
+from card_deck.exceptions import InvalidHand
+from card_deck.serialize import FORMAT_VERSION
+from card_deck.serialize import HEADER_SIZE
+from card_deck.serialize import HandReader
+from card_deck.serialize import HandWriter
+from card_deck.serialize import dump_deck
+from card_deck.serialize import load_deck
+
+
+def _hands(count: int, size: int) -> list[bytes]:
+    """Deal seeded hands from a shuffled shoe.
+
+    Args:
+        count (int): The number of hands.
+        size (int): The number of cards per hand.
+
+    Returns:
+        list[bytes]: The encoded hands.
+    """
+    deck = Deck(2, seed=11)
+    hands = []
+    for _ in range(count):
+        deck.shuffle()
+        hands.append(deck.draw(size))
+    return hands
+
+
+@pytest.mark.parametrize("packed", [False, True])  # type: ignore
+@pytest.mark.parametrize("size", [1, 2, 5, 7, 23, 52, 104])  # type: ignore
+def test_round_trip(size: int, packed: bool) -> None:
+    """Test writing records to a stream and reading them back from the buffer.
+    Args:
+        size (int): The number of cards per record.
+        packed (bool): Whether cards are packed to six bits.
+
+    Asserts:
+        - The header fields are read back.
+        - Records are stored in 6 bits per card when packed and one byte per card otherwise.
+        - Every record decodes to the written cards, by index and by iteration.
+
+    Returns:
+        None
+    """
+    hands = _hands(20, size)
+    stream = io.BytesIO()
+    with HandWriter(stream, size, decks=2, seed=2**64 - 1, packed=packed) as writer:
+        writer.write_many(hands)
+        assert writer.count == len(hands)
+    data = stream.getvalue()
+    reader = HandReader(data)
+    assert (reader.version, reader.packed, reader.decks, reader.seed) == (FORMAT_VERSION, packed, 2, 2**64 - 1)
+    assert reader.record_size == size
+    assert reader.record_bytes == ((size * 6 + 7) // 8 if packed else size)
+    assert len(data) == HEADER_SIZE + len(hands) * reader.record_bytes
+    assert len(reader) == len(hands)
+    assert list(reader) == hands
+    assert reader[-1] == hands[-1]
+    if not packed:
+        assert reader.raw(3) == hands[3]
+        assert reader.records() == b"".join(hands)
+
+
+def test_memory_mapped_file(tmp_path: Path) -> None:
+    """Test streaming records to a file and scanning it through a memory map.
+    Args:
+        tmp_path (Path): A temporary directory for the file.
+
+    Asserts:
+        - The file reader decodes every record and has no seed when none was written.
+        - Record views outlive the reader.
+        - Out-of-range record indexes raise IndexError.
+
+    Returns:
+        None
+    """
+    path = tmp_path / "hands.cdh"
+    hands = _hands(50, 9)
+    with HandWriter.open(path, 9) as writer:
+        for hand in hands:
+            writer.write(list(hand))
+    with HandReader.open(path) as reader:
+        assert reader.seed is None
+        assert list(reader) == hands
+        view = reader.raw(0)
+        with pytest.raises(IndexError):
+            reader.raw(len(hands))
+    assert view == hands[0]
+    view.release()
+
+
+@pytest.mark.parametrize("packed", [False, True])  # type: ignore
+def test_dump_and_load_deck(packed: bool) -> None:
+    """Test serializing a partly dealt shoe.
+    Args:
+        packed (bool): Whether cards are packed to six bits.
+
+    Asserts:
+        - The loaded deck holds the undealt cards in order and the deck count.
+        - The stored seed seeds the loaded deck's RNG unless one is given.
+
+    Returns:
+        None
+    """
+    deck = Deck(6, seed=5)
+    deck.shuffle()
+    deck.draw(30)
+    data = dump_deck(deck, seed=5, packed=packed)
+    loaded = load_deck(data)
+    assert (loaded.remaining, loaded.decks) == (deck.remaining, 6)
+    loaded.shuffle()
+    expected = Deck.from_codes(deck.remaining, 6, rng=random.Random(5))
+    expected.shuffle()
+    assert loaded.remaining == expected.remaining
+    assert load_deck(memoryview(data), rng=random.Random(1)).remaining == deck.remaining
+
+
+def test_invalid_records() -> None:
+    """Test writing malformed records.
+
+    Asserts:
+        - Records of the wrong size raise InvalidHand.
+        - Invalid encodings raise InvalidCard.
+        - Unstorable header fields raise InvalidFormat.
+
+    Returns:
+        None
+    """
+    writer = HandWriter(io.BytesIO(), 2)
+    with pytest.raises(InvalidHand):
+        writer.write(b"\x00")
+    for record in ([0, 52], [0, -1], ["a", 1]):
+        with pytest.raises(InvalidCard):
+            writer.write(record)  # type: ignore[arg-type, unused-ignore]
+    assert writer.count == 0
+    for arguments in ({"record_size": 0}, {"record_size": 2, "decks": 0}, {"record_size": 2, "seed": -1}):
+        with pytest.raises(InvalidFormat):
+            HandWriter(io.BytesIO(), **arguments)  # type: ignore[arg-type, unused-ignore]
+
+
+def test_invalid_data() -> None:
+    """Test reading malformed data.
+
+    Asserts:
+        - Short data, a wrong signature or version, and partial records raise InvalidFormat.
+        - Multi-record data and over-full decks are rejected by load_deck.
+
+    Returns:
+        None
+    """
+    stream = io.BytesIO()
+    HandWriter(stream, 3).write_many([b"\x00\x00\x01", b"\x00\x01\x02"])
+    data = stream.getvalue()
+    for bad in (data[:10], b"XXXX" + data[4:], data[:4] + b"\x09" + data[5:], data[:-1]):
+        with pytest.raises(InvalidFormat):
+            HandReader(bad)
+    with pytest.raises(InvalidFormat):
+        load_deck(data)
+    with pytest.raises(InvalidDeck):
+        load_deck(data[:HEADER_SIZE + 3])
@@ -0,0 +1,182 @@
+"""See Description below.
+
+Module Name: test_shared.py
+
+Description:
+This module contains test cases for the shared-memory card blocks in card_deck.shared. It checks that blocks
+pickle as their names and attach to the same memory, that worker processes shuffle decks and deal hands into
+shared blocks in place, and that the coordinator hands out every row exactly once.
+
+Dependencies:
+- pytest
+- card_deck.shared
+- card_deck.Deck
+"""
+import pickle
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from card_deck import Deck
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidDeck
+from card_deck.shared import SharedCards
+from card_deck.shared import SliceCoordinator
+
+HOLE_CARDS = 2
+
+
+def deal_slice(rows: range, shoes: SharedCards, hands: SharedCards, seed: int) -> int:
+    """Shuffle a slice of shoes in place and deal each player two cards from it; runs in a worker process.
+
+    Args:
+        rows (range): The rows of the slice.
+        shoes (SharedCards): The shoes to shuffle.
+        hands (SharedCards): The hands to write, one row of hole cards per shoe.
+        seed (int): The base seed.
+
+    Returns:
+        int: The number of shoes dealt.
+    """
+    players = hands.row_size // HOLE_CARDS
+    for index in rows:
+        shoe = shoes.row(index)
+        # random.shuffle() takes a mutable sequence, which a memoryview is not; shuffle a copy and write it back.
+        cards = bytearray(shoe)
+        random.Random(seed + index).shuffle(cards)
+        shoe[:] = cards
+        hand = hands.row(index)
+        for player in range(players):
+            hand[player * HOLE_CARDS] = shoe[player]
+            hand[player * HOLE_CARDS + 1] = shoe[player + players]
+    return len(rows)
+
+
+def test_shared_cards_pickle_as_name() -> None:
+    """Test that a pickled block attaches to the same memory.
+
+    Asserts:
+        - The pickle holds the name and shape only.
+        - Writes through either object are visible through the other.
+        - Only the creator owns the block.
+
+    Returns:
+        None
+    """
+    with SharedCards.decks(1_000, decks=6) as shoes:
+        data = pickle.dumps(shoes)
+        assert len(data) < 200
+        attached = pickle.loads(data)
+        assert not attached.owner and shoes.owner
+        assert (attached.name, len(attached), attached.row_size) == (shoes.name, 1_000, 312)
+        attached.row(999)[0] = 51
+        assert shoes.row(999)[0] == 51 and bytes(shoes.row(0)) == bytes(range(52)) * 6
+        assert "rows=1000" in repr(attached)
+        attached.close()
+
+
+def test_shared_cards_views() -> None:
+    """Test the views and constructors of a block.
+
+    Asserts:
+        - Row ranges and the whole-block view cover the copied codes.
+        - Rows outside the block and malformed shapes or codes are rejected.
+
+    Returns:
+        None
+    """
+    with SharedCards.from_codes(bytes(range(52)), row_size=13) as block:
+        assert len(block) == 4
+        assert bytes(block.rows(1, 3)) == bytes(range(13, 39))
+        assert bytes(block.buffer) == bytes(range(52))
+        with pytest.raises(IndexError):
+            block.row(4)
+        with pytest.raises(IndexError):
+            block.rows(3, 2)
+    for codes, row_size in ((b"", 1), (bytes(5), 2), (bytes(5), 0)):
+        with pytest.raises(CardDeckValueError):
+            SharedCards.from_codes(codes, row_size)
+    with pytest.raises(InvalidCard):
+        SharedCards.from_codes(bytes([52]), 1)
+    with pytest.raises(CardDeckValueError):
+        SharedCards.create(0, 52)
+    with pytest.raises(InvalidDeck):
+        SharedCards.decks(1, decks=0)
+
+
+def test_shared_cards_array() -> None:
+    """Test the NumPy view of a block.
+
+    Asserts:
+        - The array has one row per shoe and writes through to the shared memory.
+
+    Returns:
+        None
+    """
+    np = pytest.importorskip("numpy")
+    with SharedCards.decks(3) as decks:
+        array = decks.as_array()
+        assert array.shape == (3, 52) and array.dtype == np.uint8
+        array[2, 0] = 7
+        assert decks.row(2)[0] == 7
+        del array
+
+
+def test_workers_deal_into_shared_blocks() -> None:
+    """Test dealing in worker processes through shared blocks.
+
+    Asserts:
+        - The results come back in slice order and cover every shoe.
+        - The shoes were shuffled in place as a seeded deck would be, and the hands hold the dealt cards.
+
+    Returns:
+        None
+    """
+    players = 3
+    with SharedCards.decks(40) as shoes, SharedCards.create(40, players * HOLE_CARDS) as hands:
+        coordinator = SliceCoordinator(len(shoes), 7)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            assert coordinator.map(executor, deal_slice, shoes, hands, 11) == [7] * 5 + [5]
+        for index in (0, 39):
+            deck = Deck(rng=random.Random(11 + index))
+            deck.shuffle()
+            assert bytes(shoes.row(index)) == deck.remaining
+            seats = deck.draw(players), deck.draw(players)
+            assert bytes(hands.row(index)) == bytes(card for seat in zip(*seats) for card in seat)
+
+
+def test_slice_coordinator() -> None:
+    """Test handing out slices from several threads.
+
+    Asserts:
+        - Every row is handed out exactly once, in contiguous slices of at most the slice size.
+        - map runs in this thread without an executor, on the rows not handed out yet.
+        - Invalid sizes are rejected.
+
+    Returns:
+        None
+    """
+    coordinator = SliceCoordinator(10_000, 64)
+    assert len(coordinator) == 157
+    handed_out: list[range] = []
+
+    def take() -> None:
+        while (rows := coordinator.next_slice()) is not None:
+            handed_out.append(rows)
+
+    threads = [threading.Thread(target=take) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(row for rows in handed_out for row in rows) == list(range(10_000))
+    assert all(len(rows) <= 64 for rows in handed_out) and coordinator.remaining == 0
+    coordinator = SliceCoordinator(10, 4)
+    coordinator.next_slice()
+    assert coordinator.map(None, lambda rows, scale: [row * scale for row in rows], 2) == [[8, 10, 12, 14], [16, 18]]
+    for total, slice_size in ((-1, 1), (1, 0)):
+        with pytest.raises(CardDeckValueError):
+            SliceCoordinator(total, slice_size)
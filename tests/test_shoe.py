@@ -0,0 +1,175 @@
+"""See Description below.
+
+Module Name: test_shoe.py
+
+Description:
+This module contains test cases for the blackjack shoe and hand in card_deck.shoe. It checks the precomputed point
+and Hi-Lo tables against the card ranks, the hard and soft totals of hands built card by card, and that the shoe
+keeps its running and true counts as cards are dealt and reshuffles at the cut card.
+
+Dependencies:
+- pytest
+- card_deck.shoe
+- card_deck.Rank
+"""
+import pytest
+
+from card_deck import Rank
+from card_deck import parse_many
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import EmptyDeck
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidDeck
+from card_deck.shoe import HI_LO
+from card_deck.shoe import POINTS
+from card_deck.shoe import BlackjackHand
+from card_deck.shoe import Shoe
+from card_deck.shoe import hand_total
+
+
+def test_tables() -> None:
+    """Test the point value and Hi-Lo tag of every card encoding.
+
+    Asserts:
+        - Aces are worth 1, numbered ranks their value and faces 10.
+        - 2 to 6 count +1, 7 to 9 count 0 and tens, faces and aces count -1.
+        - A full deck counts to zero.
+
+    Returns:
+        None
+    """
+    for code in range(52):
+        rank = Rank(code // 4 + 1)
+        assert POINTS[code] == min(rank.value, 10)
+        if Rank.TWO.value <= rank.value <= Rank.SIX.value:
+            assert HI_LO[code] == 1
+        elif Rank.SEVEN.value <= rank.value <= Rank.NINE.value:
+            assert HI_LO[code] == 0
+        else:
+            assert HI_LO[code] == -1
+    assert sum(HI_LO) == 0
+
+
+@pytest.mark.parametrize(("hand", "total", "soft", "blackjack", "bust"), [  # type: ignore
+    ("As Kd", 21, True, True, False),
+    ("As 5d Kh", 16, False, False, False),
+    ("Ac Ad", 12, True, False, False),
+    ("Ac Ad 9h", 21, True, False, False),
+    ("Tc 5d 7h", 22, False, False, True),
+    ("7c 7d 7h", 21, False, False, False),
+    ("Qs As", 21, True, True, False),
+    ("", 0, False, False, False),
+])
+def test_hand_totals(hand: str, total: int, soft: bool, blackjack: bool, bust: bool) -> None:
+    """Test the totals of hands built card by card.
+    Args:
+        hand (str): The cards of the hand.
+        total (int): The expected best total.
+        soft (bool): Whether the total counts an ace as 11.
+        blackjack (bool): Whether the hand is a natural.
+        bust (bool): Whether the hand is over 21.
+
+    Asserts:
+        - BlackjackHand and hand_total agree on the total and softness.
+        - The running total returned by add is the final best total.
+        - Clearing the hand empties it.
+
+    Returns:
+        None
+    """
+    codes = [card.to_int() for card in parse_many(hand)]
+    blackjack_hand = BlackjackHand()
+    running = 0
+    for code in codes:
+        running = blackjack_hand.add(code)
+    assert (blackjack_hand.total, blackjack_hand.soft) == hand_total(codes) == (total, soft)
+    assert running == total
+    assert blackjack_hand.is_blackjack == blackjack
+    assert blackjack_hand.is_bust == bust
+    assert blackjack_hand.codes == bytes(codes)
+    assert blackjack_hand.cards == parse_many(hand)
+    assert len(blackjack_hand) == len(codes)
+    assert repr(BlackjackHand(codes)) == repr(blackjack_hand)
+    blackjack_hand.clear()
+    assert len(blackjack_hand) == 0 and blackjack_hand.total == 0 and not blackjack_hand.soft
+
+
+@pytest.mark.parametrize("code", [-1, 52, 60])  # type: ignore
+def test_invalid_hand_cards(code: int) -> None:
+    """Test that encodings outside 0..51 are rejected.
+    Args:
+        code (int): The invalid encoding.
+
+    Asserts:
+        - hand_total, BlackjackHand and add raise InvalidCard.
+        - A rejected card leaves the hand unchanged.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidCard):
+        hand_total([0, code])
+    with pytest.raises(InvalidCard):
+        BlackjackHand([code])
+    blackjack_hand = BlackjackHand([0])
+    with pytest.raises(InvalidCard):
+        blackjack_hand.add(code)
+    assert blackjack_hand.codes == bytes([0]) and blackjack_hand.total == 11
+    assert repr(blackjack_hand) == "BlackjackHand(Ac, soft 11)"
+
+
+def test_shoe_counts() -> None:
+    """Test that the shoe keeps the Hi-Lo count of the dealt cards.
+
+    Asserts:
+        - The running count matches the tags of the dealt cards, whether dealt singly or drawn.
+        - The true count divides the running count by the decks left to deal.
+        - Dealing the whole shoe brings the count back to zero, and an empty shoe cannot deal.
+
+    Returns:
+        None
+    """
+    shoe = Shoe(6, seed=5)
+    shoe.shuffle()
+    dealt = bytes(shoe.deal() for _ in range(40)) + shoe.draw(12)
+    assert dealt == shoe.dealt
+    assert shoe.running_count == sum(HI_LO[code] for code in dealt)
+    assert shoe.decks_remaining == 5
+    assert shoe.true_count == shoe.running_count / 5
+    shoe.draw(len(shoe) - 1)
+    shoe.deal()
+    assert shoe.running_count == 0 and shoe.true_count == 0
+    with pytest.raises(EmptyDeck):
+        shoe.deal()
+    shoe.reset()
+    assert len(shoe) == shoe.size == 312 and shoe.running_count == 0
+    assert "running_count=0" in repr(shoe)
+
+
+def test_shoe_reshuffles_at_cut_card() -> None:
+    """Test reshuffling at the penetration.
+
+    Asserts:
+        - No reshuffle happens before the cut card comes out.
+        - The first round after the cut card reshuffles the shoe and zeroes the count.
+        - Invalid penetrations and deck counts are rejected.
+
+    Returns:
+        None
+    """
+    shoe = Shoe(2, penetration=0.5, seed=3)
+    assert shoe.penetration == 0.5
+    shoe.shuffle()
+    order = shoe.remaining
+    shoe.draw(51)
+    assert not shoe.needs_shuffle and not shoe.start_round()
+    shoe.deal()
+    assert shoe.needs_shuffle
+    assert shoe.start_round()
+    assert len(shoe) == 104 and shoe.running_count == 0
+    assert shoe.remaining != order and sorted(shoe.remaining) == sorted(order)
+    for penetration in (0, -0.5, 1.5):
+        with pytest.raises(CardDeckValueError):
+            Shoe(penetration=penetration)
+    with pytest.raises(InvalidDeck):
+        Shoe(0)
@@ -0,0 +1,159 @@
+"""See Description below.
+
+Module Name: test_simulate.py
+
+Description:
+This module contains test cases for the Monte Carlo equity simulator in card_deck.simulate. It verifies that seeded
+runs are reproducible and independent of the number of worker processes, that complete boards give exact results,
+that estimates land near known equities, that early stopping and progress reporting work, and that malformed input
+raises InvalidHand or InvalidCard, and that invalid simulation settings raise CardDeckValueError.
+
+Dependencies:
+- pytest
+- card_deck.simulate
+- card_deck.Card
+"""
+from typing import Any
+
+import pytest
+
+from card_deck import Card
+from card_deck import Rank
+from card_deck import Suite
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidHand
+from card_deck.simulate import EquityResult
+from card_deck.simulate import equity
+
+ACES = [Card(Suite.SPADES, Rank.ACE), Card(Suite.HEARTS, Rank.ACE)]
+KINGS = [Card(Suite.CLUBS, Rank.KING), Card(Suite.DIAMONDS, Rank.KING)]
+
+
+def test_equity_is_independent_of_workers() -> None:
+    """Test that a seeded run returns the same estimate with one or several workers.
+
+    Asserts:
+        - The in-process run and the two-process run are identical.
+        - Equities of two known hands sum to one.
+
+    Returns:
+        None
+    """
+    single = equity([ACES, KINGS], trials=3000, seed=9, workers=1, shard_size=500)
+    pooled = equity([ACES, KINGS], trials=3000, seed=9, workers=2, shard_size=500)
+    assert single == pooled
+    assert single.trials == 3000
+    assert sum(single.equity) == pytest.approx(1.0)
+
+
+def test_equity_near_known_value() -> None:
+    """Test that aces against kings preflop lands near the known ~82% equity.
+
+    Asserts:
+        - The estimate is within its confidence interval of the known value, with margin.
+
+    Returns:
+        None
+    """
+    result = equity([ACES, KINGS], trials=20000, seed=3, workers=1)
+    assert result.equity[0] == pytest.approx(0.82, abs=0.02)
+    assert result.half_width[0] < 0.01
+
+
+def test_equity_complete_board_is_exact() -> None:
+    """Test that a complete board gives the same result on every trial.
+
+    Asserts:
+        - Aces full of kings beat kings full of aces every time.
+
+    Returns:
+        None
+    """
+    board = [Card(Suite.CLUBS, Rank.ACE), Card(Suite.SPADES, Rank.KING), Card(Suite.HEARTS, Rank.TWO),
+             Card(Suite.DIAMONDS, Rank.SEVEN), Card(Suite.CLUBS, Rank.NINE)]
+    result = equity([ACES, KINGS], board, trials=100, seed=1, workers=1)
+    assert result.equity == (1.0, 0.0)
+    assert result.wins == (100, 0)
+    assert result.half_width == (0.0, 0.0)
+
+
+def test_equity_early_stop_and_progress() -> None:
+    """Test early stopping on the tolerance and progress reporting.
+
+    Asserts:
+        - The run stops before the trial budget once the interval is narrow enough.
+        - Progress is reported after every combined shard.
+
+    Returns:
+        None
+    """
+    updates: list[EquityResult] = []
+    result = equity([ACES], opponents=1, trials=1_000_000, seed=2, workers=1, shard_size=1000,
+                    tolerance=0.02, progress=updates.append)
+    assert result.stopped_early
+    assert result.trials < 1_000_000
+    assert max(result.half_width) <= 0.02
+    assert [update.trials for update in updates] == list(range(1000, result.trials + 1, 1000))
+
+
+@pytest.mark.parametrize(("hands", "board", "opponents"), [  # type: ignore
+    ([ACES], [], 0),
+    ([ACES[:1], KINGS], [], 0),
+    ([ACES, ACES], [], 0),
+    ([ACES, KINGS], KINGS[:1], 0),
+    ([ACES, KINGS], [0, 4, 8, 12, 16, 20], 0),
+    ([ACES], [], 30),
+])
+def test_equity_invalid_deal(hands: list[list[Card]], board: list[int], opponents: int) -> None:
+    """Test that malformed deals raise InvalidHand.
+    Args:
+        hands (list[list[Card]]): The known hands.
+        board (list[int]): The known board.
+        opponents (int): The number of random opponents.
+
+    Asserts:
+        - Raises an InvalidHand exception.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidHand):
+        equity(hands, board, opponents=opponents, trials=10, workers=1)
+
+
+def test_equity_invalid_card() -> None:
+    """Test that invalid cards raise InvalidCard.
+
+    Asserts:
+        - Raises an InvalidCard exception.
+
+    Returns:
+        None
+    """
+    with pytest.raises(InvalidCard):
+        equity([ACES, [52, 0]], trials=10, workers=1)
+
+
+@pytest.mark.parametrize("settings", [  # type: ignore
+    {"workers": 0},
+    {"workers": -1},
+    {"trials": 0},
+    {"shard_size": 0},
+    {"confidence": 0.0},
+    {"confidence": 1.0},
+    {"confidence": 95.0},
+])
+def test_equity_invalid_settings(settings: dict[str, Any]) -> None:
+    """Test that invalid simulation settings raise CardDeckValueError.
+    Args:
+        settings (dict[str, Any]): The keyword arguments overriding valid settings.
+
+    Asserts:
+        - Raises a CardDeckValueError exception.
+
+    Returns:
+        None
+    """
+    with pytest.raises(CardDeckValueError):
+        equity([ACES, KINGS], **{"trials": 10, "workers": 1, **settings})
@@ -0,0 +1,148 @@
+"""See Description below.
+
+Module Name: test_store.py
+
+Description:
+This module contains test cases for the indexed hand store in card_deck.store. It compares card, suit, rank and seat
+queries against a full scan of the stored hands, checks zero-copy reads, and verifies that the index is saved,
+reloaded and caught up with hands appended behind its back.
+
+Dependencies:
+- pytest
+- card_deck.store
+- card_deck.Deck
+- card_deck.serialize.HandWriter
+"""
+from pathlib import Path
+
+import pytest
+
+from card_deck import Deck
+from card_deck import InternedCard
+from card_deck import Rank
+from card_deck import Suite
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidFormat
+from card_deck.exceptions import InvalidHand
+from card_deck.serialize import HandWriter
+from card_deck.store import HandStore
+from card_deck.store import seat_positions
+
+
+def _hands(count: int, size: int = 9) -> list[bytes]:
+    """Deal seeded hands: three seats' hole cards and a three-card board.
+
+    Args:
+        count (int): The number of hands.
+        size (int): The number of cards per hand.
+
+    Returns:
+        list[bytes]: The encoded hands.
+    """
+    deck = Deck(seed=3)
+
+    def deal() -> bytes:
+        deck.shuffle()
+        hand: bytes = deck.draw(size)
+        return hand
+
+    return [deal() for _ in range(count)]
+
+
+def test_queries(tmp_path: Path) -> None:
+    """Test card, suit, rank and seat queries against a full scan.
+    Args:
+        tmp_path (Path): A temporary directory for the store.
+
+    Asserts:
+        - Every query returns the ids a linear scan finds, in order.
+        - Stored hands are returned as views of the appended cards.
+
+    Returns:
+        None
+    """
+    hands = _hands(300)
+    ace = InternedCard(Suite.SPADES, Rank.ACE)
+    with HandStore(tmp_path / "hands.cdh", 9) as store:
+        assert store.extend(hands) == range(300)
+        assert len(store) == 300
+        assert store[0] == hands[0] and store[-1] == hands[-1]
+        assert list(store) == hands
+        assert store.records(10, 12) == hands[10] + hands[11]
+        assert store.query(ace) == [hand for hand, cards in enumerate(hands) if ace.to_int() in cards]
+        assert store.query(ace, positions=seat_positions(2)) == [
+            hand for hand, cards in enumerate(hands) if ace.to_int() in cards[4:6]
+        ]
+        assert store.query(suite=Suite.HEARTS) == [
+            hand for hand, cards in enumerate(hands) if any(code & 3 == 2 for code in cards)
+        ]
+        assert store.query(rank=Rank.KING, positions=[6, 7, 8]) == [
+            hand for hand, cards in enumerate(hands) if any(code >> 2 == 12 for code in cards[6:])
+        ]
+        assert store.query(0, suite=Suite.SPADES) == []
+        assert store.query_all([ace, 0]) == [
+            hand for hand, cards in enumerate(hands) if ace.to_int() in cards and 0 in cards
+        ]
+        assert store.postings(0) == sum(1 << hand for hand, cards in enumerate(hands) if 0 in cards)
+
+
+def test_index_persistence(tmp_path: Path) -> None:
+    """Test saving, reloading and catching up the index.
+    Args:
+        tmp_path (Path): A temporary directory for the store.
+
+    Asserts:
+        - A reopened store answers queries from the saved index.
+        - Hands appended to the data file without the store are indexed on open.
+        - An invalid index file is rebuilt from the data.
+
+    Returns:
+        None
+    """
+    path = tmp_path / "hands.cdh"
+    hands = _hands(30)
+    with HandStore(path, 9, seed=3) as store:
+        store.extend(hands[:13])
+    assert store.index_path.exists()
+    with HandWriter.append_to(path) as writer:
+        writer.write_many(hands[13:20])
+    with HandStore(path) as store:
+        assert len(store) == 20
+        store.extend(hands[20:])
+        expected = [hand for hand, cards in enumerate(hands) if 5 in cards]
+        assert store.query(5) == expected
+    store.index_path.write_bytes(b"garbage")
+    with HandStore(path, 9) as store:
+        assert store.query(5) == expected
+
+
+def test_invalid_use(tmp_path: Path) -> None:
+    """Test invalid stores, hands and queries.
+    Args:
+        tmp_path (Path): A temporary directory for the store.
+
+    Asserts:
+        - Creating a store without a record size, or reopening it with another size, raises InvalidFormat.
+        - Malformed hands, cards and positions raise exceptions.
+
+    Returns:
+        None
+    """
+    path = tmp_path / "hands.cdh"
+    with pytest.raises(InvalidFormat):
+        HandStore(path)
+    HandStore(path, 2).close()
+    with pytest.raises(InvalidFormat):
+        HandStore(path, 3)
+    with HandStore(path) as store:
+        with pytest.raises(InvalidHand):
+            store.append([1, 2, 3])
+        with pytest.raises(InvalidCard):
+            store.append([1, 52])
+        with pytest.raises(InvalidCard):
+            store.query(52)
+        with pytest.raises(InvalidHand):
+            store.query(1, positions=[2])
+        with pytest.raises(IndexError):
+            store[0]  # pylint: disable=pointless-statement
+        assert len(store) == 0
@@ -0,0 +1,94 @@
+"""See Description below.
+
+Module Name: test_trace.py
+
+Description:
+This module contains test cases for the opt-in trace mode in card_deck.trace. It verifies that no log records are
+produced while tracing is off, and that structured trace events (event name and fields attached to the log record)
+are emitted by Card and Deck hot paths once tracing is switched on.
+
+Dependencies:
+- pytest
+- card_deck.trace
+- card_deck.Card
+- card_deck.Deck
+"""
+import logging
+from collections.abc import Iterator
+
+import pytest
+
+from card_deck import Card
+from card_deck import Deck
+from card_deck import Rank
+from card_deck import Suite
+from card_deck import trace
+from card_deck.exceptions import InvalidCardSuite
+
+
+@pytest.fixture(name="tracing")  # type: ignore
+def fixture_tracing() -> Iterator[None]:
+    """Enable trace mode for a test and restore the previous state afterwards.
+
+    Yields:
+        None
+    """
+    previous = trace.is_trace_enabled()
+    trace.enable_trace()
+    yield
+    if not previous:
+        trace.disable_trace()
+
+
+def test_trace_disabled_is_silent(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that hot paths do not log while trace mode is off.
+    Args:
+        caplog (pytest.LogCaptureFixture): The pytest log capture fixture.
+
+    Asserts:
+        - No log records are produced by card or deck operations.
+
+    Returns:
+        None
+    """
+    trace.disable_trace()
+    with caplog.at_level(logging.DEBUG, logger="card_deck"):
+        card = Card(Suite.HEARTS, Rank.ACE)
+        card.rank = Rank.TWO
+        repr(card)
+        deck = Deck(seed=3)
+        deck.shuffle()
+        deck.draw(2)
+    assert not caplog.records
+
+
+@pytest.mark.usefixtures("tracing")  # type: ignore
+def test_trace_enabled_emits_structured_events(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that hot paths emit structured trace events while trace mode is on.
+    Args:
+        caplog (pytest.LogCaptureFixture): The pytest log capture fixture.
+
+    Asserts:
+        - Each operation emits its named event with its fields on the record.
+
+    Returns:
+        None
+    """
+    with caplog.at_level(logging.DEBUG, logger="card_deck"):
+        card = Card(Suite.HEARTS, Rank.ACE)
+        card.suite = Suite.CLUBS
+        with pytest.raises(InvalidCardSuite):
+            card.suite = "InvalidSuite"  # type: ignore[assignment, unused-ignore]
+        deck = Deck(seed=3)
+        deck.shuffle()
+        deck.draw(2)
+
+    # The event and fields are passed as logging extras, which LogRecord does not declare.
+    events = [(vars(record)["card_deck_event"], vars(record)["card_deck_fields"]) for record in caplog.records]
+    assert events == [
+        ("card.init", {"suite": Suite.HEARTS, "rank": Rank.ACE, "code": card.to_int() + 2}),
+        ("card.set_suite", {"suite": Suite.CLUBS, "code": card.to_int()}),
+        ("card.invalid_suite", {"suite": "InvalidSuite", "type": "str"}),
+        ("deck.shuffle", {"size": 52}),
+        ("deck.draw", {"count": 2, "remaining": 50}),
+    ]
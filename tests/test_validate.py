@@ -0,0 +1,167 @@
+"""See Description below.
+
+Module Name: test_validate.py
+
+Description:
+This module contains test cases for the bulk validators in card_deck.validate. It checks that every invalid value
+and every excess duplicate is reported by index for each accepted input type, that duplicates are counted per group
+and up to the allowed copies, and that reports raise the repo's exceptions.
+
+Dependencies:
+- pytest
+- card_deck.validate
+"""
+import array
+import random
+
+import pytest
+
+from card_deck import Rank
+from card_deck import Suite
+from card_deck import metrics
+from card_deck.exceptions import CardDeckValueError
+from card_deck.exceptions import InvalidCard
+from card_deck.exceptions import InvalidDeck
+from card_deck.validate import ValidationReport
+from card_deck.validate import validate_codes
+from card_deck.validate import validate_pairs
+
+CODES = [5, 60, 7, 5, -1, 51, "x", 7, 5, 255]
+
+
+@pytest.mark.parametrize("codes", [  # type: ignore
+    CODES,
+    iter(CODES),
+])
+def test_validate_codes(codes: list[object]) -> None:
+    """Test that every invalid value and duplicate of a list of encodings is reported.
+    Args:
+        codes (list[object]): The values to check.
+
+    Asserts:
+        - Values that are not integers in the range 0..51 are invalid.
+        - Every copy after the first is a duplicate.
+
+    Returns:
+        None
+    """
+    assert validate_codes(codes) == ValidationReport(10, invalid=(1, 4, 6, 9), duplicates=(3, 7, 8))
+
+
+@pytest.mark.parametrize("codes", [  # type: ignore
+    bytes([0, 1, 2, 1, 52, 0]),
+    bytearray([0, 1, 2, 1, 52, 0]),
+    memoryview(bytes([0, 1, 2, 1, 52, 0])),
+    array.array("B", [0, 1, 2, 1, 52, 0]),
+    (0, 1, 2, 1, 52, 0),
+])
+def test_validate_code_buffers(codes: object) -> None:
+    """Test the accepted buffer and sequence types.
+    Args:
+        codes (object): The encodings to check.
+
+    Asserts:
+        - Each type gives the same report.
+
+    Returns:
+        None
+    """
+    report = validate_codes(codes)  # type: ignore[arg-type, unused-ignore]
+    assert report == ValidationReport(6, invalid=(4,), duplicates=(3, 5))
+
+
+def test_validate_groups_and_copies() -> None:
+    """Test duplicate limits per group of cards.
+
+    Asserts:
+        - Shuffled decks are valid when checked per deck, and duplicates when checked as one group.
+        - A shoe may hold as many copies of a card as it has decks.
+        - Invalid limits are rejected.
+
+    Returns:
+        None
+    """
+    rng = random.Random(4)
+    decks = bytearray()
+    for _ in range(3):
+        deck = bytearray(range(52))
+        rng.shuffle(deck)
+        decks += deck
+    assert validate_codes(decks, group_size=52).ok
+    assert len(validate_codes(decks).duplicates) == 104
+    assert validate_codes(decks, copies=3).ok
+    decks[60] = decks[61]
+    assert validate_codes(decks, group_size=52).duplicates == (61,)
+    assert validate_codes(b"\x00" * 7, copies=6).duplicates == (6,)
+    assert validate_codes(b"").ok
+    for limits in ({"copies": 0}, {"group_size": 0}):
+        with pytest.raises(CardDeckValueError):
+            validate_codes(b"", **limits)
+
+
+def test_validate_pairs() -> None:
+    """Test validating raw (suite, rank) pairs.
+
+    Asserts:
+        - Enum members and their integer values are accepted.
+        - Invalid suites and ranks, including unhashable ones, are reported separately and as invalid.
+        - Duplicates are found among the valid pairs.
+        - Failures are counted in the validation metrics.
+
+    Returns:
+        None
+    """
+    pairs = [
+        (Suite.SPADES, Rank.ACE),
+        (4, 1),
+        (Suite.HEARTS, 14),
+        ("CLUBS", Rank.TWO),
+        ([], {}),
+        (1, Rank.KING),
+    ]
+    metrics.reset_metrics()
+    metrics.enable_metrics()
+    try:
+        report = validate_pairs(pairs)
+    finally:
+        metrics.disable_metrics()
+    assert report == ValidationReport(
+        6, invalid=(2, 3, 4), invalid_suites=(3, 4), invalid_ranks=(2, 4), duplicates=(1,)
+    )
+    assert metrics.INVALID_SUITES.value == 2 and metrics.INVALID_RANKS.value == 2
+    metrics.reset_metrics()
+
+
+def test_validate_malformed_pairs() -> None:
+    """Test validating rows that are not pairs and pairs of booleans or floats.
+
+    Asserts:
+        - Rows that do not unpack into a suite and a rank are reported as invalid without stopping the scan.
+        - Booleans and floats are rejected as suites and ranks.
+
+    Returns:
+        None
+    """
+    report = validate_pairs([(Suite.CLUBS, Rank.ACE), None, (1, 2, 3), (1,), (Suite.CLUBS, Rank.ACE), (2, 2)])
+    assert report == ValidationReport(6, invalid=(1, 2, 3), duplicates=(4,))
+    report = validate_pairs([(True, 1), (1, True), (False, False), (1, 1)])
+    assert report == ValidationReport(4, invalid=(0, 1, 2), invalid_suites=(0, 2), invalid_ranks=(1, 2))
+    report = validate_pairs([(1.0, 1), (1, 1.0), (1.0, 1.0), (Suite.CLUBS, 1)])
+    assert report == ValidationReport(4, invalid=(0, 1, 2), invalid_suites=(0, 2), invalid_ranks=(1, 2))
+
+
+def test_raise_for_errors() -> None:
+    """Test the exceptions raised by a report.
+
+    Asserts:
+        - A clean report does not raise.
+        - Invalid values raise InvalidCard and duplicates raise InvalidDeck, quoting the first indices.
+
+    Returns:
+        None
+    """
+    validate_codes(range(52)).raise_for_errors()
+    with pytest.raises(InvalidCard, match="1 invalid card"):
+        validate_codes([1, 1, 99]).raise_for_errors()
+    with pytest.raises(InvalidDeck, match=r"20 duplicate card\(s\) at index 1, 2, .*, 10, \.\.\."):
+        validate_codes(bytes(21)).raise_for_errors()